@@ -0,0 +1,74 @@
+"""Synthetic API payloads built from spec/stage-definition.yaml, shared by the benchmarks.
+
+Values are derived from each element's index only (no randomness), so the
+same arguments always produce the same body and results stay comparable
+between runs and commits.
+"""
+import re
+from pathlib import Path
+
+import yaml
+
+SPEC = Path(__file__).resolve().parents[2] / "spec" / "stage-definition.yaml"
+# Elements of collections nested inside the outermost array or map
+NESTED_ITEMS = 3
+
+
+def module_name(method: str, path: str) -> str:
+    """Generated endpoint module name (get /job/{job_id} -> get_job_job_id)."""
+    return f"{method}_{re.sub(r'[^a-z0-9]+', '_', path.lower()).strip('_')}"
+
+
+def response_schemas(spec_path: Path = SPEC):
+    """(endpoint module name, status, schema) for every documented JSON response."""
+    spec = yaml.safe_load(spec_path.read_text())
+    for path, item in spec["paths"].items():
+        for method, operation in item.items():
+            if method == "parameters":
+                continue
+            for status, response in operation.get("responses", {}).items():
+                schema = response.get("content", {}).get("application/json", {}).get("schema")
+                if schema and status.isdigit():
+                    yield module_name(method, path), int(status), schema
+
+
+def response_schema(endpoint: str, status: int = 200) -> dict:
+    """Schema of one documented response, e.g. response_schema("get_jobs")."""
+    for name, code, schema in response_schemas():
+        if name == endpoint and code == status:
+            return schema
+    raise KeyError(f"No JSON response {status} for {endpoint} in {SPEC.name}")
+
+
+def sample(schema: dict, items: int, nested: int = NESTED_ITEMS, i: int = 0):
+    """
+    Synthetic value for schema.
+
+    Arrays and maps (additionalProperties) that are not inside another
+    collection get items elements; collections nested in those get nested.
+    """
+    kind = schema.get("type")
+    if kind == "object":
+        if "properties" in schema:
+            return {key: sample(prop, items, nested, i) for key, prop in schema["properties"].items()}
+        values = schema.get("additionalProperties")
+        if isinstance(values, dict):
+            return {f"key-{n:06d}": sample(values, nested, nested, n) for n in range(items)}
+        return {}
+    if kind == "array":
+        return [sample(schema.get("items") or {}, nested, nested, n) for n in range(items)]
+    if kind == "string":
+        if "enum" in schema:
+            return schema["enum"][i % len(schema["enum"])]
+        if schema.get("format") == "date-time":
+            return f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z"
+        if schema.get("format") == "date":
+            return f"2025-01-{1 + i % 28:02d}"
+        return f"value-{i:08x}"
+    if kind == "integer":
+        return i
+    if kind == "number":
+        return i * 0.5 + 0.25
+    if kind == "boolean":
+        return i % 2 == 0
+    return None
@@ -0,0 +1,96 @@
+"""Benchmark response decoding with models, raw dicts and msgspec structs for every endpoint.
+
+For each documented JSON response in ``spec/stage-definition.yaml`` (the
+same set as ``zpools._structs.RESPONSES``), builds a synthetic body from the
+response schema, with ``--items`` elements in the outermost array or map, and
+decodes it the way ``ZPoolsClient`` does in each decoder mode:
+
+- models: the generated endpoint parser (``json.loads`` plus ``from_dict``)
+- raw: ``ZPoolsClient(raw=True)``, decoded JSON as plain dicts
+- structs: ``ZPoolsClient(structs=True)``, msgspec decoding straight into structs
+
+Reports the best decode time of ``--repeat`` runs and the memory retained by
+the parsed result. Requires PyYAML (to read the spec) and the ``structs``
+extra (msgspec).
+
+Usage (from the python/ directory):
+
+    uv run python benchmarks/bench_decoders.py --items 1000
+"""
+import argparse
+import gc
+import importlib
+import json
+import pkgutil
+import time
+import tracemalloc
+
+import httpx
+
+from _payloads import response_schemas, sample
+from zpools._structs import RESPONSES
+from zpools.raw import build_response
+
+DECODERS = ("models", "raw", "structs")
+
+
+def _endpoint_modules() -> dict:
+    """Generated endpoint modules by name (e.g. "get_jobs")."""
+    import zpools._generated.api as api
+
+    modules = {}
+    for package in pkgutil.iter_modules(api.__path__):
+        tag = importlib.import_module(f"{api.__name__}.{package.name}")
+        for module in pkgutil.iter_modules(tag.__path__):
+            modules[module.name] = importlib.import_module(f"{tag.__name__}.{module.name}")
+    return modules
+
+
+def _decode(endpoint, decoder: str, http_response: httpx.Response):
+    return build_response(endpoint, None, http_response, decoder).parsed
+
+
+def _best_time(endpoint, decoder: str, http_response: httpx.Response, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _decode(endpoint, decoder, http_response)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _retained(endpoint, decoder: str, http_response: httpx.Response) -> int:
+    gc.collect()
+    tracemalloc.start()
+    parsed = _decode(endpoint, decoder, http_response)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="Elements in the outermost array or map")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing runs (best is reported)")
+    args = parser.parse_args()
+
+    modules = _endpoint_modules()
+    print(f"{'endpoint':<28} {'status':>6} {'body KiB':>9}  " + "  ".join(f"{d + ' ms':>11}" for d in DECODERS)
+          + "  " + "  ".join(f"{d + ' KiB':>12}" for d in DECODERS))
+    for name, status, schema in response_schemas():
+        body = json.dumps(sample(schema, args.items)).encode()
+        endpoint = modules[name]
+        assert status in RESPONSES[name]
+        http_response = httpx.Response(status, content=body, headers={"Content-Type": "application/json"})
+        times = [_best_time(endpoint, decoder, http_response, args.repeat) for decoder in DECODERS]
+        retained = [_retained(endpoint, decoder, http_response) for decoder in DECODERS]
+        print(
+            f"{name:<28} {status:>6} {len(body) / 1024:>9.1f}  "
+            + "  ".join(f"{seconds * 1000:>11.3f}" for seconds in times)
+            + "  " + "  ".join(f"{size / 1024:>12.1f}" for size in retained)
+        )
+
+
+if __name__ == "__main__":
+    main()
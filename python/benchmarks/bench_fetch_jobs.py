@@ -0,0 +1,132 @@
+"""Benchmark a full job-history walk: iter_jobs page by page vs fetch_jobs in windows.
+
+Starts a local stand-in for the zpools.io API that holds ``--jobs`` synthetic
+jobs spread over ``--days`` days and answers ``GET /v1/jobs`` with the
+before/after/sort/limit filters after a simulated latency. Then fetches the
+whole history with ``iter_jobs`` (one page after another) and with
+``fetch_jobs`` at several partition counts, checks that every run returns
+every job exactly once in order, and reports the time and request count.
+
+Usage (from the python/ directory):
+
+    uv run python benchmarks/bench_fetch_jobs.py --jobs 20000 --latency 0.05
+"""
+import argparse
+import bisect
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from zpools import RetryPolicy, ZPoolsClient
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded stand-in API serving a sorted job history."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, jobs: int, days: int, latency: float):
+        rng = random.Random(0)
+        times = sorted(BASE + timedelta(seconds=round(rng.uniform(0, days * 86400), 3)) for _ in range(jobs))
+        self.times = times
+        self.jobs = [
+            json.dumps({
+                "job_id": f"job-{i:08d}",
+                "job_type": "zpool_scrub",
+                "status": "completed",
+                "created_at": created.isoformat().replace("+00:00", "Z"),
+                "current_status": {"state": "succeeded", "message": "Scrub finished without errors"},
+            })
+            for i, created in enumerate(times)
+        ]
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+    def select(self, query: dict) -> list:
+        """Encoded jobs matching the query (inclusive bounds), in the requested order."""
+        low = bisect.bisect_left(self.times, _parse(query["after"])) if "after" in query else 0
+        high = bisect.bisect_right(self.times, _parse(query["before"])) if "before" in query else len(self.times)
+        limit = int(query.get("limit", 100))
+        if query.get("sort", "desc") == "asc":
+            return self.jobs[low:min(high, low + limit)]
+        return self.jobs[max(low, high - limit):high][::-1]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        with self.server._lock:
+            self.server.requests += 1
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        time.sleep(self.server.latency)
+        body = b'{"message": "ok", "detail": {"jobs": [' + ", ".join(self.server.select(query)).encode() + b"]}}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def bench(server: _Server, api_url: str, name: str, walk) -> dict:
+    with ZPoolsClient(api_url=api_url, pat="bench", retry_policy=RetryPolicy(max_retries=0)) as client:
+        server.requests = 0
+        start = time.perf_counter()
+        job_ids = [job.job_id for job in walk(client)]
+        elapsed = time.perf_counter() - start
+    # Newest first, every job once
+    assert job_ids == [f"job-{i:08d}" for i in range(len(server.jobs) - 1, -1, -1)], f"{name}: wrong jobs"
+    return {"walk": name, "seconds": elapsed, "requests": server.requests, "jobs": len(job_ids)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20000, help="Jobs in the history")
+    parser.add_argument("--days", type=int, default=365, help="Days the history spans")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated latency of a request in seconds")
+    parser.add_argument("--partitions", type=int, nargs="+", default=[2, 4, 8], help="fetch_jobs partition counts")
+    args = parser.parse_args()
+
+    server = _Server(args.jobs, args.days, args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    walks = [("iter_jobs", lambda client: client.iter_jobs())]
+    walks += [
+        (f"fetch_jobs/{count}", lambda client, count=count: client.fetch_jobs(partitions=count))
+        for count in args.partitions
+    ]
+
+    print(f"{args.jobs} jobs over {args.days} days, latency {args.latency * 1000:.0f} ms")
+    print(f"{'walk':<14} {'seconds':>8} {'requests':>9} {'jobs/s':>8}")
+    try:
+        for name, walk in walks:
+            result = bench(server, api_url, name, walk)
+            print(
+                f"{result['walk']:<14} {result['seconds']:>8.3f} {result['requests']:>9} "
+                f"{result['jobs'] / result['seconds']:>8.0f}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Benchmark HTTP/1.1 pooling vs HTTP/2 multiplexing for concurrent job polling.
+
+Starts a local stand-in for the zpools.io API that answers
+``GET /v1/job/<id>`` and ``GET /v1/job/<id>/history`` after a simulated
+latency, then fans out get_job/get_job_history calls for many jobs through
+``ZPoolsClient`` (threads) or ``AsyncZPoolsClient`` (asyncio tasks), once
+over HTTP/1.1 and once with ``http2=True``. Reports wall time, throughput and
+how many TCP connections the server accepted.
+
+Usage (from the python/ directory, with the http2 extra installed):
+
+    uv run python benchmarks/bench_http2.py --jobs 200 --concurrency 32 --latency 0.02
+    uv run python benchmarks/bench_http2.py --mode asyncio
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+
+from zpools import AsyncZPoolsClient, RetryPolicy, ZPoolsClient
+
+
+def _job_body(path: str) -> bytes:
+    """Response body for a stand-in job endpoint."""
+    parts = path.strip("/").split("/")
+    if len(parts) < 3 or parts[1] != "job":
+        return json.dumps({"message": "not found"}).encode()
+    job_id = parts[2]
+    if len(parts) == 4 and parts[3] == "history":
+        events = [
+            {"status": status, "message": f"{job_id} {status}", "timestamp": "2025-01-01T00:00:00Z"}
+            for status in ("pending", "running", "succeeded")
+        ]
+        return json.dumps({"message": "ok", "detail": {"events": events}}).encode()
+    job = {"job_id": job_id, "status": "running", "progress": "50%"}
+    return json.dumps({"message": "ok", "detail": job}).encode()
+
+
+class _Http1Server(ThreadingHTTPServer):
+    """Threaded keep-alive HTTP/1.1 server that counts accepted connections."""
+
+    daemon_threads = True
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = 0
+        self._count_lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), _Http1Handler)
+
+    def process_request(self, request, client_address):
+        with self._count_lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _Http1Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment so delayed ACKs don't skew keep-alive timings
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        body = _job_body(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _H2Protocol(asyncio.Protocol):
+    """Minimal h2c (HTTP/2 prior knowledge) server connection."""
+
+    def __init__(self, server):
+        self._server = server
+        self._conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        self._transport = None
+
+    def connection_made(self, transport):
+        self._server.connections += 1
+        self._transport = transport
+        self._conn.initiate_connection()
+        transport.write(self._conn.data_to_send())
+
+    def data_received(self, data):
+        loop = asyncio.get_running_loop()
+        for event in self._conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                path = dict(event.headers)[b":path"].decode()
+                loop.call_later(self._server.latency, self._respond, event.stream_id, path)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self._transport.close()
+                return
+        self._transport.write(self._conn.data_to_send())
+
+    def _respond(self, stream_id: int, path: str):
+        if self._transport.is_closing():
+            return
+        body = _job_body(path)
+        self._conn.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(body))),
+        ])
+        self._conn.send_data(stream_id, body, end_stream=True)
+        self._transport.write(self._conn.data_to_send())
+
+
+class _Http2Server:
+    """h2c server running on its own event loop thread."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            self._loop.create_server(lambda: _H2Protocol(self), "127.0.0.1", 0)
+        )
+        self.server_address = self._server.sockets[0].getsockname()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def serve_in_background(self):
+        self._thread.start()
+
+    def shutdown(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def _start_server(http2: bool, latency: float):
+    if http2:
+        server = _Http2Server(latency)
+        server.serve_in_background()
+    else:
+        server = _Http1Server(latency)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _poll_job(client, job_id: str) -> None:
+    assert client.get_job(job_id).status_code == 200
+    assert client.get_job_history(job_id).status_code == 200
+
+
+async def _async_poll_job(client, job_id: str) -> None:
+    assert (await client.get_job(job_id)).status_code == 200
+    assert (await client.get_job_history(job_id)).status_code == 200
+
+
+def _run_threads(api_url: str, http2: bool, job_ids, concurrency: int, max_connections: int) -> None:
+    with ZPoolsClient(
+        api_url=api_url,
+        pat="bench",
+        http2=http2,
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        retry_policy=RetryPolicy(max_retries=0),
+    ) as client:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda job_id: _poll_job(client, job_id), job_ids))
+
+
+def _run_asyncio(api_url: str, http2: bool, job_ids, concurrency: int, max_connections: int) -> None:
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(job_id):
+            async with semaphore:
+                await _async_poll_job(client, job_id)
+
+        async with AsyncZPoolsClient(
+            api_url=api_url,
+            pat="bench",
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            retry_policy=RetryPolicy(max_retries=0),
+        ) as client:
+            await asyncio.gather(*(bounded(job_id) for job_id in job_ids))
+
+    asyncio.run(main())
+
+
+def bench(http2: bool, args) -> dict:
+    server = _start_server(http2, args.latency)
+    host, port = server.server_address[:2]
+    api_url = f"http://{host}:{port}/v1"
+    job_ids = [f"job-{i:05d}" for i in range(args.jobs)]
+    run = _run_asyncio if args.mode == "asyncio" else _run_threads
+    try:
+        start = time.perf_counter()
+        run(api_url, http2, job_ids, args.concurrency, args.max_connections)
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+    requests = 2 * args.jobs
+    return {
+        "protocol": "HTTP/2" if http2 else "HTTP/1.1",
+        "seconds": elapsed,
+        "requests_per_second": requests / elapsed,
+        "connections": server.connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs to poll (2 requests each)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent workers/tasks")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated server latency in seconds")
+    parser.add_argument("--max-connections", type=int, default=10, help="ZPoolsClient max_connections")
+    parser.add_argument("--mode", choices=("threads", "asyncio"), default="threads")
+    args = parser.parse_args()
+
+    print(
+        f"{args.jobs} jobs x 2 requests, concurrency {args.concurrency}, "
+        f"latency {args.latency * 1000:.0f} ms, max_connections {args.max_connections}, mode {args.mode}"
+    )
+    print(f"{'protocol':<10} {'seconds':>8} {'req/s':>9} {'connections':>12}")
+    for http2 in (False, True):
+        result = bench(http2, args)
+        print(
+            f"{result['protocol']:<10} {result['seconds']:>8.3f} "
+            f"{result['requests_per_second']:>9.0f} {result['connections']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark decode time and memory of a large billing ledger response.
+
+Builds a synthetic ``GET /v1/billing/ledger`` body with ``--items`` entries
+and measures, for the generated attrs models and for raw dicts
+(``ZPoolsClient(raw=True)``):
+
+- decode time: JSON decode plus model construction (best of ``--repeat``)
+- retained memory: bytes still allocated while the parsed result is alive
+- peak memory: highest allocation during decoding
+
+Usage (from the python/ directory):
+
+    uv run python benchmarks/bench_ledger_models.py --items 5000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from zpools._generated.models import GetBillingLedgerResponse200
+from zpools.raw import loads
+
+
+def _ledger_body(items: int) -> bytes:
+    """Synthetic ledger response body with hourly EBS debits."""
+    entries = [
+        {
+            "amount_usd": 0.0123 + i * 1e-6,
+            "event_ts": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+            "event_type": "debit",
+            "markup_bps": 1500.0,
+            "markup_usd": 0.0016,
+            "note": f"zpool zp-{i % 7:04d} volume vol-{i:08x}",
+            "posted_ts": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:05:00Z",
+            "source": "hourly_ebs",
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"message": "ok", "detail": {"items": entries}}).encode()
+
+
+def _decode_models(body: bytes):
+    return GetBillingLedgerResponse200.from_dict(json.loads(body))
+
+
+def _decode_raw(body: bytes):
+    return loads(body)
+
+
+def _best_time(decode, body: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(body)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _memory(decode, body: bytes):
+    """Retained and peak bytes allocated by decode(body)."""
+    gc.collect()
+    tracemalloc.start()
+    result = decode(body)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000, help="Ledger entries in the response")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing runs (best is reported)")
+    args = parser.parse_args()
+
+    body = _ledger_body(args.items)
+    print(f"{args.items} ledger items, {len(body) / 1024:.0f} KiB body, best of {args.repeat}")
+    print(f"{'decoder':<8} {'ms':>8} {'retained KiB':>13} {'peak KiB':>9} {'B/item':>7}")
+    for name, decode in (("models", _decode_models), ("raw", _decode_raw)):
+        seconds = _best_time(decode, body, args.repeat)
+        retained, peak = _memory(decode, body)
+        print(
+            f"{name:<8} {seconds * 1000:>8.2f} {retained / 1024:>13.0f} "
+            f"{peak / 1024:>9.0f} {retained / args.items:>7.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
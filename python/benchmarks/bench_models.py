@@ -0,0 +1,155 @@
+"""Benchmark from_dict, to_dict and JSON serialization of the generated models.
+
+Builds deterministic synthetic responses from ``spec/stage-definition.yaml``
+for the large model families and measures, per family:
+
+- from_dict: ``Model.from_dict()`` on the decoded JSON body
+- to_dict: ``model.to_dict()``
+- json.dumps: ``json.dumps(model.to_dict(), default=str)`` of that dict (the CLI's ``--json`` path)
+
+Each operation reports the best time of ``--repeat`` runs (with the garbage
+collector paused), throughput in items per second and peak traced memory.
+Everything runs offline. Use ``--save`` to write the results as JSON and
+``--compare`` to print the change against a saved run, e.g. between commits:
+
+    uv run python benchmarks/bench_models.py --save before.json
+    git checkout my-branch
+    uv run python benchmarks/bench_models.py --compare before.json
+
+``--scale 0.1`` shrinks every payload for a quick run.
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+
+from _payloads import response_schema, sample
+from zpools._generated import models
+
+# (family, endpoint module, response model, items in the outermost collections, nested items)
+FAMILIES = (
+    ("jobs", "get_jobs", "GetJobsResponse200", 10000, 3),
+    ("ledger", "get_billing_ledger", "GetBillingLedgerResponse200", 5000, 3),
+    ("zpools", "get_zpools", "GetZpoolsResponse200", 500, 4),
+    ("billing_summary", "get_billing_summary", "GetBillingSummaryResponse200", 2000, 3),
+    ("job_history", "get_job_job_id_history", "GetJobJobIdHistoryResponse200", 2000, 3),
+)
+
+
+def _operations(model, data):
+    """Zero-argument callables for each operation; to_dict and dumps work on one parsed instance."""
+    parsed = model.from_dict(data)
+    as_dict = parsed.to_dict()
+    return {
+        "from_dict": lambda: model.from_dict(data),
+        "to_dict": parsed.to_dict,
+        "json.dumps": lambda: json.dumps(as_dict, default=str),
+    }
+
+
+def _best_time(fn, repeat: int) -> float:
+    fn()  # warm up
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def _peak_memory(fn) -> int:
+    """Highest traced allocation while fn runs, above what was allocated before."""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak - baseline
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(scale: float, repeat: int) -> dict:
+    results = []
+    for family, endpoint, model_name, items, nested in FAMILIES:
+        count = max(1, int(items * scale))
+        body = json.dumps(sample(response_schema(endpoint), count, nested)).encode()
+        data = json.loads(body)
+        model = getattr(models, model_name)
+        for operation, fn in _operations(model, data).items():
+            seconds = _best_time(fn, repeat)
+            results.append({
+                "family": family,
+                "operation": operation,
+                "items": count,
+                "body_bytes": len(body),
+                "seconds": seconds,
+                "items_per_second": count / seconds,
+                "peak_bytes": _peak_memory(fn),
+            })
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _print(run_data: dict, baseline: dict = None) -> None:
+    before = {}
+    if baseline is not None:
+        before = {(r["family"], r["operation"]): r for r in baseline["results"]}
+        print(f"compared with {baseline['commit']} (python {baseline['python']}, scale {baseline['scale']})")
+    header = f"{'family':<16} {'operation':<11} {'items':>6} {'ms':>9} {'k items/s':>10} {'peak KiB':>9}"
+    print(header + ("  time vs base  peak vs base" if baseline is not None else ""))
+    for r in run_data["results"]:
+        line = (
+            f"{r['family']:<16} {r['operation']:<11} {r['items']:>6} {r['seconds'] * 1000:>9.2f} "
+            f"{r['items_per_second'] / 1000:>10.1f} {r['peak_bytes'] / 1024:>9.0f}"
+        )
+        base = before.get((r["family"], r["operation"]))
+        if base is not None:
+            line += f"  {(r['seconds'] / base['seconds'] - 1) * 100:>+12.1f}%"
+            line += f" {(r['peak_bytes'] / max(base['peak_bytes'], 1) - 1) * 100:>+12.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every payload size (e.g. 0.1 for a quick run)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per operation (best is reported)")
+    parser.add_argument("--save", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Show the change against results saved with --save")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    run_data = run(args.scale, args.repeat)
+    _print(run_data, baseline)
+    if args.save:
+        args.save.write_text(json.dumps(run_data, indent=2))
+        print(f"saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
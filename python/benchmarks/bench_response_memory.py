@@ -0,0 +1,134 @@
+"""Benchmark memory retained by large responses with and without their body bytes.
+
+Starts a local stand-in for the zpools.io API that serves a synthetic
+``GET /v1/jobs`` body with ``--jobs`` entries and a ``GET /v1/billing/ledger``
+body with ``--items`` entries, then fetches each through ``ZPoolsClient``
+with ``keep_content=True`` (the default) and ``keep_content=False``, in model
+and raw mode. Reports the memory still allocated while the returned Response
+is alive, and how much of it is ``Response.content``.
+
+Usage (from the python/ directory):
+
+    uv run python benchmarks/bench_response_memory.py --jobs 1000 --items 5000
+"""
+import argparse
+import gc
+import json
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from zpools import RetryPolicy, ZPoolsClient
+
+
+def _jobs_body(jobs: int) -> bytes:
+    """Synthetic list_jobs response body."""
+    items = [
+        {
+            "job_id": f"job-{i:012x}",
+            "operation": "zpool_scrub",
+            "job_type": "zpool_scrub",
+            "status": "completed",
+            "zpool_id": f"zp-{i % 7:04d}",
+            "created_at": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+            "updated_at": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:10:00Z",
+            "current_status": {"state": "succeeded", "message": "Scrub finished without errors"},
+            "parameters": json.dumps({"zpool_id": f"zp-{i % 7:04d}"}),
+        }
+        for i in range(jobs)
+    ]
+    return json.dumps({"message": "ok", "detail": {"jobs": items}}).encode()
+
+
+def _ledger_body(items: int) -> bytes:
+    """Synthetic ledger response body with hourly EBS debits."""
+    entries = [
+        {
+            "amount_usd": 0.0123 + i * 1e-6,
+            "event_ts": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+            "event_type": "debit",
+            "markup_bps": 1500.0,
+            "markup_usd": 0.0016,
+            "note": f"zpool zp-{i % 7:04d} volume vol-{i:08x}",
+            "posted_ts": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:05:00Z",
+            "source": "hourly_ebs",
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"message": "ok", "detail": {"items": entries}}).encode()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, bodies: dict):
+        self.bodies = bodies
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.server.bodies.get(self.path.split("?")[0], b"{}")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _retained(fetch):
+    """Bytes still allocated while the Response returned by fetch() is alive, and its content size."""
+    fetch()  # warm up the connection and lazy imports
+    gc.collect()
+    tracemalloc.start()
+    response = fetch()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert response.status_code == 200
+    return retained, len(response.content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000, help="Jobs in the list_jobs response")
+    parser.add_argument("--items", type=int, default=5000, help="Entries in the ledger response")
+    args = parser.parse_args()
+
+    bodies = {"/v1/jobs": _jobs_body(args.jobs), "/v1/billing/ledger": _ledger_body(args.items)}
+    server = _Server(bodies)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+    operations = (
+        (f"list_jobs ({args.jobs})", bodies["/v1/jobs"], lambda client: client.list_jobs(limit=args.jobs)),
+        (f"ledger ({args.items})", bodies["/v1/billing/ledger"], lambda client: client.get_billing_ledger(limit=args.items)),
+    )
+    print(f"{'response':<18} {'body KiB':>9} {'mode':<7} {'keep_content':<13} {'retained KiB':>13} {'content KiB':>12}")
+    try:
+        for name, body, call in operations:
+            for raw in (False, True):
+                for keep_content in (True, False):
+                    with ZPoolsClient(
+                        api_url=api_url,
+                        pat="bench",
+                        raw=raw,
+                        keep_content=keep_content,
+                        retry_policy=RetryPolicy(max_retries=0),
+                    ) as client:
+                        retained, content = _retained(lambda: call(client))
+                    print(
+                        f"{name:<18} {len(body) / 1024:>9.0f} {'raw' if raw else 'models':<7} "
+                        f"{str(keep_content):<13} {retained / 1024:>13.0f} {content / 1024:>12.0f}"
+                    )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
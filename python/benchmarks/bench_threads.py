@@ -0,0 +1,184 @@
+"""Benchmark one ZPoolsClient shared by a thread pool against one client per thread.
+
+Starts a local stand-in for the zpools.io API that answers ``POST /v1/login``
+(with a simulated latency) and ``GET /v1/job/<id>``, and counts logins. Then
+polls get_job for many jobs from a ThreadPoolExecutor, either sharing one
+JWT-authenticated ZPoolsClient between all workers or building one client
+(and one login) per worker thread.
+
+``--rotate-every N`` makes the server revoke every issued token after each N
+job requests, so the shared client has to re-authenticate on 401 while other
+threads are mid-request; the login count shows whether they share one login
+per rotation. Every request must end with a 200: the script fails otherwise.
+
+Usage (from the python/ directory):
+
+    uv run python benchmarks/bench_threads.py --jobs 2000 --workers 32 --rotate-every 500
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from zpools import RetryPolicy, ZPoolsClient
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded stand-in API that issues bearer tokens and counts logins."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, login_latency: float, latency: float, rotate_every: int):
+        self.login_latency = login_latency
+        self.latency = latency
+        self.rotate_every = rotate_every
+        self.logins = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._tokens = set()
+        self._token_ids = itertools.count()
+        self._requests = 0
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+    def issue_token(self) -> str:
+        with self._lock:
+            self.logins += 1
+            token = f"token-{next(self._token_ids)}"
+            self._tokens.add(token)
+            return token
+
+    def accepts(self, token: str) -> bool:
+        with self._lock:
+            self._requests += 1
+            if self.rotate_every and self._requests % self.rotate_every == 0:
+                self._tokens.clear()
+            if token in self._tokens:
+                return True
+            self.rejected += 1
+            return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.server.login_latency)
+        token = self.server.issue_token()
+        self._send(200, {"message": "ok", "detail": {"access_token": token, "id_token": token, "expires_in": 3600}})
+
+    def do_GET(self):
+        token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not self.server.accepts(token):
+            self._send(401, {"message": "Unauthorized"})
+            return
+        time.sleep(self.server.latency)
+        job_id = self.path.rstrip("/").rsplit("/", 1)[-1]
+        self._send(200, {"message": "ok", "detail": {"job_id": job_id, "status": "running"}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _client(api_url: str, max_connections: int) -> ZPoolsClient:
+    return ZPoolsClient(
+        api_url=api_url,
+        username="bench",
+        password="bench",
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        retry_policy=RetryPolicy(max_retries=0),
+        coalesce_requests=False,
+    )
+
+
+def _run_shared(api_url: str, job_ids, args) -> None:
+    with _client(api_url, args.max_connections) as client:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            statuses = list(pool.map(lambda job_id: client.get_job(job_id).status_code, job_ids))
+    assert statuses == [200] * len(job_ids), f"{len(job_ids) - statuses.count(200)} requests failed"
+
+
+def _run_per_thread(api_url: str, job_ids, args) -> None:
+    local = threading.local()
+    clients = []
+    clients_lock = threading.Lock()
+
+    def get_job(job_id):
+        client = getattr(local, "client", None)
+        if client is None:
+            # Each worker's pool is sized as its share of the shared client's pool
+            client = local.client = _client(api_url, max(1, args.max_connections // args.workers))
+            with clients_lock:
+                clients.append(client)
+        return client.get_job(job_id).status_code
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            statuses = list(pool.map(get_job, job_ids))
+    finally:
+        for client in clients:
+            client.close()
+    assert statuses == [200] * len(job_ids), f"{len(job_ids) - statuses.count(200)} requests failed"
+
+
+def bench(name: str, run, args) -> dict:
+    server = _Server(args.login_latency, args.latency, args.rotate_every)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    job_ids = [f"job-{i:05d}" for i in range(args.jobs)]
+    try:
+        start = time.perf_counter()
+        run(f"http://{host}:{port}/v1", job_ids, args)
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {
+        "clients": name,
+        "seconds": elapsed,
+        "requests_per_second": args.jobs / elapsed,
+        "logins": server.logins,
+        "rejected": server.rejected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000, help="get_job calls")
+    parser.add_argument("--workers", type=int, default=32, help="ThreadPoolExecutor workers")
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated latency of a job request in seconds")
+    parser.add_argument("--login-latency", type=float, default=0.2, help="Simulated latency of a login in seconds")
+    parser.add_argument("--max-connections", type=int, default=32, help="Connection pool size of the shared client")
+    parser.add_argument("--rotate-every", type=int, default=0, help="Revoke all tokens after every N job requests (0 = never)")
+    args = parser.parse_args()
+
+    print(
+        f"{args.jobs} get_job calls, {args.workers} workers, latency {args.latency * 1000:.0f} ms, "
+        f"login {args.login_latency * 1000:.0f} ms, rotate every {args.rotate_every or '-'}"
+    )
+    print(f"{'clients':<12} {'seconds':>8} {'req/s':>8} {'logins':>7} {'401s':>6}")
+    for name, run in (("shared", _run_shared), ("per-thread", _run_per_thread)):
+        result = bench(name, run, args)
+        print(
+            f"{result['clients']:<12} {result['seconds']:>8.3f} {result['requests_per_second']:>8.0f} "
+            f"{result['logins']:>7} {result['rejected']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,19 @@ import typer
 import json
 from rich.console import Console
 from rich.table import Table
-from zpools_cli.utils import format_error_response, format_usd, format_timestamp
-from zpools._generated.api.billing import (
-    get_billing_balance,
-    get_billing_ledger,
-    get_billing_summary,
-    post_codes_claim,
-    post_dodo_start
-)
-from zpools._generated.models.post_codes_claim_body import PostCodesClaimBody
-from zpools._generated.models.post_dodo_start_body import PostDodoStartBody
+from typing import Optional
+from zpools_cli.utils import format_error_response, format_usd, format_timestamp, get_cache_max_age, get_ledger_store
+from zpools._generated.errors import UnexpectedStatus
 from zpools._generated.types import UNSET
 import datetime
 
 app = typer.Typer(help="Manage billing and payments", no_args_is_help=True)
 console = Console()
 
+# Seconds the local ledger store is used before it is synced again, when
+# neither --max-age nor ZPOOL_CACHE_MAX_AGE is given (charges post hourly)
+LEDGER_MAX_AGE = 3600.0
+
 @app.command("balance")
 def get_balance(
     ctx: typer.Context,
@@ -25,6 +22,7 @@ def get_balance(
 ):
     """Get current account balance."""
     try:
+        from zpools._generated.api.billing import get_billing_balance
         from zpools_cli.utils import get_authenticated_client
         client = get_authenticated_client(ctx.obj)
         auth_client = client.get_authenticated_client()
@@ -58,17 +56,24 @@ def get_balance(
 @app.command("ledger")
 def get_ledger(
     ctx: typer.Context,
-    limit: int = typer.Option(None, help="Number of entries to display"),
+    limit: int = typer.Option(None, help="Number of entries to display (default 500)"),
     since: str = typer.Option(None, help="Start event date (YYYY-MM-DD) - filters by when event occurred"),
     until: str = typer.Option(None, help="End event date (YYYY-MM-DD) - filters by when event occurred"),
+    refresh: bool = typer.Option(False, "--refresh", help="Fetch new entries from the API before listing"),
+    max_age: Optional[float] = typer.Option(None, "--max-age", help="Fetch new entries if the local ledger was synced more than this many seconds ago (default: ZPOOL_CACHE_MAX_AGE, else 3600)"),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON"),
     use_local_tz: bool = typer.Option(False, "--local", help="Show timestamps in local timezone (default: UTC)")
 ):
-    """View billing transaction history. Shows event_ts (when event occurred) and posted_ts (when recorded)."""
+    """
+    View billing transaction history. Shows event_ts (when event occurred) and posted_ts (when recorded).
+
+    Entries are listed from the local ledger store, which is fetched in full the
+    first time and then updated when it is older than the max age, or with
+    --refresh. Without a cache directory, they are listed from the API.
+    """
     try:
+        from zpools._generated.api.billing import get_billing_ledger
         from zpools_cli.utils import get_authenticated_client
-        client = get_authenticated_client(ctx.obj)
-        auth_client = client.get_authenticated_client()
         
         # Parse dates if provided
         since_date = None
@@ -87,6 +92,18 @@ def get_ledger(
                 console.print("[red]Invalid date format for --until. Use YYYY-MM-DD[/red]")
                 return
 
+        ledger_store = get_ledger_store(ctx.obj)
+        if ledger_store is not None:
+            with ledger_store:
+                _list_stored_ledger(
+                    ctx.obj, ledger_store, since_date, until_date, limit or 500, refresh, max_age, json_output,
+                    use_local_tz
+                )
+            return
+
+        client = get_authenticated_client(ctx.obj)
+        auth_client = client.get_authenticated_client()
+
         # Build kwargs for API call (API returns newest-first)
         kwargs = {}
         if limit:
@@ -96,65 +113,119 @@ def get_ledger(
         if until_date:
             kwargs["until"] = until_date
 
-        response = get_billing_ledger.sync_detailed(client=auth_client, **kwargs)
-        
-        if response.status_code == 200:
-            if json_output:
+        if json_output:
+            response = get_billing_ledger.sync_detailed(client=auth_client, **kwargs)
+            if response.status_code == 200:
                 print(json.dumps(response.parsed.to_dict(), indent=2, default=str))
-                return
-            
-            items = response.parsed.detail.items
-            if not items or items is UNSET:
-                console.print("No transactions found.")
-                return
+            else:
+                print(format_error_response(response.status_code, response.content, json_output))
+            return
+
+        table = _ledger_table()
+        # Stream entries so large ledgers are not buffered and parsed all at once.
+        # API returns newest-first, display as-is
+        try:
+            for item in client.iter_billing_ledger(**kwargs):
+                _add_ledger_row(table, item.to_dict(), use_local_tz)
+        except UnexpectedStatus as e:
+            error_msg = format_error_response(e.status_code, e.content, json_output)
+            console.print(f"[red]Error {e.status_code}:[/red] {error_msg}")
+            return
+
+        if not table.row_count:
+            console.print("No transactions found.")
+            return
+        console.print(table)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]An error occurred:[/red] {e}")
 
-            table = Table(title="Billing Ledger")
-            table.add_column("Event", style="green")
-            table.add_column("Posted", style="blue")
-            table.add_column("Event Type", style="yellow")
-            table.add_column("Source", style="cyan")
-            table.add_column("Amount (USD)", style="magenta")
-            table.add_column("Note", style="white")
-
-            # API returns newest-first, display as-is
-            for item in items:
-                # Extract fields with UNSET checks
-                event_ts = item.event_ts if item.event_ts is not UNSET else ""
-                posted_ts = item.posted_ts if item.posted_ts is not UNSET else ""
-                event_type = item.event_type if item.event_type is not UNSET else ""
-                source = item.source if item.source is not UNSET else ""
-                amount_usd = item.amount_usd if item.amount_usd is not UNSET else 0
-                note = item.note if item.note is not UNSET else ""
-                
-                # Format timestamps with timezone preference
-                event_ts_fmt = format_timestamp(event_ts, use_local_tz)
-                posted_ts_fmt = format_timestamp(posted_ts, use_local_tz)
-                
-                # Format amount with color
-                amount_str = f"${format_usd(amount_usd)}"
-                if amount_usd > 0:
-                    amount_str = f"[green]+{amount_str}[/green]"
-                elif amount_usd < 0:
-                    amount_str = f"[red]{amount_str}[/red]"
-                
-                table.add_row(
-                    event_ts_fmt,
-                    posted_ts_fmt,
-                    event_type,
-                    source,
-                    amount_str,
-                    note
-                )
-            console.print(table)
-        else:
-            error_msg = format_error_response(response.status_code, response.content, json_output)
+
+def _ledger_needs_sync(config, ledger_store, refresh, max_age):
+    """
+    Whether the local ledger store must be synced before it is used.
+
+    It is if refresh was given, it was never synced, or it was synced more than
+    max_age seconds ago (None = ZPOOL_CACHE_MAX_AGE, else LEDGER_MAX_AGE).
+    """
+    import time
+
+    if max_age is None and not config.get("cache_max_age"):
+        max_age = LEDGER_MAX_AGE
+    max_age = get_cache_max_age(config, max_age)
+    synced_at = ledger_store.synced_at
+    return refresh or synced_at is None or time.time() - synced_at >= max_age
+
+
+def _list_stored_ledger(config, ledger_store, since, until, limit, refresh, max_age, json_output, use_local_tz):
+    """
+    List ledger entries from the local ledger store, newest first.
+
+    The store is synced first if --refresh was given, it was never synced or it
+    is older than max_age (see _ledger_needs_sync).
+    """
+    from zpools_cli.utils import get_authenticated_client
+
+    if _ledger_needs_sync(config, ledger_store, refresh, max_age):
+        try:
+            ledger_store.sync(get_authenticated_client(config))
+        except UnexpectedStatus as e:
+            error_msg = format_error_response(e.status_code, e.content, json_output)
             if json_output:
                 print(error_msg)
             else:
-                console.print(f"[red]Error {response.status_code}:[/red] {error_msg}")
-
-    except Exception as e:
-        console.print(f"[red]An error occurred:[/red] {e}")
+                console.print(f"[red]Error {e.status_code}:[/red] {error_msg}")
+            return
+    entries = ledger_store.entries(since=since, until=until, limit=limit)
+
+    if json_output:
+        print(json.dumps({"detail": {"items": entries}}, indent=2, default=str))
+        return
+
+    if not entries:
+        console.print("No transactions found.")
+    else:
+        table = _ledger_table()
+        for entry in entries:
+            _add_ledger_row(table, entry, use_local_tz)
+        console.print(table)
+    synced_at = datetime.datetime.fromtimestamp(ledger_store.synced_at, datetime.timezone.utc)
+    console.print(f"[dim]Ledger as of {format_timestamp(synced_at, use_local_tz)} (--refresh to update)[/dim]")
+
+
+def _ledger_table():
+    """An empty ledger table with its columns."""
+    table = Table(title="Billing Ledger")
+    table.add_column("Event", style="green")
+    table.add_column("Posted", style="blue")
+    table.add_column("Event Type", style="yellow")
+    table.add_column("Source", style="cyan")
+    table.add_column("Amount (USD)", style="magenta")
+    table.add_column("Note", style="white")
+    return table
+
+
+def _add_ledger_row(table, entry, use_local_tz):
+    """Add a ledger entry (dict with the API item fields) to a ledger table."""
+    amount_usd = entry.get("amount_usd", 0)
+
+    # Format amount with color
+    amount_str = f"${format_usd(amount_usd)}"
+    if amount_usd > 0:
+        amount_str = f"[green]+{amount_str}[/green]"
+    elif amount_usd < 0:
+        amount_str = f"[red]{amount_str}[/red]"
+
+    table.add_row(
+        format_timestamp(entry.get("event_ts", ""), use_local_tz),
+        format_timestamp(entry.get("posted_ts", ""), use_local_tz),
+        entry.get("event_type", ""),
+        entry.get("source", ""),
+        amount_str,
+        entry.get("note", "")
+    )
 
 
 @app.command("summary")
@@ -162,14 +233,22 @@ def get_summary(
     ctx: typer.Context,
     since: str = typer.Option(None, help="Start date (YYYY-MM-DD)"),
     until: str = typer.Option(None, help="End date (YYYY-MM-DD)"),
+    offline: bool = typer.Option(False, "--offline", help="Compute the summary from the local ledger store"),
+    refresh: bool = typer.Option(False, "--refresh", help="With --offline or --check: fetch new ledger entries first"),
+    max_age: Optional[float] = typer.Option(None, "--max-age", help="With --offline or --check: fetch new ledger entries if the local ledger was synced more than this many seconds ago (default: ZPOOL_CACHE_MAX_AGE, else 3600)"),
+    check: bool = typer.Option(False, "--check", help="Compare the local summary with the API's and list the differences"),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON"),
     use_local_tz: bool = typer.Option(False, "--local", help="Show timestamps in local timezone (default: UTC)")
 ):
-    """View aggregated billing summary grouped by zpool and rate period."""
+    """
+    View aggregated billing summary grouped by zpool and rate period.
+
+    With --offline, the summary is computed from the local ledger store (see
+    billing ledger) without asking the API for it.
+    """
     try:
+        from zpools._generated.api.billing import get_billing_summary
         from zpools_cli.utils import get_authenticated_client
-        client = get_authenticated_client(ctx.obj)
-        auth_client = client.get_authenticated_client()
 
         # Parse dates if provided
         since_date = None
@@ -188,6 +267,13 @@ def get_summary(
                 console.print("[red]Invalid date format for --until. Use YYYY-MM-DD[/red]")
                 return
 
+        if offline or check:
+            _local_summary(ctx.obj, since_date, until_date, refresh, max_age, check, json_output, use_local_tz)
+            return
+
+        client = get_authenticated_client(ctx.obj)
+        auth_client = client.get_authenticated_client()
+
         # Build kwargs for API call
         kwargs = {}
         if since_date:
@@ -202,121 +288,8 @@ def get_summary(
                 print(json.dumps(response.parsed.to_dict(), indent=2, default=str))
                 return
 
-            summary = response.parsed.detail.summary
-            if not summary or isinstance(summary, type(UNSET)):
-                console.print("[yellow]Summary information unavailable.[/yellow]")
-                return
-
-            # Period info
-            period = summary.period if summary.period is not UNSET else None
-            if period:
-                from_date = period.from_date if period.from_date is not UNSET else "all time"
-                to_date = period.to_date if period.to_date is not UNSET else "present"
-                console.print(f"\n[bold]Billing Summary[/bold] ({from_date} to {to_date})\n")
-
-            # Storage Charges
-            storage_charges = summary.storage_charges if summary.storage_charges is not UNSET else []
-            if storage_charges:
-                table = Table(title="Storage Charges")
-                table.add_column("Zpool ID", style="cyan")
-                table.add_column("Type", style="yellow")
-                table.add_column("Size", style="green")
-                table.add_column("Hourly Rate", style="blue")
-                table.add_column("Daily Rate", style="blue")
-                table.add_column("Hours", style="magenta")
-                table.add_column("Total", style="red")
-                table.add_column("Period", style="white")
-
-                for charge in storage_charges:
-                    zpool_id = charge.zpool_id if charge.zpool_id is not UNSET else ""
-                    vol_type = charge.volume_type if charge.volume_type is not UNSET else ""
-                    size_gb = charge.size_gb if charge.size_gb is not UNSET else 0
-                    hourly = charge.hourly_rate if charge.hourly_rate is not UNSET else 0
-                    daily = charge.daily_rate if charge.daily_rate is not UNSET else 0
-                    hours = charge.hours if charge.hours is not UNSET else 0
-                    total = charge.total_charges if charge.total_charges is not UNSET else 0
-                    from_ts = charge.from_ts if charge.from_ts is not UNSET else ""
-                    to_ts = charge.to_ts if charge.to_ts is not UNSET else ""
-
-                    # Format dates for display (just date part)
-                    from_short = from_ts[:10] if from_ts else ""
-                    to_short = to_ts[:10] if to_ts else ""
-                    period_str = f"{from_short} → {to_short}"
-
-                    table.add_row(
-                        zpool_id,
-                        vol_type,
-                        f"{size_gb} GB",
-                        f"${format_usd(hourly)}",
-                        f"${format_usd(daily)}",
-                        str(hours),
-                        f"${format_usd(total)}",
-                        period_str
-                    )
-                console.print(table)
-
-            # Time-of-Use Charges
-            tou_charges = summary.time_of_use_charges if summary.time_of_use_charges is not UNSET else []
-            if tou_charges:
-                table = Table(title="Time-of-Use Charges")
-                table.add_column("Time", style="blue")
-                table.add_column("Source", style="cyan")
-                table.add_column("Zpool ID", style="yellow")
-                table.add_column("Amount", style="red")
-                table.add_column("Note", style="white")
-
-                for charge in tou_charges:
-                    posted_ts = charge.posted_ts if charge.posted_ts is not UNSET else ""
-                    source = charge.source if charge.source is not UNSET else ""
-                    zpool_id = charge.zpool_id if charge.zpool_id is not UNSET else ""
-                    amount = charge.amount_usd if charge.amount_usd is not UNSET else 0
-                    note = charge.note if charge.note is not UNSET else ""
-
-                    table.add_row(format_timestamp(posted_ts, use_local_tz), source, zpool_id, f"${format_usd(amount)}", note)
-                console.print(table)
-
-            # Credits (attribute is credits_ due to Python reserved word)
-            credits_list = summary.credits_ if summary.credits_ is not UNSET else []
-            if credits_list:
-                table = Table(title="Credits")
-                table.add_column("Time", style="blue")
-                table.add_column("Source", style="cyan")
-                table.add_column("Amount", style="green")
-                table.add_column("Note", style="white")
-
-                for credit in credits_list:
-                    posted_ts = credit.posted_ts if credit.posted_ts is not UNSET else ""
-                    source = credit.source if credit.source is not UNSET else ""
-                    amount = credit.amount_usd if credit.amount_usd is not UNSET else 0
-                    note = credit.note if credit.note is not UNSET else ""
-
-                    table.add_row(format_timestamp(posted_ts, use_local_tz), source, f"+${format_usd(amount)}", note)
-                console.print(table)
-
-            # Totals
-            totals = summary.totals if summary.totals is not UNSET else None
-            if totals:
-                storage = totals.storage_charges if totals.storage_charges is not UNSET else 0
-                tou = totals.time_of_use_charges if totals.time_of_use_charges is not UNSET else 0
-                credits_applied = totals.credits_applied if totals.credits_applied is not UNSET else 0
-                period_net = totals.period_net if totals.period_net is not UNSET else 0
-                ending_balance = totals.ending_balance if totals.ending_balance is not UNSET else 0
-
-                # Period-specific totals
-                console.print(f"\n[bold]Period Totals[/bold] [dim]({from_date} to {to_date})[/dim]")
-                console.print(f"  Storage Charges:     [red]-${format_usd(storage)}[/red]")
-                console.print(f"  Time-of-Use Charges: [red]-${format_usd(tou)}[/red]")
-                console.print(f"  Credits Applied:     [green]+${format_usd(credits_applied)}[/green]")
-                console.print(f"  [bold]Net Change:          ${format_usd(period_net)}[/bold]")
-
-                # Current account balance (independent of period)
-                console.print(f"\n[bold]Account Balance[/bold]")
-                console.print(f"  [bold]Balance Now:         ${format_usd(ending_balance)}[/bold]")
-
-            # Note about ending balance
-            note = response.parsed.detail.note if response.parsed.detail.note is not UNSET else ""
-            if note:
-                console.print(f"\n[dim]{note}[/dim]")
+            detail = response.parsed.detail
+            _print_summary(detail.summary, detail.note if detail.note is not UNSET else "", use_local_tz)
         else:
             error_msg = format_error_response(response.status_code, response.content, json_output)
             if json_output:
@@ -324,10 +297,178 @@ def get_summary(
             else:
                 console.print(f"[red]Error {response.status_code}:[/red] {error_msg}")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]An error occurred:[/red] {e}")
 
 
+def _local_summary(config, since, until, refresh, max_age, check, json_output, use_local_tz):
+    """
+    Print the billing summary computed from the local ledger store, or with
+    check, its differences from the API's summary.
+
+    The store is synced first if refresh was given, it was never synced or it
+    is older than max_age (see _ledger_needs_sync).
+    """
+    from zpools._generated.models import GetBillingSummaryResponse200DetailSummary
+    from zpools_cli.utils import get_authenticated_client
+
+    ledger_store = get_ledger_store(config)
+    if ledger_store is None:
+        console.print("[red]No cache directory configured: the local ledger store is unavailable.[/red]")
+        return
+    with ledger_store:
+        try:
+            if _ledger_needs_sync(config, ledger_store, refresh, max_age):
+                ledger_store.sync(get_authenticated_client(config))
+            if check:
+                differences = ledger_store.check_summary(get_authenticated_client(config), since=since, until=until)
+        except UnexpectedStatus as e:
+            error_msg = format_error_response(e.status_code, e.content, json_output)
+            if json_output:
+                print(error_msg)
+            else:
+                console.print(f"[red]Error {e.status_code}:[/red] {error_msg}")
+            return
+        summary = ledger_store.summary(since=since, until=until)
+        synced_at = datetime.datetime.fromtimestamp(ledger_store.synced_at, datetime.timezone.utc)
+
+    if check:
+        if json_output:
+            print(json.dumps({"detail": {"differences": differences}}, indent=2))
+        elif differences:
+            console.print(f"[yellow]{len(differences)} differences from the API summary:[/yellow]")
+            for difference in differences:
+                console.print(f"  {difference}", markup=False)
+        else:
+            console.print("[green]The local summary matches the API summary.[/green]")
+        return
+
+    if json_output:
+        print(json.dumps({"detail": {"summary": summary}}, indent=2, default=str))
+        return
+    note = f"Computed from the local ledger as of {format_timestamp(synced_at, use_local_tz)} (--refresh to update)"
+    _print_summary(GetBillingSummaryResponse200DetailSummary.from_dict(summary), note, use_local_tz)
+
+
+def _print_summary(summary, footer, use_local_tz):
+    """Print a billing summary (GetBillingSummaryResponse200DetailSummary) as tables and totals."""
+    if not summary or isinstance(summary, type(UNSET)):
+        console.print("[yellow]Summary information unavailable.[/yellow]")
+        return
+
+    # Period info
+    period = summary.period if summary.period is not UNSET else None
+    if period:
+        from_date = period.from_date if period.from_date is not UNSET else "all time"
+        to_date = period.to_date if period.to_date is not UNSET else "present"
+        console.print(f"\n[bold]Billing Summary[/bold] ({from_date} to {to_date})\n")
+
+    # Storage Charges
+    storage_charges = summary.storage_charges if summary.storage_charges is not UNSET else []
+    if storage_charges:
+        table = Table(title="Storage Charges")
+        table.add_column("Zpool ID", style="cyan")
+        table.add_column("Type", style="yellow")
+        table.add_column("Size", style="green")
+        table.add_column("Hourly Rate", style="blue")
+        table.add_column("Daily Rate", style="blue")
+        table.add_column("Hours", style="magenta")
+        table.add_column("Total", style="red")
+        table.add_column("Period", style="white")
+
+        for charge in storage_charges:
+            zpool_id = charge.zpool_id if charge.zpool_id is not UNSET else ""
+            vol_type = charge.volume_type if charge.volume_type is not UNSET else ""
+            size_gb = charge.size_gb if charge.size_gb is not UNSET else 0
+            hourly = charge.hourly_rate if charge.hourly_rate is not UNSET else 0
+            daily = charge.daily_rate if charge.daily_rate is not UNSET else 0
+            hours = charge.hours if charge.hours is not UNSET else 0
+            total = charge.total_charges if charge.total_charges is not UNSET else 0
+            from_ts = charge.from_ts if charge.from_ts is not UNSET else ""
+            to_ts = charge.to_ts if charge.to_ts is not UNSET else ""
+
+            # Format dates for display (just date part)
+            from_short = from_ts[:10] if from_ts else ""
+            to_short = to_ts[:10] if to_ts else ""
+            period_str = f"{from_short} → {to_short}"
+
+            table.add_row(
+                zpool_id,
+                vol_type,
+                f"{size_gb} GB",
+                f"${format_usd(hourly)}",
+                f"${format_usd(daily)}",
+                str(hours),
+                f"${format_usd(total)}",
+                period_str
+            )
+        console.print(table)
+
+    # Time-of-Use Charges
+    tou_charges = summary.time_of_use_charges if summary.time_of_use_charges is not UNSET else []
+    if tou_charges:
+        table = Table(title="Time-of-Use Charges")
+        table.add_column("Time", style="blue")
+        table.add_column("Source", style="cyan")
+        table.add_column("Zpool ID", style="yellow")
+        table.add_column("Amount", style="red")
+        table.add_column("Note", style="white")
+
+        for charge in tou_charges:
+            posted_ts = charge.posted_ts if charge.posted_ts is not UNSET else ""
+            source = charge.source if charge.source is not UNSET else ""
+            zpool_id = charge.zpool_id if charge.zpool_id is not UNSET else ""
+            amount = charge.amount_usd if charge.amount_usd is not UNSET else 0
+            note = charge.note if charge.note is not UNSET else ""
+
+            table.add_row(format_timestamp(posted_ts, use_local_tz), source, zpool_id, f"${format_usd(amount)}", note)
+        console.print(table)
+
+    # Credits (attribute is credits_ due to Python reserved word)
+    credits_list = summary.credits_ if summary.credits_ is not UNSET else []
+    if credits_list:
+        table = Table(title="Credits")
+        table.add_column("Time", style="blue")
+        table.add_column("Source", style="cyan")
+        table.add_column("Amount", style="green")
+        table.add_column("Note", style="white")
+
+        for credit in credits_list:
+            posted_ts = credit.posted_ts if credit.posted_ts is not UNSET else ""
+            source = credit.source if credit.source is not UNSET else ""
+            amount = credit.amount_usd if credit.amount_usd is not UNSET else 0
+            note = credit.note if credit.note is not UNSET else ""
+
+            table.add_row(format_timestamp(posted_ts, use_local_tz), source, f"+${format_usd(amount)}", note)
+        console.print(table)
+
+    # Totals
+    totals = summary.totals if summary.totals is not UNSET else None
+    if totals:
+        storage = totals.storage_charges if totals.storage_charges is not UNSET else 0
+        tou = totals.time_of_use_charges if totals.time_of_use_charges is not UNSET else 0
+        credits_applied = totals.credits_applied if totals.credits_applied is not UNSET else 0
+        period_net = totals.period_net if totals.period_net is not UNSET else 0
+        ending_balance = totals.ending_balance if totals.ending_balance is not UNSET else 0
+
+        # Period-specific totals
+        console.print(f"\n[bold]Period Totals[/bold] [dim]({from_date} to {to_date})[/dim]")
+        console.print(f"  Storage Charges:     [red]-${format_usd(storage)}[/red]")
+        console.print(f"  Time-of-Use Charges: [red]-${format_usd(tou)}[/red]")
+        console.print(f"  Credits Applied:     [green]+${format_usd(credits_applied)}[/green]")
+        console.print(f"  [bold]Net Change:          ${format_usd(period_net)}[/bold]")
+
+        # Current account balance (independent of period)
+        console.print(f"\n[bold]Account Balance[/bold]")
+        console.print(f"  [bold]Balance Now:         ${format_usd(ending_balance)}[/bold]")
+
+    # Note about ending balance
+    if footer:
+        console.print(f"\n[dim]{footer}[/dim]")
+
+
 @app.command("claim")
 def claim_code(
     ctx: typer.Context,
@@ -336,6 +477,8 @@ def claim_code(
 ):
     """Redeem a credit code."""
     try:
+        from zpools._generated.api.billing import post_codes_claim
+        from zpools._generated.models.post_codes_claim_body import PostCodesClaimBody
         from zpools_cli.utils import get_authenticated_client
         client = get_authenticated_client(ctx.obj)
         auth_client = client.get_authenticated_client()
@@ -372,6 +515,8 @@ def start_payment(
 ):
     """Start a payment session to add credits."""
     try:
+        from zpools._generated.api.billing import post_dodo_start
+        from zpools._generated.models.post_dodo_start_body import PostDodoStartBody
         from zpools_cli.utils import get_authenticated_client
         client = get_authenticated_client(ctx.obj)
         auth_client = client.get_authenticated_client()
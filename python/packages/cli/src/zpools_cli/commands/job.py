@@ -1,16 +1,11 @@
 import typer
 import json
+from typing import Optional
 from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
-from zpools_cli.utils import get_authenticated_client, format_error_response, is_interactive, format_timestamp
+from zpools_cli.utils import get_authenticated_client, get_job_index, get_cache_max_age, format_error_response, is_interactive, format_timestamp
 from zpools_cli.job_monitor import wait_for_job_with_progress
-from zpools._generated.api.jobs import (
-    get_jobs,
-    get_job_job_id,
-    get_job_job_id_history
-)
-from zpools._generated.types import UNSET
 
 app = typer.Typer(help="Manage background jobs", no_args_is_help=True)
 console = Console()
@@ -48,16 +43,36 @@ def format_relative_time(iso_timestamp: str) -> str:
 @app.command("list")
 def list_jobs(
     ctx: typer.Context,
-    limit: int = typer.Option(100, "--limit", "-n", help="Maximum number of jobs to return (1-1000)"),
+    limit: int = typer.Option(100, "--limit", "-n", help="Maximum number of jobs to return (above 1000, pages through the API)"),
+    all_jobs: bool = typer.Option(False, "--all", help="List every job, paging through the API (ignores --limit)"),
     before: str = typer.Option(None, "--before", help="Jobs created before this date (ISO 8601)"),
     after: str = typer.Option(None, "--after", help="Jobs created after this date (ISO 8601)"),
     sort: str = typer.Option("desc", "--sort", help="Sort order: asc or desc"),
+    job_type: str = typer.Option(None, "--type", help="Only jobs of this type (e.g. zpool_scrub)"),
+    state: str = typer.Option(None, "--state", help="Only jobs in this state (e.g. failed)"),
+    zpool_id: str = typer.Option(None, "--zpool", help="Only jobs for this ZPool ID"),
+    max_age: Optional[float] = typer.Option(None, "--max-age", help="Use a cached result up to this many seconds old"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached results and query the API"),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON")
 ):
     """List all background jobs with optional filtering and sorting."""
     try:
-        client = get_authenticated_client(ctx.obj)
+        from zpools.api.jobs import MAX_PAGE_SIZE
+        from zpools.domain import jobs_from_response
+
+        if job_type or state or zpool_id:
+            _list_filtered_jobs(
+                ctx.obj, None if all_jobs else limit, before, after, sort,
+                job_type, state, zpool_id, max_age, no_cache, json_output
+            )
+            return
+
+        client = get_authenticated_client(ctx.obj, max_age=max_age, no_cache=no_cache)
         
+        if all_jobs or limit > MAX_PAGE_SIZE:
+            _list_all_jobs(client, None if all_jobs else limit, before, after, sort, json_output)
+            return
+
         response = client.list_jobs(limit=limit, before=before, after=after, sort=sort)
         
         if response.status_code == 200:
@@ -65,54 +80,7 @@ def list_jobs(
                 print(json.dumps(response.parsed.to_dict(), indent=2, default=str))
                 return
             
-            jobs = response.parsed.detail.jobs
-            if not jobs:
-                console.print("No jobs found.")
-                return
-
-            table = Table(title="Your Jobs")
-            table.add_column("ID", style="cyan")
-            table.add_column("Type", style="magenta")
-            table.add_column("Status", style="blue")
-            table.add_column("Age", style="green", justify="right")
-            table.add_column("Message", style="white")
-
-            for job in jobs:
-                # API returns fields not in schema - they're in additional_properties
-                job_id = job.job_id if job.job_id is not UNSET else ""
-                
-                # Try schema field first, then additional_properties
-                operation = job.operation if job.operation is not UNSET else job.additional_properties.get('job_type', "")
-                
-                # Status is in current_status.state in additional_properties
-                current_status = job.additional_properties.get('current_status', {})
-                if isinstance(current_status, dict):
-                    status_val = current_status.get('state', 'Unknown')
-                    message = current_status.get('message', '')
-                else:
-                    # Fallback to schema status
-                    status_val = job.status.value if job.status is not UNSET else "Unknown"
-                    message = ""
-                
-                # Get created_at (it's a datetime object in the schema)
-                if job.created_at is not UNSET:
-                    created_at_str = job.created_at.isoformat()
-                    relative_time = format_relative_time(created_at_str)
-                else:
-                    relative_time = ""
-                
-                # Truncate message if too long
-                if len(message) > 50:
-                    message = message[:47] + "..."
-                
-                table.add_row(
-                    job_id,
-                    operation,
-                    status_val,
-                    relative_time,
-                    message
-                )
-            console.print(table)
+            _print_jobs_table(jobs_from_response(response))
         else:
             error_msg = format_error_response(response.status_code, response.content, json_output)
             if json_output:
@@ -120,18 +88,148 @@ def list_jobs(
             else:
                 console.print(f"[red]Error {response.status_code}:[/red] {error_msg}")
             
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]An error occurred:[/red] {e}")
 
+
+def _list_all_jobs(client, limit, before, after, sort, json_output):
+    """
+    List jobs across pages (limit=None for every job).
+
+    Every job is fetched with fetch_jobs, in concurrent time windows; a limit
+    pages with iter_jobs, so no more than the needed pages are requested.
+    """
+    from itertools import islice
+    from zpools._generated.errors import UnexpectedStatus
+
+    try:
+        if limit is None:
+            jobs = list(client.fetch_jobs(after=after, before=before, sort=sort))
+        else:
+            jobs = list(islice(client.iter_jobs(before=before, after=after, sort=sort, prefetch=True), limit))
+    except UnexpectedStatus as e:
+        error_msg = format_error_response(e.status_code, e.content, json_output)
+        if json_output:
+            print(error_msg)
+        else:
+            console.print(f"[red]Error {e.status_code}:[/red] {error_msg}")
+        return
+
+    _print_jobs(jobs, json_output)
+
+
+def _list_filtered_jobs(config, limit, before, after, sort, job_type, state, zpool_id, max_age, no_cache, json_output):
+    """
+    List jobs matching --type/--state/--zpool (limit=None for every job).
+
+    Served from the local job index, which is synced first unless it was
+    synced less than max_age seconds ago. Without an index (no cache
+    directory configured), jobs are listed from the API and filtered here.
+    """
+    import time
+    from itertools import islice
+    from zpools._generated.errors import UnexpectedStatus
+
+    job_index = get_job_index(config)
+    try:
+        if job_index is not None:
+            max_age = get_cache_max_age(config, max_age)
+            synced_at = job_index.synced_at
+            if no_cache or synced_at is None or time.time() - synced_at >= max_age:
+                job_index.sync(get_authenticated_client(config))
+            jobs = job_index.jobs(
+                operation=job_type, state=state, zpool_id=zpool_id,
+                before=before, after=after, sort=sort, limit=limit
+            )
+        else:
+            client = get_authenticated_client(config)
+            matching = (
+                job for job in client.iter_jobs(before=before, after=after, sort=sort, prefetch=True)
+                if (not job_type or job.operation == job_type)
+                and (not state or job.state == state)
+                and (not zpool_id or job.zpool_id == zpool_id)
+            )
+            jobs = list(islice(matching, limit))
+    except UnexpectedStatus as e:
+        error_msg = format_error_response(e.status_code, e.content, json_output)
+        if json_output:
+            print(error_msg)
+        else:
+            console.print(f"[red]Error {e.status_code}:[/red] {error_msg}")
+        return
+    finally:
+        if job_index is not None:
+            job_index.close()
+
+    _print_jobs(jobs, json_output)
+
+
+def _print_jobs(jobs, json_output):
+    """Print jobs (zpools.domain.Job) as JSON in the list_jobs response shape, or as a table."""
+    if json_output:
+        print(json.dumps({"detail": {"jobs": [job.data for job in jobs]}}, indent=2, default=str))
+        return
+    _print_jobs_table(jobs)
+
+
+def _complete_job_id(ctx: typer.Context, incomplete: str):
+    """Shell completion of job IDs from the local job index (makes no request)."""
+    from zpools_cli.config import build_client_config
+
+    try:
+        config = build_client_config(rc_file=ctx.find_root().params.get("rcfile"))
+        job_index = get_job_index(config)
+        if job_index is None:
+            return []
+        with job_index:
+            return job_index.job_ids(incomplete, limit=50)
+    except Exception:
+        return []
+
+
+def _print_jobs_table(jobs):
+    """Print jobs (zpools.domain.Job) as a table."""
+    if not jobs:
+        console.print("No jobs found.")
+        return
+
+    table = Table(title="Your Jobs")
+    table.add_column("ID", style="cyan")
+    table.add_column("Type", style="magenta")
+    table.add_column("Status", style="blue")
+    table.add_column("Age", style="green", justify="right")
+    table.add_column("Message", style="white")
+
+    for job in jobs:
+        relative_time = format_relative_time(job.created_at) if job.created_at else ""
+        
+        # Truncate message if too long
+        message = job.message
+        if len(message) > 50:
+            message = message[:47] + "..."
+        
+        table.add_row(
+            job.job_id or "",
+            job.operation,
+            job.state or "Unknown",
+            relative_time,
+            message
+        )
+    console.print(table)
+
+
 @app.command("get")
 def get_job(
     ctx: typer.Context,
-    job_id: str = typer.Argument(..., help="Job ID to retrieve"),
+    job_id: str = typer.Argument(..., help="Job ID to retrieve", autocompletion=_complete_job_id),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON"),
     use_local_tz: bool = typer.Option(False, "--local", help="Show timestamps in local timezone (default: UTC)")
 ):
     """Get details of a specific job."""
     try:
+        from zpools._generated.api.jobs import get_job_job_id
         client = get_authenticated_client(ctx.obj)
         auth_client = client.get_authenticated_client()
         
@@ -171,7 +269,7 @@ def get_job(
 @app.command("history")
 def job_history(
     ctx: typer.Context,
-    job_id: str = typer.Argument(..., help="Job ID to get history for"),
+    job_id: str = typer.Argument(..., help="Job ID to get history for", autocompletion=_complete_job_id),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON"),
     watch: bool = typer.Option(False, "--watch", help="Poll job until completion (requires interactive terminal)"),
     timeout: int = typer.Option(1800, "--timeout", help="Maximum time to wait in seconds (only used with --watch)"),
@@ -189,6 +287,8 @@ def job_history(
         raise typer.Exit(1)
     
     try:
+        from zpools._generated.api.jobs import get_job_job_id_history
+        from zpools.domain import job_from_response
         client = get_authenticated_client(ctx.obj)
         auth_client = client.get_authenticated_client()
         
@@ -205,19 +305,15 @@ def job_history(
                 console.print(f"[red]Error {job_response.status_code}:[/red] {error_msg}")
                 raise typer.Exit(1)
             
-            # Extract job data from response
-            job_data = job_response.parsed.detail.additional_properties.get('job')
-            if not job_data:
+            job = job_from_response(job_response)
+            if job is None:
                 console.print(f"[red]Error:[/red] Job {job_id} response missing 'job' field")
                 raise typer.Exit(1)
             
             # Get job type for operation name
-            operation_name = job_data.get('job_type', 'Job')
-            
-            # Check current job state
-            current_status = job_data.get('current_status', {})
-            job_state = current_status.get('state', '')
-            message = current_status.get('message', '')
+            operation_name = job.operation or 'Job'
+            job_state = job.state
+            message = job.message
             
             # Handle terminal states
             if job_state == 'succeeded':
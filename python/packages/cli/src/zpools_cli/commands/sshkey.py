@@ -56,11 +56,13 @@ def _resolve_pubkey_content(raw: str) -> tuple[str, str, str]:
 @app.command("list")
 def list_sshkeys(
     ctx: typer.Context,
+    max_age: Optional[float] = typer.Option(None, "--max-age", help="Use a cached result up to this many seconds old"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached results and query the API"),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON")
 ):
     """List all SSH keys."""
     try:
-        client = get_authenticated_client(ctx.obj)
+        client = get_authenticated_client(ctx.obj, max_age=max_age, no_cache=no_cache)
 
         response = client.list_sshkeys()
 
@@ -1,27 +1,16 @@
 import typer
 import json
 import time
+from typing import Optional
 from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
-from zpools_cli.utils import get_authenticated_client, format_error_response, format_timestamp
+from zpools_cli.utils import get_authenticated_client, get_job_index, format_error_response, format_timestamp
 from zpools_cli.cooldown import calculate_cooldown_info
 from zpools_cli.job_monitor import wait_for_job_with_progress
 from zpools_cli.job_helpers import find_and_resume_job
 from zpools_cli.volume_monitor import wait_for_modify_with_progress
 from zpools_cli.wait_helpers import wait_with_token_refresh
-from zpools._generated.api.zpools import (
-    get_zpools,
-    post_zpool,
-    delete_zpool_zpool_id,
-    post_zpool_zpool_id_modify,
-    post_zpool_zpool_id_scrub
-)
-from zpools._generated.models.post_zpool_body import PostZpoolBody
-from zpools._generated.models.post_zpool_body_new_size_in_gib import PostZpoolBodyNewSizeInGib
-from zpools._generated.models.post_zpool_body_volume_type import PostZpoolBodyVolumeType
-from zpools._generated.models.post_zpool_zpool_id_modify_body import PostZpoolZpoolIdModifyBody
-from zpools._generated.models.post_zpool_zpool_id_modify_body_volume_type import PostZpoolZpoolIdModifyBodyVolumeType
 from zpools._generated.types import UNSET
 
 app = typer.Typer(help="Manage ZFS pools", no_args_is_help=True)
@@ -31,14 +20,16 @@ console = Console()
 @app.command("list")
 def list_zpools(
     ctx: typer.Context,
+    max_age: Optional[float] = typer.Option(None, "--max-age", help="Use a cached result up to this many seconds old"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached results and query the API"),
     json_output: bool = typer.Option(False, "--json", help="Output raw JSON")
 ):
     """List all ZPools."""
     try:
-        client = get_authenticated_client(ctx.obj)
-        auth_client = client.get_authenticated_client()
+        from zpools.domain import zpools_from_response
+        client = get_authenticated_client(ctx.obj, max_age=max_age, no_cache=no_cache)
         
-        response = get_zpools.sync_detailed(client=auth_client)
+        response = client.list_zpools()
         
         if response.status_code == 200:
             if json_output:
@@ -62,30 +53,21 @@ def list_zpools(
                     print(json.dumps({'detail': {'zpools': zpools_list}, 'message': response.parsed.message}, indent=2, default=str))
                 return
 
-            zpools = response.parsed.detail.zpools
-            if not zpools or not zpools.additional_properties:
+            zpools = zpools_from_response(response)
+            if not zpools:
                 console.print("No ZPools found.")
                 return
 
             # Display zpools - iterate and show each with its volumes
-            for zpool_id, pool in zpools.additional_properties.items():
-                # Get zpool-level info from SDK attributes
-                username = pool.username if pool.username is not UNSET else 'N/A'
-                volume_count = pool.volume_count if pool.volume_count is not UNSET else 0
-                create_time = pool.create_time if pool.create_time is not UNSET else None
-                last_scrub = pool.last_scrub_time if pool.last_scrub_time is not UNSET else None
-                
-                # Format dates
-                create_time_str = create_time.strftime('%Y-%m-%d') if create_time else 'N/A'
-                last_scrub_str = last_scrub.strftime('%Y-%m-%d') if last_scrub else 'Never'
+            for zpool_id, pool in zpools.items():
+                # Dates are ISO 8601 strings; show the date part
+                create_time_str = pool.create_time[:10] if pool.create_time else 'N/A'
+                last_scrub_str = pool.last_scrub_time[:10] if pool.last_scrub_time else 'Never'
                 
                 console.print(f"\n[bold cyan]ZPool:[/bold cyan] {zpool_id}")
-                console.print(f"  User: {username}  |  Volumes: {volume_count}  |  Created: {create_time_str}  |  Last Scrub: {last_scrub_str}")
-                
-                # Get volumes from SDK attribute
-                volumes = pool.volumes if pool.volumes is not UNSET else []
+                console.print(f"  User: {pool.username or 'N/A'}  |  Volumes: {pool.volume_count}  |  Created: {create_time_str}  |  Last Scrub: {last_scrub_str}")
                 
-                if not volumes:
+                if not pool.volumes:
                     console.print("  [yellow]No volumes found[/yellow]")
                     continue
                 
@@ -98,32 +80,23 @@ def list_zpools(
                 vol_table.add_column("Mod %", style="bright_blue")
                 vol_table.add_column("Can Modify", style="white")
                 
-                for vol in volumes:
-                    # Access SDK model attributes or additional_properties
-                    size = vol.size if vol.size is not UNSET else vol.additional_properties.get('Size', 'N/A')
-                    vol_type = vol.volume_type if vol.volume_type is not UNSET else vol.additional_properties.get('VolumeType', 'N/A')
-                    state = vol.state if vol.state is not UNSET else vol.additional_properties.get('State', 'N/A')
-                    mod_state = vol.mod_state if vol.mod_state is not UNSET else vol.additional_properties.get('ModState', 'N/A')
-                    mod_progress = vol.mod_progress if vol.mod_progress is not UNSET else vol.additional_properties.get('ModProgress', 'N/A')
-                    can_modify = vol.can_modify_now if vol.can_modify_now is not UNSET else vol.additional_properties.get('CanModifyNow', False)
-                    mod_last_time = vol.mod_last_time if vol.mod_last_time is not UNSET else vol.additional_properties.get('ModLastTime')
-                    
+                for vol in pool.volumes:
                     # Calculate cooldown info
-                    if can_modify:
+                    if vol.can_modify_now:
                         modify_status = "Yes"
                     else:
-                        cooldown = calculate_cooldown_info(mod_last_time)
+                        cooldown = calculate_cooldown_info(vol.mod_last_time)
                         if cooldown['in_cooldown']:
                             modify_status = f"In ~{cooldown['wait_str']}"
                         else:
                             modify_status = "No"
                     
                     vol_table.add_row(
-                        str(size),
-                        str(vol_type),
-                        state,
-                        mod_state,
-                        f"{mod_progress}%" if mod_progress != 'N/A' else 'N/A',
+                        str(vol.size if vol.size is not None else 'N/A'),
+                        vol.volume_type or 'N/A',
+                        vol.state or 'N/A',
+                        vol.mod_state,
+                        f"{vol.mod_progress}%",
                         modify_status
                     )
                 
@@ -135,6 +108,8 @@ def list_zpools(
             else:
                 console.print(f"[red]Error {response.status_code}:[/red] {error_msg}")
             
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]An error occurred:[/red] {e}")
 
@@ -159,7 +134,8 @@ def create_zpool(
                 job_type='zpool_create',
                 operation_name='ZPool creation',
                 timeout=timeout,
-                json_output=json_output
+                json_output=json_output,
+                job_index=get_job_index(ctx.obj)
             )
             # Extract zpool_id from message if available (only in non-JSON mode)
             if not json_output and final_job:
@@ -223,9 +199,9 @@ def delete_zpool(
 
     try:
         client = get_authenticated_client(ctx.obj)
-        auth_client = client.get_authenticated_client()
         
-        response = delete_zpool_zpool_id.sync_detailed(zpool_id=zpool_id, client=auth_client)
+        # Through the client so cached zpool lists are invalidated
+        response = client.delete_zpool(zpool_id)
         
         if response.status_code == 200:
             if json_output:
@@ -266,6 +242,8 @@ def modify_zpool(
     The cooldown wait has no timeout since the end time is known; use Ctrl+C to abort if needed.
     """
     try:
+        from zpools._generated.api.zpools import get_zpools
+        from zpools.domain import zpools_from_response
         client = get_authenticated_client(ctx.obj)
         
         # If --resume, skip the API call and just monitor
@@ -296,16 +274,14 @@ def modify_zpool(
         if wait_until_able:
             list_response = get_zpools.sync_detailed(client=client.get_authenticated_client())
             if list_response.status_code == 200 and list_response.parsed:
-                zpools = list_response.parsed.detail.zpools.to_dict() if list_response.parsed.detail.zpools else {}
-                zpool = zpools.get(zpool_id, {})
-                volumes = zpool.get('Volumes', [])
+                zpool = zpools_from_response(list_response).get(zpool_id)
+                volumes = zpool.volumes if zpool else []
                 
                 # Find the latest ModLastTime among volumes that can't be modified
                 max_cooldown = None
                 for vol in volumes:
-                    if not vol.get('CanModifyNow', True):
-                        mod_last = vol.get('ModLastTime')
-                        cooldown = calculate_cooldown_info(mod_last)
+                    if not vol.can_modify_now:
+                        cooldown = calculate_cooldown_info(vol.mod_last_time)
                         if cooldown['in_cooldown']:
                             if max_cooldown is None or cooldown['wait_seconds'] > max_cooldown['wait_seconds']:
                                 max_cooldown = cooldown
@@ -379,9 +355,8 @@ def modify_zpool(
                     # Get volume details from list to find ModLastTime
                     list_response = get_zpools.sync_detailed(client=client.get_authenticated_client())
                     if list_response.status_code == 200 and list_response.parsed:
-                        zpools = list_response.parsed.detail.zpools.to_dict() if list_response.parsed.detail.zpools else {}
-                        zpool = zpools.get(zpool_id, {})
-                        volumes = zpool.get('Volumes', [])
+                        zpool = zpools_from_response(list_response).get(zpool_id)
+                        volumes = zpool.volumes if zpool else []
                         
                         # Find the earliest cooldown expiration time
                         earliest_cooldown = None
@@ -389,8 +364,7 @@ def modify_zpool(
                         # In MVP: one volume per zpool, so if any cooldown volume matches this zpool, show it
                         if cooldown_volumes:
                             for vol in volumes:
-                                mod_last = vol.get('ModLastTime')
-                                cooldown = calculate_cooldown_info(mod_last)
+                                cooldown = calculate_cooldown_info(vol.mod_last_time)
                                 if cooldown['in_cooldown']:
                                     if earliest_cooldown is None or cooldown['retry_time'] < earliest_cooldown['retry_time']:
                                         earliest_cooldown = cooldown
@@ -457,7 +431,8 @@ def scrub_zpool(
                 operation_name='ZPool scrub',
                 zpool_id=zpool_id,
                 timeout=timeout,
-                json_output=json_output
+                json_output=json_output,
+                job_index=get_job_index(ctx.obj)
             )
             return
         
@@ -153,6 +153,8 @@ def run_config_wizard(rc_file_path: Path, console) -> bool:
         "# 6. BZFS_BIN=path/to/bzfs",
         "# 7. LOCAL_POOL=your/local/zpool/dataset",
         "# 8. REMOTE_POOL=user@ssh.zpools.io:remote-zpool-id/remote-dataset",
+        "# 9. ZPOOL_CACHE_DIR=path/to/cache/dir  (list results cache; default: <token cache dir>/responses)",
+        "# 10. ZPOOL_CACHE_MAX_AGE=30  (seconds cached list results are used without --max-age; default 0)",
         "",
         "",
     ])
@@ -265,6 +267,8 @@ def build_client_config(
         "ssh_host": get_config_value("SSH_HOST", ssh_host, rc_config, "ssh.zpools.io"),
         "ssh_privkey": get_config_value("SSH_PRIVKEY_FILE", ssh_privkey, rc_config),
         "token_cache_dir": get_config_value("ZPOOL_TOKEN_CACHE_DIR", token_cache_dir, rc_config),
+        "cache_dir": get_config_value("ZPOOL_CACHE_DIR", None, rc_config),
+        "cache_max_age": get_config_value("ZPOOL_CACHE_MAX_AGE", None, rc_config),
     }
     
     # Password: ONLY from environment variable (never CLI arg or RC file)
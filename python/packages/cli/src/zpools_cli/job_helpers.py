@@ -1,14 +1,20 @@
 """Helper functions for job monitoring and resume functionality."""
 import json
 import typer
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from rich.console import Console
 from zpools_cli.utils import format_error_response
 from zpools_cli.job_monitor import wait_for_job_with_progress
-from zpools._generated.types import UNSET
 
 console = Console()
 
+# Without a local job index, the newest RESUME_PAGE_SIZE jobs are searched for
+# a job to resume, then older jobs created within RESUME_LOOKBACK (the index
+# is searched in full)
+RESUME_PAGE_SIZE = 100
+RESUME_LOOKBACK = timedelta(days=7)
+
 
 def find_and_resume_job(
     client,
@@ -16,7 +22,8 @@ def find_and_resume_job(
     operation_name: str,
     zpool_id: Optional[str] = None,
     timeout: int = 1800,
-    json_output: bool = False
+    json_output: bool = False,
+    job_index=None
 ):
     """
     Find the most recent job of given type and monitor it to completion.
@@ -28,49 +35,34 @@ def find_and_resume_job(
         zpool_id: If provided, only match jobs for this specific zpool
         timeout: Max seconds to wait for completion
         json_output: Return JSON vs formatted output
+        job_index: Local JobIndex (from get_job_index) to look the job up in after
+                   syncing it; without one, see _latest_listed_job
         
     Raises:
         typer.Exit: If no matching job found or job listing fails
     """
-    # List jobs to find the most recent job (regardless of state)
-    jobs_response = client.list_jobs(limit=100, sort="desc")
-    if jobs_response.status_code != 200:
-        error_msg = format_error_response(jobs_response.status_code, jobs_response.content, json_output)
+    from zpools._generated.errors import UnexpectedStatus
+    
+    # Most recent matching job (regardless of state); scrub/modify jobs also
+    # have to be for this zpool
+    try:
+        if job_index is not None:
+            job_index.sync(client)
+            matching_job = job_index.latest(operation=job_type, zpool_id=zpool_id)
+        else:
+            matching_job = _latest_listed_job(client, job_type, zpool_id)
+    except UnexpectedStatus as e:
+        error_msg = format_error_response(e.status_code, e.content, json_output)
         console.print(f"[red]Error fetching jobs:[/red] {error_msg}")
         raise typer.Exit(1)
     
-    jobs = jobs_response.parsed.detail.jobs
-    matching_job = None
-    
-    # Find most recent matching job (regardless of state)
-    for job in jobs:
-        # Get operation type
-        operation = job.operation if job.operation is not UNSET else job.additional_properties.get('job_type', "")
-        
-        # Check job type match
-        if operation != job_type:
-            continue
-        
-        # Check zpool_id if needed (for scrub/modify operations)
-        if zpool_id:
-            parameters = job.additional_properties.get('parameters', '{}')
-            try:
-                params_dict = json.loads(parameters) if isinstance(parameters, str) else parameters
-                job_zpool_id = params_dict.get('zpool_id', '')
-                if job_zpool_id != zpool_id:
-                    continue
-            except:
-                continue
-        
-        # Found matching job (most recent due to sort="desc")
-        matching_job = job
-        break
-    
     if not matching_job:
         if zpool_id:
             error_msg = f"No {job_type} job found for zpool {zpool_id}"
         else:
             error_msg = f"No {job_type} job found"
+        if job_index is None:
+            error_msg += f" in the last {RESUME_PAGE_SIZE} jobs or {RESUME_LOOKBACK.days} days"
         
         if json_output:
             print(json.dumps({"error": error_msg}, indent=2))
@@ -80,12 +72,7 @@ def find_and_resume_job(
     
     job_id = matching_job.job_id
     
-    # Get current status
-    current_status = matching_job.additional_properties.get('current_status', {})
-    if isinstance(current_status, dict):
-        status_val = current_status.get('state', 'Unknown')
-    else:
-        status_val = 'Unknown'
+    status_val = matching_job.state or 'Unknown'
     
     # If already completed/failed, just show the result
     if status_val in ('completed', 'failed'):
@@ -94,13 +81,12 @@ def find_and_resume_job(
         
         if json_output:
             # Return the full job details
-            print(json.dumps(matching_job.to_dict(), indent=2, default=str))
+            print(json.dumps(matching_job.data, indent=2, default=str))
         else:
             # Show completion message
-            msg = current_status.get('message', '') if isinstance(current_status, dict) else ''
-            if msg:
-                console.print(f"Message: {msg}")
-        return matching_job.to_dict() if not json_output else None
+            if matching_job.message:
+                console.print(f"Message: {matching_job.message}")
+        return matching_job.data if not json_output else None
     
     # Job is still in progress, monitor it
     if not json_output:
@@ -125,3 +111,37 @@ def find_and_resume_job(
         except RuntimeError:
             console.print(f"Job ID: {job_id}")
             raise typer.Exit(1)
+
+
+def _latest_listed_job(client, job_type: str, zpool_id: Optional[str] = None):
+    """
+    Most recent job of job_type (and zpool_id) listed from the API, or None.
+
+    Searches the newest RESUME_PAGE_SIZE jobs whatever their age, then pages
+    on through older jobs only as far back as RESUME_LOOKBACK.
+
+    Raises:
+        UnexpectedStatus: If a list request fails
+    """
+    from zpools._generated.errors import UnexpectedStatus
+    from zpools.domain import jobs_from_response
+
+    def matches(job):
+        return job.operation == job_type and (not zpool_id or job.zpool_id == zpool_id)
+
+    response = client.list_jobs(limit=RESUME_PAGE_SIZE, sort="desc")
+    if response.status_code != 200:
+        raise UnexpectedStatus(response.status_code, response.content)
+    newest = jobs_from_response(response)
+    matching_job = next((job for job in newest if matches(job)), None)
+    if matching_job or len(newest) < RESUME_PAGE_SIZE:
+        return matching_job
+
+    # sort="desc": older pages are only fetched until a match is found
+    after = datetime.now(timezone.utc) - RESUME_LOOKBACK
+    last_created = newest[-1].created_at
+    if not last_created or datetime.fromisoformat(last_created.replace("Z", "+00:00")) <= after:
+        return None
+    seen = {job.job_id for job in newest}
+    older = client.iter_jobs(before=last_created, after=after, sort="desc", page_size=RESUME_PAGE_SIZE)
+    return next((job for job in older if job.job_id not in seen and matches(job)), None)
@@ -31,30 +31,32 @@ def wait_for_job_with_progress(client, job_id: str, operation_name: str, timeout
     
     def poll_api():
         """Poll job status and history."""
+        from zpools.domain import job_from_response
+        
         response = client.get_job(job_id)
         if response.status_code != 200:
             raise RuntimeError(f"Failed to get job status: {response.status_code}")
         
-        job_data = response.parsed.detail.additional_properties.get('job')
-        if not job_data:
+        job = job_from_response(response)
+        if job is None:
             raise RuntimeError(f"Job {job_id} response missing 'job' field")
         
         # Get job history
         history_response = client.get_job_history(job_id)
         history = []
         if history_response.status_code == 200:
-            history = history_response.parsed.detail.additional_properties.get('history', [])
+            if isinstance(history_response.parsed, dict):
+                history = history_response.parsed.get('detail', {}).get('history', [])
+            else:
+                history = history_response.parsed.detail.additional_properties.get('history', [])
         
-        return {'job': job_data, 'history': history}
+        return {'job': job, 'history': history}
     
     def render_display(state, spinner):
         """Render the job status display."""
-        job_data = state['job']
+        job_state = state['job'].state
         history = state['history']
         
-        current_status = job_data.get('current_status', {})
-        job_state = current_status.get('state')
-        
         # Status line
         status_text = Text()
         status_text.append(f"{spinner} ", style="cyan bold")
@@ -101,16 +103,14 @@ def wait_for_job_with_progress(client, job_id: str, operation_name: str, timeout
     
     def check_complete(state):
         """Check if job is complete and handle terminal states."""
-        job_data = state['job']
-        current_status = job_data.get('current_status', {})
-        job_state = current_status.get('state')
-        message = current_status.get('message', '')
+        job = state['job']
+        job_state = job.state
         
         if job_state == "succeeded":
             console.print(f"\n[green]✓ {operation_name} completed successfully![/green]")
             return True
         elif job_state == "failed":
-            error_msg = message or 'Unknown error'
+            error_msg = job.message or 'Unknown error'
             console.print(f"\n[red]✗ {operation_name} failed: {error_msg}[/red]")
             raise RuntimeError(f"Job {job_id} failed: {error_msg}")
         elif job_state not in ("pending", "running", "queued", "in progress"):
@@ -119,4 +119,4 @@ def wait_for_job_with_progress(client, job_id: str, operation_name: str, timeout
         return False
     
     result = monitor.monitor(poll_api, render_display, check_complete, operation_name)
-    return result['job']
+    return result['job'].data
@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from zpools import ZPoolsClient
-from zpools._generated.api.authentication import get_hello
 from zpools_cli.commands import zpool, sshkey, pat, job, billing, zfs
 from zpools_cli.config import (
     COMMANDS_NEEDING_CONFIG,
@@ -53,6 +52,7 @@ def hello(ctx: typer.Context):
     Test connectivity to the API.
     """
     try:
+        from zpools._generated.api.authentication import get_hello
         from zpools_cli.utils import get_authenticated_client
         client = get_authenticated_client(ctx.obj)
         
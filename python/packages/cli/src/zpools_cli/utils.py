@@ -2,12 +2,20 @@ import sys
 import json
 import typer
 from datetime import datetime, timezone
-from typing import Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 from zpools import ZPoolsClient
 from rich.console import Console
 
+if TYPE_CHECKING:
+    # Imported where used, so commands that need no cache or store do not load sqlite3 and the stores
+    from zpools import DiskResponseCache, JobIndex, LedgerStore
+
 console = Console()
 
+# Reads served from the on-disk response cache when --max-age (or ZPOOL_CACHE_MAX_AGE) allows
+CACHED_OPERATIONS = ("list_zpools", "list_sshkeys", "list_pats", "get_billing_balance", "list_jobs")
+
 
 def format_timestamp(value: Union[str, datetime, None], use_local_tz: bool = False) -> str:
     """
@@ -136,16 +144,139 @@ def format_error_response(status_code: int, content: bytes, json_mode: bool = Fa
         return decoded
 
 
-def get_authenticated_client(config: dict) -> ZPoolsClient:
+def get_response_cache(config: dict, max_age: Optional[float] = None) -> Optional["DiskResponseCache"]:
+    """
+    Get the on-disk response cache shared by zpcli invocations.
+    
+    The cache lives in ZPOOL_CACHE_DIR, or in a "responses" directory under
+    ZPOOL_TOKEN_CACHE_DIR, with one subdirectory per API URL and account.
+    
+    Args:
+        config: Client configuration dict from build_client_config()
+        max_age: Maximum age in seconds of cached results to use (None = ZPOOL_CACHE_MAX_AGE,
+                 default 0 = always fetch). Responses are stored either way, for
+                 invocations with a larger max age; mutations invalidate them.
+    
+    Returns:
+        DiskResponseCache, or None if no cache directory is configured
+    """
+    from zpools import DiskResponseCache
+
+    cache_dir = _account_cache_dir(config)
+    if cache_dir is None:
+        return None
+    max_age = get_cache_max_age(config, max_age)
+    return DiskResponseCache(cache_dir, ttls={op: max_age for op in CACHED_OPERATIONS})
+
+
+def get_cache_max_age(config: dict, max_age: Optional[float] = None) -> float:
+    """
+    Resolve the maximum age of cached results to use.
+    
+    Args:
+        config: Client configuration dict from build_client_config()
+        max_age: --max-age value (None = ZPOOL_CACHE_MAX_AGE, default 0)
+    
+    Returns:
+        Maximum age in seconds
+    
+    Raises:
+        typer.Exit: If the value is not a non-negative number of seconds
+    """
+    value = max_age if max_age is not None else config.get("cache_max_age")
+    if value is None or value == "":
+        return 0.0
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        seconds = -1.0
+    if not seconds >= 0:
+        source = "--max-age" if max_age is not None else "ZPOOL_CACHE_MAX_AGE"
+        console.print(f"[red]Invalid {source}: {value!r} (expected a number of seconds >= 0)[/red]")
+        raise typer.Exit(1)
+    return seconds
+
+
+def get_job_index(config: dict) -> Optional["JobIndex"]:
+    """
+    Get the local job index shared by zpcli invocations.
+    
+    The index is a SQLite database ("jobs.sqlite3") next to the response cache
+    of the API URL and account (see get_response_cache).
+    
+    Args:
+        config: Client configuration dict from build_client_config()
+    
+    Returns:
+        JobIndex, or None if no cache directory is configured or it cannot be opened
+    """
+    import sqlite3
+    from zpools import JobIndex
+
+    cache_dir = _account_cache_dir(config)
+    if cache_dir is None:
+        return None
+    try:
+        return JobIndex(cache_dir / "jobs.sqlite3")
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def get_ledger_store(config: dict) -> Optional["LedgerStore"]:
+    """
+    Get the local billing ledger store shared by zpcli invocations.
+    
+    The store is a SQLite database ("ledger.sqlite3") next to the job index
+    (see get_job_index).
+    
+    Args:
+        config: Client configuration dict from build_client_config()
+    
+    Returns:
+        LedgerStore, or None if no cache directory is configured or it cannot be opened
+    """
+    import sqlite3
+    from zpools import LedgerStore
+
+    cache_dir = _account_cache_dir(config)
+    if cache_dir is None:
+        return None
+    try:
+        return LedgerStore(cache_dir / "ledger.sqlite3")
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _account_cache_dir(config: dict) -> Optional[Path]:
+    """Cache directory of the configured API URL and account, or None if caching is not configured."""
+    import hashlib
+
+    if config.get("cache_dir"):
+        base_dir = Path(config["cache_dir"])
+    elif config.get("token_cache_dir"):
+        base_dir = Path(config["token_cache_dir"]) / "responses"
+    else:
+        return None
+    
+    identity = "|".join([config["api_url"], config.get("username") or "", config.get("pat") or ""])
+    namespace = hashlib.sha256(identity.encode()).hexdigest()[:16]
+    return base_dir / namespace
+
+
+def get_authenticated_client(config: dict, max_age: Optional[float] = None, no_cache: bool = False) -> ZPoolsClient:
     """
     Get an authenticated ZPoolsClient, prompting for credentials if needed.
     
     Args:
         config: Client configuration dict from build_client_config()
+        max_age: --max-age value: use cached list results up to this many seconds old
+        no_cache: --no-cache flag: always fetch from the API
     
     Returns:
         ZPoolsClient with valid authentication
     """
+    response_cache = get_response_cache(config, 0 if no_cache else max_age)
+    
     # If PAT is provided, use it directly (no password needed)
     if config["pat"]:
         return ZPoolsClient(
@@ -154,6 +285,7 @@ def get_authenticated_client(config: dict) -> ZPoolsClient:
             ssh_host=config["ssh_host"],
             ssh_privkey=config["ssh_privkey"],
             token_cache_dir=config.get("token_cache_dir"),
+            response_cache=response_cache,
         )
     
     # For JWT auth, we need username (password optional if cached token exists)
@@ -182,6 +314,7 @@ def get_authenticated_client(config: dict) -> ZPoolsClient:
         ssh_host=config["ssh_host"],
         ssh_privkey=config["ssh_privkey"],
         token_cache_dir=config.get("token_cache_dir"),
+        response_cache=response_cache,
     )
     
     # Try to authenticate - will use cached token if valid
@@ -192,7 +325,8 @@ def get_authenticated_client(config: dict) -> ZPoolsClient:
         # If authentication failed and we don't have a password, prompt for it
         if not password:
             password = typer.prompt(f"{domain} password", hide_input=True)
-            # Recreate client with password
+            # Recreate client with password (release the unused connection pool first)
+            client.close()
             client = ZPoolsClient(
                 api_url=api_url,
                 username=username,
@@ -201,6 +335,7 @@ def get_authenticated_client(config: dict) -> ZPoolsClient:
                 ssh_host=config["ssh_host"],
                 ssh_privkey=config["ssh_privkey"],
                 token_cache_dir=config.get("token_cache_dir"),
+                response_cache=response_cache,
             )
             client.get_authenticated_client()
             return client
@@ -30,22 +30,20 @@ def wait_for_modify_with_progress(client, zpool_id: str, timeout: int = 1800, po
     
     def poll_api():
         """Poll zpool status."""
+        from zpools.domain import zpools_from_response
+        
         response = client.list_zpools()
         if response.status_code != 200:
             raise RuntimeError(f"Failed to list zpools: {response.status_code}")
         
-        zpools = response.parsed.detail.zpools.to_dict() if response.parsed.detail.zpools else {}
-        zpool = zpools.get(zpool_id)
-        
-        if not zpool:
+        zpool = zpools_from_response(response).get(zpool_id)
+        if zpool is None:
             raise RuntimeError(f"Zpool {zpool_id} not found in list")
-        
-        volumes = zpool.get('Volumes', zpool.get('volumes', []))
-        return {'zpool': zpool, 'volumes': volumes}
+        return zpool
     
     def render_display(state, spinner):
         """Render the modification progress display."""
-        volumes = state['volumes']
+        volumes = state.volumes
         
         # Status line
         status_text = Text()
@@ -62,21 +60,17 @@ def wait_for_modify_with_progress(client, zpool_id: str, timeout: int = 1800, po
         vol_table.add_column("Type", style="magenta", width=8)
         
         for vol in volumes:
-            vol_id = vol.get('VolumeId', vol.get('volume_id', 'N/A'))
-            vol_state = vol.get('State', vol.get('state', 'N/A'))
-            mod_state = vol.get('ModState', vol.get('mod_state', 'none'))
-            mod_progress = vol.get('ModProgress', vol.get('mod_progress', 0))
-            vol_type = vol.get('VolumeType', vol.get('volume_type', 'N/A'))
-            
             # Format progress
-            if mod_state in ('modifying', 'optimizing'):
-                progress_str = f"{mod_progress}%"
-            elif mod_state == 'completed':
+            if vol.is_modifying:
+                progress_str = f"{vol.mod_progress}%"
+            elif vol.mod_state == 'completed':
                 progress_str = "✓ Done"
             else:
                 progress_str = "-"
             
-            vol_table.add_row(vol_id[-12:], vol_state, mod_state, progress_str, vol_type)
+            vol_table.add_row(
+                (vol.volume_id or 'N/A')[-12:], vol.state or 'N/A', vol.mod_state, progress_str, vol.volume_type or 'N/A'
+            )
         
         # Combine into panel
         content = Group(
@@ -91,36 +85,11 @@ def wait_for_modify_with_progress(client, zpool_id: str, timeout: int = 1800, po
     
     def check_complete(state):
         """Check if all modifications are complete."""
-        volumes = state['volumes']
-        
-        # Check if any volumes are actively modifying
-        any_modifying = False
-        all_complete = True
-        
-        for vol in volumes:
-            mod_state = vol.get('ModState', vol.get('mod_state', 'none'))
-            if mod_state in ('modifying', 'optimizing'):
-                any_modifying = True
-                all_complete = False
-                break
-            elif mod_state == 'completed':
-                # At least one was modified
-                pass
-        
-        if not any_modifying:
-            # Check if there were any recent modifications (completed state)
-            has_completed = any(
-                vol.get('ModState', vol.get('mod_state', 'none')) == 'completed'
-                for vol in volumes
-            )
-            
-            if has_completed or all_complete:
-                console.print(f"\n[green]✓ Volume modifications completed successfully![/green]")
-            else:
-                console.print(f"\n[yellow]No active modifications found for ZPool {zpool_id}[/yellow]")
-            return True
+        if state.is_modifying:
+            return False
         
-        return False
+        console.print(f"\n[green]✓ Volume modifications completed successfully![/green]")
+        return True
     
     result = monitor.monitor(poll_api, render_display, check_complete, "Modify operation")
-    return result['zpool']
+    return result.data
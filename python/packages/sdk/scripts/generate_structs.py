@@ -0,0 +1,171 @@
+"""Generate msgspec Struct types for the API's JSON responses.
+
+Reads the OpenAPI spec and writes ``src/zpools/_structs.py``: one
+``msgspec.Struct`` per response object schema, named like the
+openapi-python-client model for the same schema (e.g.
+``GetBillingLedgerResponse200DetailItemsItem``) and with the same snake_case
+attribute names, plus ``RESPONSES`` mapping each generated endpoint module
+name to its struct type per status code.
+
+Struct decoding drops keys the schema does not list, so fields the API is
+known to return without documenting them (_UNDOCUMENTED) are added to the
+schemas they appear in.
+
+Run from the repository root after regenerating the SDK (requires PyYAML):
+
+    python python/packages/sdk/scripts/generate_structs.py
+"""
+import argparse
+import builtins
+import keyword
+import re
+from pathlib import Path
+
+import yaml
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_SPEC = HERE.parents[3] / "spec" / "stage-definition.yaml"
+DEFAULT_OUTPUT = HERE.parent / "src" / "zpools" / "_structs.py"
+
+HEADER = '''"""
+msgspec Struct types for the API's JSON responses.
+
+Generated by scripts/generate_structs.py from spec/stage-definition.yaml; do
+not edit. Class and attribute names match the generated attrs models.
+"""
+import datetime
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class _Struct(msgspec.Struct, kw_only=True, omit_defaults=True, gc=False):
+    """Base of the response structs."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible dict with the API's field names, like the models' to_dict()."""
+        return msgspec.to_builtins(self)
+'''
+
+_SCALARS = {"integer": "int", "number": "float", "boolean": "bool"}
+_FORMATS = {"date-time": "datetime.datetime", "date": "datetime.date"}
+
+# Fields the API returns but the spec does not describe, by struct name; the
+# domain objects (zpools.domain.Job) and LedgerStore depend on them
+_UNDOCUMENTED = {
+    "GetBillingLedgerResponse200DetailItemsItem": {
+        # On storage charges: the rate period they belong to (kept as sent, so
+        # rate keys match those of model mode)
+        "size_gb": {},
+        "volume_type": {"type": "string"},
+        "zpool_id": {"type": "string"},
+    },
+    "GetJobsResponse200DetailJobsItem": {
+        "job_type": {"type": "string"},
+        "current_status": {"type": "object"},
+        # A JSON-encoded string, or an object in some responses
+        "parameters": {},
+    },
+    "GetJobJobIdResponse200Detail": {
+        "job": {"type": "object"},
+    },
+}
+
+# Names openapi-python-client suffixes with "_" (besides keywords)
+_RESERVED = (set(dir(builtins)) | {"self", "true", "false", "datetime"}) - {"id"}
+
+
+def snake_case(name: str) -> str:
+    """Attribute name for a JSON key, as openapi-python-client derives it (CreateTime -> create_time)."""
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"\W+", "_", name).strip("_").lower()
+    return name + "_" if keyword.iskeyword(name) or name in _RESERVED else name
+
+
+def pascal_case(name: str) -> str:
+    """Class name part for a JSON key or module name (time_of_use_charges -> TimeOfUseCharges)."""
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[\W_]+", name) if part)
+
+
+def module_name(method: str, path: str) -> str:
+    """Generated endpoint module name (get /job/{job_id} -> get_job_job_id)."""
+    return f"{method}_{re.sub(r'[^a-z0-9]+', '_', path.lower()).strip('_')}"
+
+
+class Generator:
+    """Collects Struct definitions in dependency order (nested types first)."""
+
+    def __init__(self):
+        self.classes = []
+
+    def annotation(self, schema: dict, name: str) -> str:
+        """Type annotation for schema, defining Struct classes for nested objects under name."""
+        kind = schema.get("type")
+        if kind == "object":
+            if "properties" in schema:
+                return self.define(schema, name)
+            values = schema.get("additionalProperties")
+            if isinstance(values, dict):
+                return f"Dict[str, {self.annotation(values, name + 'AdditionalProperty')}]"
+            return "Dict[str, Any]"
+        if kind == "array":
+            return f"List[{self.annotation(schema.get('items') or {}, name + 'Item')}]"
+        if kind == "string":
+            return _FORMATS.get(schema.get("format"), "str")
+        return _SCALARS.get(kind, "Any")
+
+    def define(self, schema: dict, name: str) -> str:
+        """Emit a Struct class for an object schema and return its name."""
+        lines = [f"class {name}(_Struct):"]
+        if schema.get("description"):
+            description = " ".join(schema["description"].split()).replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'    """{description}"""')
+            lines.append("")
+        properties = {**_UNDOCUMENTED.get(name, {}), **schema["properties"]}
+        for key, prop in sorted(properties.items()):
+            attribute = snake_case(key)
+            annotation = f"Optional[{self.annotation(prop, name + pascal_case(key))}]"
+            if attribute == key:
+                lines.append(f"    {attribute}: {annotation} = None")
+            else:
+                lines.append(f'    {attribute}: {annotation} = msgspec.field(default=None, name="{key}")')
+        self.classes.append("\n".join(lines))
+        return name
+
+
+def generate(spec: dict) -> str:
+    generator = Generator()
+    responses = {}
+    for path, item in spec["paths"].items():
+        for method, operation in item.items():
+            if method == "parameters":
+                continue
+            endpoint = module_name(method, path)
+            for status, response in operation.get("responses", {}).items():
+                schema = response.get("content", {}).get("application/json", {}).get("schema")
+                if not schema or not status.isdigit():
+                    continue
+                name = generator.define(schema, f"{pascal_case(endpoint)}Response{status}")
+                responses.setdefault(endpoint, []).append(f"{status}: {name}")
+
+    mapping = ["# Response struct per generated endpoint module and status code", "RESPONSES = {"]
+    for endpoint, entries in sorted(responses.items()):
+        mapping.append(f'    "{endpoint}": {{{", ".join(entries)}}},')
+    mapping.append("}")
+    return "\n\n\n".join([HEADER.rstrip("\n"), *generator.classes, "\n".join(mapping)]) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", type=Path, default=DEFAULT_SPEC, help="OpenAPI spec (YAML)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Module to write")
+    args = parser.parse_args()
+
+    spec = yaml.safe_load(args.spec.read_text())
+    args.output.write_text(generate(spec))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Generate the request constraints used for client-side validation.
+
+Reads the OpenAPI spec and writes ``src/zpools/_validators.py``: for each
+generated endpoint module name, the constraints (type, format, enum,
+minimum/maximum, ...) of every path and query parameter and every top-level
+JSON body field, keyed by the name the API uses. ``zpools.validation``
+compiles them into checks that run before a request is sent.
+
+Run from the repository root after regenerating the SDK (requires PyYAML):
+
+    python python/packages/sdk/scripts/generate_validators.py
+"""
+import argparse
+import re
+from pathlib import Path
+
+import yaml
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_SPEC = HERE.parents[3] / "spec" / "stage-definition.yaml"
+DEFAULT_OUTPUT = HERE.parent / "src" / "zpools" / "_validators.py"
+
+HEADER = '''"""
+Request constraints for the API's endpoints.
+
+Generated by scripts/generate_validators.py from spec/stage-definition.yaml;
+do not edit. zpools.validation compiles them into checks.
+"""
+'''
+
+# Schema keywords kept in the constraints (descriptions, examples and defaults are dropped)
+_KEYWORDS = (
+    "type", "format", "enum", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+    "minLength", "maxLength", "pattern", "minItems", "maxItems",
+)
+
+
+def module_name(method: str, path: str) -> str:
+    """Generated endpoint module name (get /job/{job_id} -> get_job_job_id)."""
+    return f"{method}_{re.sub(r'[^a-z0-9]+', '_', path.lower()).strip('_')}"
+
+
+def constraint(schema: dict) -> dict:
+    """The validation keywords of a schema, including those of array items and object properties."""
+    rule = {key: schema[key] for key in _KEYWORDS if key in schema}
+    if "items" in schema:
+        rule["items"] = constraint(schema["items"])
+    if "properties" in schema:
+        rule["properties"] = {key: constraint(prop) for key, prop in schema["properties"].items()}
+        if schema.get("required"):
+            rule["required"] = list(schema["required"])
+    return rule
+
+
+def endpoint_constraints(operation: dict, path_parameters: list) -> dict:
+    """Constraints for one operation's arguments: path, query and JSON body fields."""
+    fields = {}
+    # Operation parameters take precedence over the ones declared for the whole path
+    for parameter in operation.get("parameters", []) + path_parameters:
+        if parameter["in"] not in ("path", "query") or parameter["name"] in fields:
+            continue
+        fields[parameter["name"]] = {
+            "in": parameter["in"],
+            "required": bool(parameter.get("required")),
+            **constraint(parameter.get("schema") or {}),
+        }
+    body = operation.get("requestBody", {}).get("content", {}).get("application/json", {}).get("schema")
+    if body:
+        required = set(body.get("required", ()))
+        for key, prop in body.get("properties", {}).items():
+            if key in fields:
+                raise ValueError(f"Body field {key!r} clashes with a parameter of the same name")
+            fields[key] = {"in": "body", "required": key in required, **constraint(prop)}
+    return fields
+
+
+def generate(spec: dict) -> str:
+    constraints = {}
+    for path, item in spec["paths"].items():
+        for method, operation in item.items():
+            if method == "parameters":
+                continue
+            fields = endpoint_constraints(operation, item.get("parameters", []))
+            if fields:
+                constraints[module_name(method, path)] = fields
+
+    lines = ["# Argument constraints per generated endpoint module, keyed by API name", "CONSTRAINTS = {"]
+    for endpoint, fields in sorted(constraints.items()):
+        lines.append(f'    "{endpoint}": {{')
+        lines.extend(f'        "{name}": {rule!r},' for name, rule in fields.items())
+        lines.append("    },")
+    lines.append("}")
+    return HEADER + "\n" + "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", type=Path, default=DEFAULT_SPEC, help="OpenAPI spec (YAML)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Module to write")
+    args = parser.parse_args()
+
+    spec = yaml.safe_load(args.spec.read_text())
+    args.output.write_text(generate(spec))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
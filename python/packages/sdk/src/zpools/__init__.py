@@ -1,2 +1,45 @@
-# Expose the main client
-from .client import ZPoolsClient
+# Expose the main clients
+#
+# Names are imported on first access, so importing zpools (or one of them)
+# does not import the async client, the stores and every other module.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncZPoolsClient
+    from .cache import DiskResponseCache, ResponseCache
+    from .client import ZPoolsClient
+    from .domain import Job, Volume, ZPool
+    from .retry import RetryPolicy, RetryStats
+    from .store import JobIndex, LedgerStore
+    from .validation import ValidationError
+
+_MODULES = {
+    "ZPoolsClient": ".client",
+    "AsyncZPoolsClient": ".async_client",
+    "RetryPolicy": ".retry",
+    "RetryStats": ".retry",
+    "DiskResponseCache": ".cache",
+    "ResponseCache": ".cache",
+    "Job": ".domain",
+    "Volume": ".domain",
+    "ZPool": ".domain",
+    "JobIndex": ".store",
+    "LedgerStore": ".store",
+    "ValidationError": ".validation",
+}
+
+__all__ = tuple(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
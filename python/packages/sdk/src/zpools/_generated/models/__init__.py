@@ -1,82 +1,160 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
 
-from .get_billing_balance_response_200 import GetBillingBalanceResponse200
-from .get_billing_balance_response_200_detail import GetBillingBalanceResponse200Detail
-from .get_billing_balance_response_200_detail_balance import GetBillingBalanceResponse200DetailBalance
-from .get_billing_ledger_response_200 import GetBillingLedgerResponse200
-from .get_billing_ledger_response_200_detail import GetBillingLedgerResponse200Detail
-from .get_billing_ledger_response_200_detail_items_item import GetBillingLedgerResponse200DetailItemsItem
-from .get_billing_summary_response_200 import GetBillingSummaryResponse200
-from .get_billing_summary_response_200_detail import GetBillingSummaryResponse200Detail
-from .get_billing_summary_response_200_detail_summary import GetBillingSummaryResponse200DetailSummary
-from .get_billing_summary_response_200_detail_summary_credits_item import (
-    GetBillingSummaryResponse200DetailSummaryCreditsItem,
-)
-from .get_billing_summary_response_200_detail_summary_period import GetBillingSummaryResponse200DetailSummaryPeriod
-from .get_billing_summary_response_200_detail_summary_storage_charges_item import (
-    GetBillingSummaryResponse200DetailSummaryStorageChargesItem,
-)
-from .get_billing_summary_response_200_detail_summary_time_of_use_charges_item import (
-    GetBillingSummaryResponse200DetailSummaryTimeOfUseChargesItem,
-)
-from .get_billing_summary_response_200_detail_summary_totals import GetBillingSummaryResponse200DetailSummaryTotals
-from .get_hello_response_200 import GetHelloResponse200
-from .get_job_job_id_history_response_200 import GetJobJobIdHistoryResponse200
-from .get_job_job_id_history_response_200_detail import GetJobJobIdHistoryResponse200Detail
-from .get_job_job_id_history_response_200_detail_events_item import GetJobJobIdHistoryResponse200DetailEventsItem
-from .get_job_job_id_response_200 import GetJobJobIdResponse200
-from .get_job_job_id_response_200_detail import GetJobJobIdResponse200Detail
-from .get_jobs_response_200 import GetJobsResponse200
-from .get_jobs_response_200_detail import GetJobsResponse200Detail
-from .get_jobs_response_200_detail_jobs_item import GetJobsResponse200DetailJobsItem
-from .get_jobs_response_200_detail_jobs_item_status import GetJobsResponse200DetailJobsItemStatus
-from .get_jobs_sort import GetJobsSort
-from .get_pat_response_200 import GetPatResponse200
-from .get_pat_response_200_detail import GetPatResponse200Detail
-from .get_pat_response_200_detail_items_item import GetPatResponse200DetailItemsItem
-from .get_sshkey_response_200 import GetSshkeyResponse200
-from .get_sshkey_response_200_detail import GetSshkeyResponse200Detail
-from .get_sshkey_response_200_detail_keys_item import GetSshkeyResponse200DetailKeysItem
-from .get_zpools_response_200 import GetZpoolsResponse200
-from .get_zpools_response_200_detail import GetZpoolsResponse200Detail
-from .get_zpools_response_200_detail_zpools import GetZpoolsResponse200DetailZpools
-from .get_zpools_response_200_detail_zpools_additional_property import (
-    GetZpoolsResponse200DetailZpoolsAdditionalProperty,
-)
-from .get_zpools_response_200_detail_zpools_additional_property_volumes_item import (
-    GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem,
-)
-from .post_codes_claim_body import PostCodesClaimBody
-from .post_codes_claim_body_tos import PostCodesClaimBodyTos
-from .post_codes_claim_response_201 import PostCodesClaimResponse201
-from .post_codes_claim_response_201_detail import PostCodesClaimResponse201Detail
-from .post_codes_claim_response_201_detail_claim import PostCodesClaimResponse201DetailClaim
-from .post_codes_claim_response_428 import PostCodesClaimResponse428
-from .post_codes_claim_response_428_detail import PostCodesClaimResponse428Detail
-from .post_dodo_start_body import PostDodoStartBody
-from .post_dodo_start_response_201 import PostDodoStartResponse201
-from .post_dodo_start_response_201_detail import PostDodoStartResponse201Detail
-from .post_login_body import PostLoginBody
-from .post_login_response_200 import PostLoginResponse200
-from .post_login_response_200_detail import PostLoginResponse200Detail
-from .post_pat_body import PostPatBody
-from .post_pat_response_201 import PostPatResponse201
-from .post_pat_response_201_detail import PostPatResponse201Detail
-from .post_sshkey_body import PostSshkeyBody
-from .post_sshkey_response_201 import PostSshkeyResponse201
-from .post_sshkey_response_201_detail import PostSshkeyResponse201Detail
-from .post_sshkey_response_409 import PostSshkeyResponse409
-from .post_sshkey_response_409_detail import PostSshkeyResponse409Detail
-from .post_zpool_body import PostZpoolBody
-from .post_zpool_body_new_size_in_gib import PostZpoolBodyNewSizeInGib
-from .post_zpool_body_volume_type import PostZpoolBodyVolumeType
-from .post_zpool_response_202 import PostZpoolResponse202
-from .post_zpool_response_202_detail import PostZpoolResponse202Detail
-from .post_zpool_zpool_id_expand_body import PostZpoolZpoolIdExpandBody
-from .post_zpool_zpool_id_modify_body import PostZpoolZpoolIdModifyBody
-from .post_zpool_zpool_id_modify_body_volume_type import PostZpoolZpoolIdModifyBodyVolumeType
-from .post_zpool_zpool_id_scrub_response_202 import PostZpoolZpoolIdScrubResponse202
-from .post_zpool_zpool_id_scrub_response_202_detail import PostZpoolZpoolIdScrubResponse202Detail
+Models are imported on first access, so using one endpoint does not import
+every model module.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .get_billing_balance_response_200 import GetBillingBalanceResponse200
+    from .get_billing_balance_response_200_detail import GetBillingBalanceResponse200Detail
+    from .get_billing_balance_response_200_detail_balance import GetBillingBalanceResponse200DetailBalance
+    from .get_billing_ledger_response_200 import GetBillingLedgerResponse200
+    from .get_billing_ledger_response_200_detail import GetBillingLedgerResponse200Detail
+    from .get_billing_ledger_response_200_detail_items_item import GetBillingLedgerResponse200DetailItemsItem
+    from .get_billing_summary_response_200 import GetBillingSummaryResponse200
+    from .get_billing_summary_response_200_detail import GetBillingSummaryResponse200Detail
+    from .get_billing_summary_response_200_detail_summary import GetBillingSummaryResponse200DetailSummary
+    from .get_billing_summary_response_200_detail_summary_credits_item import (
+        GetBillingSummaryResponse200DetailSummaryCreditsItem,
+    )
+    from .get_billing_summary_response_200_detail_summary_period import GetBillingSummaryResponse200DetailSummaryPeriod
+    from .get_billing_summary_response_200_detail_summary_storage_charges_item import (
+        GetBillingSummaryResponse200DetailSummaryStorageChargesItem,
+    )
+    from .get_billing_summary_response_200_detail_summary_time_of_use_charges_item import (
+        GetBillingSummaryResponse200DetailSummaryTimeOfUseChargesItem,
+    )
+    from .get_billing_summary_response_200_detail_summary_totals import GetBillingSummaryResponse200DetailSummaryTotals
+    from .get_hello_response_200 import GetHelloResponse200
+    from .get_job_job_id_history_response_200 import GetJobJobIdHistoryResponse200
+    from .get_job_job_id_history_response_200_detail import GetJobJobIdHistoryResponse200Detail
+    from .get_job_job_id_history_response_200_detail_events_item import GetJobJobIdHistoryResponse200DetailEventsItem
+    from .get_job_job_id_response_200 import GetJobJobIdResponse200
+    from .get_job_job_id_response_200_detail import GetJobJobIdResponse200Detail
+    from .get_jobs_response_200 import GetJobsResponse200
+    from .get_jobs_response_200_detail import GetJobsResponse200Detail
+    from .get_jobs_response_200_detail_jobs_item import GetJobsResponse200DetailJobsItem
+    from .get_jobs_response_200_detail_jobs_item_status import GetJobsResponse200DetailJobsItemStatus
+    from .get_jobs_sort import GetJobsSort
+    from .get_pat_response_200 import GetPatResponse200
+    from .get_pat_response_200_detail import GetPatResponse200Detail
+    from .get_pat_response_200_detail_items_item import GetPatResponse200DetailItemsItem
+    from .get_sshkey_response_200 import GetSshkeyResponse200
+    from .get_sshkey_response_200_detail import GetSshkeyResponse200Detail
+    from .get_sshkey_response_200_detail_keys_item import GetSshkeyResponse200DetailKeysItem
+    from .get_zpools_response_200 import GetZpoolsResponse200
+    from .get_zpools_response_200_detail import GetZpoolsResponse200Detail
+    from .get_zpools_response_200_detail_zpools import GetZpoolsResponse200DetailZpools
+    from .get_zpools_response_200_detail_zpools_additional_property import (
+        GetZpoolsResponse200DetailZpoolsAdditionalProperty,
+    )
+    from .get_zpools_response_200_detail_zpools_additional_property_volumes_item import (
+        GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem,
+    )
+    from .post_codes_claim_body import PostCodesClaimBody
+    from .post_codes_claim_body_tos import PostCodesClaimBodyTos
+    from .post_codes_claim_response_201 import PostCodesClaimResponse201
+    from .post_codes_claim_response_201_detail import PostCodesClaimResponse201Detail
+    from .post_codes_claim_response_201_detail_claim import PostCodesClaimResponse201DetailClaim
+    from .post_codes_claim_response_428 import PostCodesClaimResponse428
+    from .post_codes_claim_response_428_detail import PostCodesClaimResponse428Detail
+    from .post_dodo_start_body import PostDodoStartBody
+    from .post_dodo_start_response_201 import PostDodoStartResponse201
+    from .post_dodo_start_response_201_detail import PostDodoStartResponse201Detail
+    from .post_login_body import PostLoginBody
+    from .post_login_response_200 import PostLoginResponse200
+    from .post_login_response_200_detail import PostLoginResponse200Detail
+    from .post_pat_body import PostPatBody
+    from .post_pat_response_201 import PostPatResponse201
+    from .post_pat_response_201_detail import PostPatResponse201Detail
+    from .post_sshkey_body import PostSshkeyBody
+    from .post_sshkey_response_201 import PostSshkeyResponse201
+    from .post_sshkey_response_201_detail import PostSshkeyResponse201Detail
+    from .post_sshkey_response_409 import PostSshkeyResponse409
+    from .post_sshkey_response_409_detail import PostSshkeyResponse409Detail
+    from .post_zpool_body import PostZpoolBody
+    from .post_zpool_body_new_size_in_gib import PostZpoolBodyNewSizeInGib
+    from .post_zpool_body_volume_type import PostZpoolBodyVolumeType
+    from .post_zpool_response_202 import PostZpoolResponse202
+    from .post_zpool_response_202_detail import PostZpoolResponse202Detail
+    from .post_zpool_zpool_id_expand_body import PostZpoolZpoolIdExpandBody
+    from .post_zpool_zpool_id_modify_body import PostZpoolZpoolIdModifyBody
+    from .post_zpool_zpool_id_modify_body_volume_type import PostZpoolZpoolIdModifyBodyVolumeType
+    from .post_zpool_zpool_id_scrub_response_202 import PostZpoolZpoolIdScrubResponse202
+    from .post_zpool_zpool_id_scrub_response_202_detail import PostZpoolZpoolIdScrubResponse202Detail
+
+_MODULES = {
+    "GetBillingBalanceResponse200": ".get_billing_balance_response_200",
+    "GetBillingBalanceResponse200Detail": ".get_billing_balance_response_200_detail",
+    "GetBillingBalanceResponse200DetailBalance": ".get_billing_balance_response_200_detail_balance",
+    "GetBillingLedgerResponse200": ".get_billing_ledger_response_200",
+    "GetBillingLedgerResponse200Detail": ".get_billing_ledger_response_200_detail",
+    "GetBillingLedgerResponse200DetailItemsItem": ".get_billing_ledger_response_200_detail_items_item",
+    "GetBillingSummaryResponse200": ".get_billing_summary_response_200",
+    "GetBillingSummaryResponse200Detail": ".get_billing_summary_response_200_detail",
+    "GetBillingSummaryResponse200DetailSummary": ".get_billing_summary_response_200_detail_summary",
+    "GetBillingSummaryResponse200DetailSummaryCreditsItem": ".get_billing_summary_response_200_detail_summary_credits_item",
+    "GetBillingSummaryResponse200DetailSummaryPeriod": ".get_billing_summary_response_200_detail_summary_period",
+    "GetBillingSummaryResponse200DetailSummaryStorageChargesItem": ".get_billing_summary_response_200_detail_summary_storage_charges_item",
+    "GetBillingSummaryResponse200DetailSummaryTimeOfUseChargesItem": ".get_billing_summary_response_200_detail_summary_time_of_use_charges_item",
+    "GetBillingSummaryResponse200DetailSummaryTotals": ".get_billing_summary_response_200_detail_summary_totals",
+    "GetHelloResponse200": ".get_hello_response_200",
+    "GetJobJobIdHistoryResponse200": ".get_job_job_id_history_response_200",
+    "GetJobJobIdHistoryResponse200Detail": ".get_job_job_id_history_response_200_detail",
+    "GetJobJobIdHistoryResponse200DetailEventsItem": ".get_job_job_id_history_response_200_detail_events_item",
+    "GetJobJobIdResponse200": ".get_job_job_id_response_200",
+    "GetJobJobIdResponse200Detail": ".get_job_job_id_response_200_detail",
+    "GetJobsResponse200": ".get_jobs_response_200",
+    "GetJobsResponse200Detail": ".get_jobs_response_200_detail",
+    "GetJobsResponse200DetailJobsItem": ".get_jobs_response_200_detail_jobs_item",
+    "GetJobsResponse200DetailJobsItemStatus": ".get_jobs_response_200_detail_jobs_item_status",
+    "GetJobsSort": ".get_jobs_sort",
+    "GetPatResponse200": ".get_pat_response_200",
+    "GetPatResponse200Detail": ".get_pat_response_200_detail",
+    "GetPatResponse200DetailItemsItem": ".get_pat_response_200_detail_items_item",
+    "GetSshkeyResponse200": ".get_sshkey_response_200",
+    "GetSshkeyResponse200Detail": ".get_sshkey_response_200_detail",
+    "GetSshkeyResponse200DetailKeysItem": ".get_sshkey_response_200_detail_keys_item",
+    "GetZpoolsResponse200": ".get_zpools_response_200",
+    "GetZpoolsResponse200Detail": ".get_zpools_response_200_detail",
+    "GetZpoolsResponse200DetailZpools": ".get_zpools_response_200_detail_zpools",
+    "GetZpoolsResponse200DetailZpoolsAdditionalProperty": ".get_zpools_response_200_detail_zpools_additional_property",
+    "GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem": ".get_zpools_response_200_detail_zpools_additional_property_volumes_item",
+    "PostCodesClaimBody": ".post_codes_claim_body",
+    "PostCodesClaimBodyTos": ".post_codes_claim_body_tos",
+    "PostCodesClaimResponse201": ".post_codes_claim_response_201",
+    "PostCodesClaimResponse201Detail": ".post_codes_claim_response_201_detail",
+    "PostCodesClaimResponse201DetailClaim": ".post_codes_claim_response_201_detail_claim",
+    "PostCodesClaimResponse428": ".post_codes_claim_response_428",
+    "PostCodesClaimResponse428Detail": ".post_codes_claim_response_428_detail",
+    "PostDodoStartBody": ".post_dodo_start_body",
+    "PostDodoStartResponse201": ".post_dodo_start_response_201",
+    "PostDodoStartResponse201Detail": ".post_dodo_start_response_201_detail",
+    "PostLoginBody": ".post_login_body",
+    "PostLoginResponse200": ".post_login_response_200",
+    "PostLoginResponse200Detail": ".post_login_response_200_detail",
+    "PostPatBody": ".post_pat_body",
+    "PostPatResponse201": ".post_pat_response_201",
+    "PostPatResponse201Detail": ".post_pat_response_201_detail",
+    "PostSshkeyBody": ".post_sshkey_body",
+    "PostSshkeyResponse201": ".post_sshkey_response_201",
+    "PostSshkeyResponse201Detail": ".post_sshkey_response_201_detail",
+    "PostSshkeyResponse409": ".post_sshkey_response_409",
+    "PostSshkeyResponse409Detail": ".post_sshkey_response_409_detail",
+    "PostZpoolBody": ".post_zpool_body",
+    "PostZpoolBodyNewSizeInGib": ".post_zpool_body_new_size_in_gib",
+    "PostZpoolBodyVolumeType": ".post_zpool_body_volume_type",
+    "PostZpoolResponse202": ".post_zpool_response_202",
+    "PostZpoolResponse202Detail": ".post_zpool_response_202_detail",
+    "PostZpoolZpoolIdExpandBody": ".post_zpool_zpool_id_expand_body",
+    "PostZpoolZpoolIdModifyBody": ".post_zpool_zpool_id_modify_body",
+    "PostZpoolZpoolIdModifyBodyVolumeType": ".post_zpool_zpool_id_modify_body_volume_type",
+    "PostZpoolZpoolIdScrubResponse202": ".post_zpool_zpool_id_scrub_response_202",
+    "PostZpoolZpoolIdScrubResponse202Detail": ".post_zpool_zpool_id_scrub_response_202_detail",
+}
 
 __all__ = (
     "GetBillingBalanceResponse200",
@@ -147,3 +225,16 @@ __all__ = (
     "PostZpoolZpoolIdScrubResponse202",
     "PostZpoolZpoolIdScrubResponse202Detail",
 )
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetBillingBalanceResponse200Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetBillingBalanceResponse200Detail:
     """
     Attributes:
@@ -23,7 +23,9 @@ class GetBillingBalanceResponse200Detail:
     """
 
     balance: GetBillingBalanceResponse200DetailBalance | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         balance: dict[str, Any] | Unset = UNSET
@@ -31,7 +33,8 @@ class GetBillingBalanceResponse200Detail:
             balance = self.balance.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if balance is not UNSET:
             field_dict["balance"] = balance
@@ -54,12 +57,23 @@ class GetBillingBalanceResponse200Detail:
             balance=balance,
         )
 
-        get_billing_balance_response_200_detail.additional_properties = d
+        if d:
+            get_billing_balance_response_200_detail._additional_properties = d
         return get_billing_balance_response_200_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -71,4 +85,4 @@ class GetBillingBalanceResponse200Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
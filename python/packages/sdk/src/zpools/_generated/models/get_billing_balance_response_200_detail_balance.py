@@ -13,7 +13,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetBillingBalanceResponse200DetailBalance")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetBillingBalanceResponse200DetailBalance:
     """
     Attributes:
@@ -31,7 +31,9 @@ class GetBillingBalanceResponse200DetailBalance:
     last_transaction: datetime.datetime | None | Unset = UNSET
     last_update_ts: datetime.datetime | Unset = UNSET
     markup_bps: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         balance_usd = self.balance_usd
@@ -61,7 +63,8 @@ class GetBillingBalanceResponse200DetailBalance:
         markup_bps = self.markup_bps
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if balance_usd is not UNSET:
             field_dict["balance_usd"] = balance_usd
@@ -137,12 +140,23 @@ class GetBillingBalanceResponse200DetailBalance:
             markup_bps=markup_bps,
         )
 
-        get_billing_balance_response_200_detail_balance.additional_properties = d
+        if d:
+            get_billing_balance_response_200_detail_balance._additional_properties = d
         return get_billing_balance_response_200_detail_balance
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -154,4 +168,4 @@ class GetBillingBalanceResponse200DetailBalance:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetBillingLedgerResponse200DetailItemsItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetBillingLedgerResponse200DetailItemsItem:
     """
     Attributes:
@@ -34,7 +34,9 @@ class GetBillingLedgerResponse200DetailItemsItem:
     note: str | Unset = UNSET
     posted_ts: str | Unset = UNSET
     source: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         amount_usd = self.amount_usd
@@ -54,7 +56,8 @@ class GetBillingLedgerResponse200DetailItemsItem:
         source = self.source
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if amount_usd is not UNSET:
             field_dict["amount_usd"] = amount_usd
@@ -105,12 +108,23 @@ class GetBillingLedgerResponse200DetailItemsItem:
             source=source,
         )
 
-        get_billing_ledger_response_200_detail_items_item.additional_properties = d
+        if d:
+            get_billing_ledger_response_200_detail_items_item._additional_properties = d
         return get_billing_ledger_response_200_detail_items_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -122,4 +136,4 @@ class GetBillingLedgerResponse200DetailItemsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetBillingSummaryResponse200DetailSummary")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetBillingSummaryResponse200DetailSummary:
     """
     Attributes:
@@ -45,7 +45,9 @@ class GetBillingSummaryResponse200DetailSummary:
     storage_charges: list[GetBillingSummaryResponse200DetailSummaryStorageChargesItem] | Unset = UNSET
     time_of_use_charges: list[GetBillingSummaryResponse200DetailSummaryTimeOfUseChargesItem] | Unset = UNSET
     totals: GetBillingSummaryResponse200DetailSummaryTotals | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         credits_: list[dict[str, Any]] | Unset = UNSET
@@ -78,7 +80,8 @@ class GetBillingSummaryResponse200DetailSummary:
             totals = self.totals.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if credits_ is not UNSET:
             field_dict["credits"] = credits_
@@ -165,12 +168,23 @@ class GetBillingSummaryResponse200DetailSummary:
             totals=totals,
         )
 
-        get_billing_summary_response_200_detail_summary.additional_properties = d
+        if d:
+            get_billing_summary_response_200_detail_summary._additional_properties = d
         return get_billing_summary_response_200_detail_summary
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -182,4 +196,4 @@ class GetBillingSummaryResponse200DetailSummary:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
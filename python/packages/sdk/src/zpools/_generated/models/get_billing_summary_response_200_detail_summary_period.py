@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetBillingSummaryResponse200DetailSummaryPeriod")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetBillingSummaryResponse200DetailSummaryPeriod:
     """
     Attributes:
@@ -21,7 +21,9 @@ class GetBillingSummaryResponse200DetailSummaryPeriod:
 
     from_date: str | Unset = UNSET
     to_date: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         from_date = self.from_date
@@ -29,7 +31,8 @@ class GetBillingSummaryResponse200DetailSummaryPeriod:
         to_date = self.to_date
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if from_date is not UNSET:
             field_dict["from_date"] = from_date
@@ -50,12 +53,23 @@ class GetBillingSummaryResponse200DetailSummaryPeriod:
             to_date=to_date,
         )
 
-        get_billing_summary_response_200_detail_summary_period.additional_properties = d
+        if d:
+            get_billing_summary_response_200_detail_summary_period._additional_properties = d
         return get_billing_summary_response_200_detail_summary_period
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -67,4 +81,4 @@ class GetBillingSummaryResponse200DetailSummaryPeriod:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
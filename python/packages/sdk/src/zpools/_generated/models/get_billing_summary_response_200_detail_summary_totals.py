@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetBillingSummaryResponse200DetailSummaryTotals")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetBillingSummaryResponse200DetailSummaryTotals:
     """
     Attributes:
@@ -27,7 +27,9 @@ class GetBillingSummaryResponse200DetailSummaryTotals:
     period_net: float | Unset = UNSET
     storage_charges: float | Unset = UNSET
     time_of_use_charges: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         credits_applied = self.credits_applied
@@ -41,7 +43,8 @@ class GetBillingSummaryResponse200DetailSummaryTotals:
         time_of_use_charges = self.time_of_use_charges
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if credits_applied is not UNSET:
             field_dict["credits_applied"] = credits_applied
@@ -77,12 +80,23 @@ class GetBillingSummaryResponse200DetailSummaryTotals:
             time_of_use_charges=time_of_use_charges,
         )
 
-        get_billing_summary_response_200_detail_summary_totals.additional_properties = d
+        if d:
+            get_billing_summary_response_200_detail_summary_totals._additional_properties = d
         return get_billing_summary_response_200_detail_summary_totals
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -94,4 +108,4 @@ class GetBillingSummaryResponse200DetailSummaryTotals:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
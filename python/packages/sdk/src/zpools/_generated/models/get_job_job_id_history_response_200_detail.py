@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetJobJobIdHistoryResponse200Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetJobJobIdHistoryResponse200Detail:
     """
     Attributes:
@@ -25,7 +25,9 @@ class GetJobJobIdHistoryResponse200Detail:
     """
 
     events: list[GetJobJobIdHistoryResponse200DetailEventsItem] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         events: list[dict[str, Any]] | Unset = UNSET
@@ -36,7 +38,8 @@ class GetJobJobIdHistoryResponse200Detail:
                 events.append(events_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if events is not UNSET:
             field_dict["events"] = events
@@ -63,12 +66,23 @@ class GetJobJobIdHistoryResponse200Detail:
             events=events,
         )
 
-        get_job_job_id_history_response_200_detail.additional_properties = d
+        if d:
+            get_job_job_id_history_response_200_detail._additional_properties = d
         return get_job_job_id_history_response_200_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -80,4 +94,4 @@ class GetJobJobIdHistoryResponse200Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
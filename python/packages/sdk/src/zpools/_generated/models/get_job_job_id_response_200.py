@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetJobJobIdResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetJobJobIdResponse200:
     """
     Attributes:
@@ -25,7 +25,9 @@ class GetJobJobIdResponse200:
 
     detail: GetJobJobIdResponse200Detail | Unset = UNSET
     message: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         detail: dict[str, Any] | Unset = UNSET
@@ -35,7 +37,8 @@ class GetJobJobIdResponse200:
         message = self.message
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if detail is not UNSET:
             field_dict["detail"] = detail
@@ -63,12 +66,23 @@ class GetJobJobIdResponse200:
             message=message,
         )
 
-        get_job_job_id_response_200.additional_properties = d
+        if d:
+            get_job_job_id_response_200._additional_properties = d
         return get_job_job_id_response_200
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -80,4 +94,4 @@ class GetJobJobIdResponse200:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetJobJobIdResponse200Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetJobJobIdResponse200Detail:
     """
     Attributes:
@@ -25,7 +25,9 @@ class GetJobJobIdResponse200Detail:
     job_id: str | Unset = UNSET
     progress: int | Unset = UNSET
     status: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         error = self.error
@@ -37,7 +39,8 @@ class GetJobJobIdResponse200Detail:
         status = self.status
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if error is not UNSET:
             field_dict["error"] = error
@@ -68,12 +71,23 @@ class GetJobJobIdResponse200Detail:
             status=status,
         )
 
-        get_job_job_id_response_200_detail.additional_properties = d
+        if d:
+            get_job_job_id_response_200_detail._additional_properties = d
         return get_job_job_id_response_200_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -85,4 +99,4 @@ class GetJobJobIdResponse200Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -14,7 +14,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetJobsResponse200DetailJobsItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetJobsResponse200DetailJobsItem:
     """
     Attributes:
@@ -33,7 +33,9 @@ class GetJobsResponse200DetailJobsItem:
     status: GetJobsResponse200DetailJobsItemStatus | Unset = UNSET
     updated_at: datetime.datetime | Unset = UNSET
     zpool_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         created_at: str | Unset = UNSET
@@ -55,7 +57,8 @@ class GetJobsResponse200DetailJobsItem:
         zpool_id = self.zpool_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if created_at is not UNSET:
             field_dict["created_at"] = created_at
@@ -111,12 +114,23 @@ class GetJobsResponse200DetailJobsItem:
             zpool_id=zpool_id,
         )
 
-        get_jobs_response_200_detail_jobs_item.additional_properties = d
+        if d:
+            get_jobs_response_200_detail_jobs_item._additional_properties = d
         return get_jobs_response_200_detail_jobs_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -128,4 +142,4 @@ class GetJobsResponse200DetailJobsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -13,7 +13,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetPatResponse200DetailItemsItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetPatResponse200DetailItemsItem:
     """
     Attributes:
@@ -43,7 +43,9 @@ class GetPatResponse200DetailItemsItem:
     status: str | Unset = UNSET
     token_ver: int | Unset = UNSET
     usage_count: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         created_at: str | Unset = UNSET
@@ -85,7 +87,8 @@ class GetPatResponse200DetailItemsItem:
         usage_count = self.usage_count
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if created_at is not UNSET:
             field_dict["created_at"] = created_at
@@ -186,12 +189,23 @@ class GetPatResponse200DetailItemsItem:
             usage_count=usage_count,
         )
 
-        get_pat_response_200_detail_items_item.additional_properties = d
+        if d:
+            get_pat_response_200_detail_items_item._additional_properties = d
         return get_pat_response_200_detail_items_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -203,4 +217,4 @@ class GetPatResponse200DetailItemsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
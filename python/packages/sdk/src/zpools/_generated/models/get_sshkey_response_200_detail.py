@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetSshkeyResponse200Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetSshkeyResponse200Detail:
     """
     Attributes:
@@ -23,7 +23,9 @@ class GetSshkeyResponse200Detail:
     """
 
     keys: list[GetSshkeyResponse200DetailKeysItem] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         keys: list[dict[str, Any]] | Unset = UNSET
@@ -34,7 +36,8 @@ class GetSshkeyResponse200Detail:
                 keys.append(keys_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if keys is not UNSET:
             field_dict["keys"] = keys
@@ -59,12 +62,23 @@ class GetSshkeyResponse200Detail:
             keys=keys,
         )
 
-        get_sshkey_response_200_detail.additional_properties = d
+        if d:
+            get_sshkey_response_200_detail._additional_properties = d
         return get_sshkey_response_200_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -76,4 +90,4 @@ class GetSshkeyResponse200Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -13,7 +13,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetSshkeyResponse200DetailKeysItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetSshkeyResponse200DetailKeysItem:
     """
     Attributes:
@@ -25,7 +25,9 @@ class GetSshkeyResponse200DetailKeysItem:
     created_at: datetime.datetime | Unset = UNSET
     pubkey: str | Unset = UNSET
     pubkey_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         created_at: str | Unset = UNSET
@@ -37,7 +39,8 @@ class GetSshkeyResponse200DetailKeysItem:
         pubkey_id = self.pubkey_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if created_at is not UNSET:
             field_dict["created_at"] = created_at
@@ -68,12 +71,23 @@ class GetSshkeyResponse200DetailKeysItem:
             pubkey_id=pubkey_id,
         )
 
-        get_sshkey_response_200_detail_keys_item.additional_properties = d
+        if d:
+            get_sshkey_response_200_detail_keys_item._additional_properties = d
         return get_sshkey_response_200_detail_keys_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -85,4 +99,4 @@ class GetSshkeyResponse200DetailKeysItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
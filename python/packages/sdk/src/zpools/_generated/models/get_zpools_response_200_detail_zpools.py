@@ -15,17 +15,17 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetZpoolsResponse200DetailZpools")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetZpoolsResponse200DetailZpools:
     """Dictionary of zpools keyed by zpool_id"""
 
-    additional_properties: dict[str, GetZpoolsResponse200DetailZpoolsAdditionalProperty] = _attrs_field(
-        init=False, factory=dict
+    _additional_properties: dict[str, GetZpoolsResponse200DetailZpoolsAdditionalProperty] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
     )
 
     def to_dict(self) -> dict[str, Any]:
         field_dict: dict[str, Any] = {}
-        for prop_name, prop in self.additional_properties.items():
+        for prop_name, prop in (self._additional_properties or {}).items():
             field_dict[prop_name] = prop.to_dict()
 
         return field_dict
@@ -45,12 +45,23 @@ class GetZpoolsResponse200DetailZpools:
 
             additional_properties[prop_name] = additional_property
 
-        get_zpools_response_200_detail_zpools.additional_properties = additional_properties
+        if additional_properties:
+            get_zpools_response_200_detail_zpools._additional_properties = additional_properties
         return get_zpools_response_200_detail_zpools
 
+    @property
+    def additional_properties(self) -> dict[str, GetZpoolsResponse200DetailZpoolsAdditionalProperty]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, GetZpoolsResponse200DetailZpoolsAdditionalProperty]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> GetZpoolsResponse200DetailZpoolsAdditionalProperty:
         return self.additional_properties[key]
@@ -62,4 +73,4 @@ class GetZpoolsResponse200DetailZpools:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
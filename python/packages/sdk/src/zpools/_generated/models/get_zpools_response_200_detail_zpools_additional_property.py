@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="GetZpoolsResponse200DetailZpoolsAdditionalProperty")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetZpoolsResponse200DetailZpoolsAdditionalProperty:
     """
     Attributes:
@@ -35,7 +35,9 @@ class GetZpoolsResponse200DetailZpoolsAdditionalProperty:
     username: str | Unset = UNSET
     volume_count: int | Unset = UNSET
     volumes: list[GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         create_time: str | Unset = UNSET
@@ -62,7 +64,8 @@ class GetZpoolsResponse200DetailZpoolsAdditionalProperty:
                 volumes.append(volumes_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if create_time is not UNSET:
             field_dict["CreateTime"] = create_time
@@ -131,12 +134,23 @@ class GetZpoolsResponse200DetailZpoolsAdditionalProperty:
             volumes=volumes,
         )
 
-        get_zpools_response_200_detail_zpools_additional_property.additional_properties = d
+        if d:
+            get_zpools_response_200_detail_zpools_additional_property._additional_properties = d
         return get_zpools_response_200_detail_zpools_additional_property
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -148,4 +162,4 @@ class GetZpoolsResponse200DetailZpoolsAdditionalProperty:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
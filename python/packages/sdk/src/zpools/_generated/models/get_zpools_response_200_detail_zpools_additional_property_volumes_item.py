@@ -13,7 +13,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem:
     """
     Attributes:
@@ -35,7 +35,9 @@ class GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem:
     size: int | Unset = UNSET
     state: str | Unset = UNSET
     volume_type: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         can_modify_now = self.can_modify_now
@@ -67,7 +69,8 @@ class GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem:
         volume_type = self.volume_type
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if can_modify_now is not UNSET:
             field_dict["CanModifyNow"] = can_modify_now
@@ -145,12 +148,23 @@ class GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem:
             volume_type=volume_type,
         )
 
-        get_zpools_response_200_detail_zpools_additional_property_volumes_item.additional_properties = d
+        if d:
+            get_zpools_response_200_detail_zpools_additional_property_volumes_item._additional_properties = d
         return get_zpools_response_200_detail_zpools_additional_property_volumes_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -162,4 +176,4 @@ class GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="PostCodesClaimBody")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostCodesClaimBody:
     """
     Attributes:
@@ -25,7 +25,9 @@ class PostCodesClaimBody:
 
     code: str
     tos: PostCodesClaimBodyTos | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         code = self.code
@@ -35,7 +37,8 @@ class PostCodesClaimBody:
             tos = self.tos.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "code": code,
@@ -65,12 +68,23 @@ class PostCodesClaimBody:
             tos=tos,
         )
 
-        post_codes_claim_body.additional_properties = d
+        if d:
+            post_codes_claim_body._additional_properties = d
         return post_codes_claim_body
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -82,4 +96,4 @@ class PostCodesClaimBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
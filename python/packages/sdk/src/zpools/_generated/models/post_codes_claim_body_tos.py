@@ -13,7 +13,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PostCodesClaimBodyTos")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostCodesClaimBodyTos:
     """Terms of Service acceptance (required if code requires ToS)
 
@@ -24,7 +24,9 @@ class PostCodesClaimBodyTos:
 
     accepted_at: datetime.datetime | Unset = UNSET
     url: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         accepted_at: str | Unset = UNSET
@@ -34,7 +36,8 @@ class PostCodesClaimBodyTos:
         url = self.url
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if accepted_at is not UNSET:
             field_dict["accepted_at"] = accepted_at
@@ -60,12 +63,23 @@ class PostCodesClaimBodyTos:
             url=url,
         )
 
-        post_codes_claim_body_tos.additional_properties = d
+        if d:
+            post_codes_claim_body_tos._additional_properties = d
         return post_codes_claim_body_tos
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -77,4 +91,4 @@ class PostCodesClaimBodyTos:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="PostCodesClaimResponse201Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostCodesClaimResponse201Detail:
     """
     Attributes:
@@ -29,7 +29,9 @@ class PostCodesClaimResponse201Detail:
     claim: PostCodesClaimResponse201DetailClaim | Unset = UNSET
     dev_mode: bool | Unset = UNSET
     pool_remaining_cents: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         balance_after_cents = self.balance_after_cents
@@ -43,7 +45,8 @@ class PostCodesClaimResponse201Detail:
         pool_remaining_cents = self.pool_remaining_cents
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if balance_after_cents is not UNSET:
             field_dict["balance_after_cents"] = balance_after_cents
@@ -81,12 +84,23 @@ class PostCodesClaimResponse201Detail:
             pool_remaining_cents=pool_remaining_cents,
         )
 
-        post_codes_claim_response_201_detail.additional_properties = d
+        if d:
+            post_codes_claim_response_201_detail._additional_properties = d
         return post_codes_claim_response_201_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -98,4 +112,4 @@ class PostCodesClaimResponse201Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PostCodesClaimResponse201DetailClaim")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostCodesClaimResponse201DetailClaim:
     """
     Attributes:
@@ -25,7 +25,9 @@ class PostCodesClaimResponse201DetailClaim:
     code: str | Unset = UNSET
     code_type: str | Unset = UNSET
     joined_group: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         amount_cents = self.amount_cents
@@ -37,7 +39,8 @@ class PostCodesClaimResponse201DetailClaim:
         joined_group = self.joined_group
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if amount_cents is not UNSET:
             field_dict["amount_cents"] = amount_cents
@@ -68,12 +71,23 @@ class PostCodesClaimResponse201DetailClaim:
             joined_group=joined_group,
         )
 
-        post_codes_claim_response_201_detail_claim.additional_properties = d
+        if d:
+            post_codes_claim_response_201_detail_claim._additional_properties = d
         return post_codes_claim_response_201_detail_claim
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -85,4 +99,4 @@ class PostCodesClaimResponse201DetailClaim:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
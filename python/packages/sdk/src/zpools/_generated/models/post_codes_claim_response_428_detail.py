@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PostCodesClaimResponse428Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostCodesClaimResponse428Detail:
     """
     Attributes:
@@ -19,13 +19,16 @@ class PostCodesClaimResponse428Detail:
     """
 
     tos_url: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         tos_url = self.tos_url
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if tos_url is not UNSET:
             field_dict["tos_url"] = tos_url
@@ -41,12 +44,23 @@ class PostCodesClaimResponse428Detail:
             tos_url=tos_url,
         )
 
-        post_codes_claim_response_428_detail.additional_properties = d
+        if d:
+            post_codes_claim_response_428_detail._additional_properties = d
         return post_codes_claim_response_428_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -58,4 +72,4 @@ class PostCodesClaimResponse428Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
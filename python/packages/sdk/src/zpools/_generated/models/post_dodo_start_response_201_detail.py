@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PostDodoStartResponse201Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostDodoStartResponse201Detail:
     """
     Attributes:
@@ -21,7 +21,9 @@ class PostDodoStartResponse201Detail:
 
     payment_link: str | Unset = UNSET
     purchase_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         payment_link = self.payment_link
@@ -29,7 +31,8 @@ class PostDodoStartResponse201Detail:
         purchase_id = self.purchase_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if payment_link is not UNSET:
             field_dict["payment_link"] = payment_link
@@ -50,12 +53,23 @@ class PostDodoStartResponse201Detail:
             purchase_id=purchase_id,
         )
 
-        post_dodo_start_response_201_detail.additional_properties = d
+        if d:
+            post_dodo_start_response_201_detail._additional_properties = d
         return post_dodo_start_response_201_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -67,4 +81,4 @@ class PostDodoStartResponse201Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
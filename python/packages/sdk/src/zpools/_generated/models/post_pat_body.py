@@ -13,7 +13,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PostPatBody")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostPatBody:
     """
     Attributes:
@@ -27,7 +27,9 @@ class PostPatBody:
     expiry: datetime.date | Unset = UNSET
     scopes: list[str] | Unset = UNSET
     tenant_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         label = self.label
@@ -43,7 +45,8 @@ class PostPatBody:
         tenant_id = self.tenant_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "label": label,
@@ -81,12 +84,23 @@ class PostPatBody:
             tenant_id=tenant_id,
         )
 
-        post_pat_body.additional_properties = d
+        if d:
+            post_pat_body._additional_properties = d
         return post_pat_body
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -98,4 +112,4 @@ class PostPatBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
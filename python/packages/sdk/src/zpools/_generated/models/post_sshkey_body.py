@@ -9,7 +9,7 @@ from attrs import field as _attrs_field
 T = TypeVar("T", bound="PostSshkeyBody")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostSshkeyBody:
     """
     Attributes:
@@ -17,13 +17,16 @@ class PostSshkeyBody:
     """
 
     pubkey: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         pubkey = self.pubkey
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "pubkey": pubkey,
@@ -41,12 +44,23 @@ class PostSshkeyBody:
             pubkey=pubkey,
         )
 
-        post_sshkey_body.additional_properties = d
+        if d:
+            post_sshkey_body._additional_properties = d
         return post_sshkey_body
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -58,4 +72,4 @@ class PostSshkeyBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -11,7 +11,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="PostSshkeyResponse409Detail")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostSshkeyResponse409Detail:
     """
     Attributes:
@@ -19,13 +19,16 @@ class PostSshkeyResponse409Detail:
     """
 
     pubkey_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         pubkey_id = self.pubkey_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if pubkey_id is not UNSET:
             field_dict["pubkey_id"] = pubkey_id
@@ -41,12 +44,23 @@ class PostSshkeyResponse409Detail:
             pubkey_id=pubkey_id,
         )
 
-        post_sshkey_response_409_detail.additional_properties = d
+        if d:
+            post_sshkey_response_409_detail._additional_properties = d
         return post_sshkey_response_409_detail
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -58,4 +72,4 @@ class PostSshkeyResponse409Detail:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
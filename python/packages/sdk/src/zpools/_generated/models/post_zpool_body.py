@@ -12,7 +12,7 @@ from ..models.post_zpool_body_volume_type import PostZpoolBodyVolumeType
 T = TypeVar("T", bound="PostZpoolBody")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostZpoolBody:
     """
     Attributes:
@@ -22,7 +22,9 @@ class PostZpoolBody:
 
     new_size_in_gib: PostZpoolBodyNewSizeInGib
     volume_type: PostZpoolBodyVolumeType
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         new_size_in_gib = self.new_size_in_gib.value
@@ -30,7 +32,8 @@ class PostZpoolBody:
         volume_type = self.volume_type.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "new_size_in_gib": new_size_in_gib,
@@ -52,12 +55,23 @@ class PostZpoolBody:
             volume_type=volume_type,
         )
 
-        post_zpool_body.additional_properties = d
+        if d:
+            post_zpool_body._additional_properties = d
         return post_zpool_body
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -69,4 +83,4 @@ class PostZpoolBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
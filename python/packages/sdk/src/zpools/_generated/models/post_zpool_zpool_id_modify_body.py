@@ -11,7 +11,7 @@ from ..models.post_zpool_zpool_id_modify_body_volume_type import PostZpoolZpoolI
 T = TypeVar("T", bound="PostZpoolZpoolIdModifyBody")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostZpoolZpoolIdModifyBody:
     """
     Attributes:
@@ -19,13 +19,16 @@ class PostZpoolZpoolIdModifyBody:
     """
 
     volume_type: PostZpoolZpoolIdModifyBodyVolumeType
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda props: props or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
         volume_type = self.volume_type.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "volume_type": volume_type,
@@ -43,12 +46,23 @@ class PostZpoolZpoolIdModifyBody:
             volume_type=volume_type,
         )
 
-        post_zpool_zpool_id_modify_body.additional_properties = d
+        if d:
+            post_zpool_zpool_id_modify_body._additional_properties = d
         return post_zpool_zpool_id_modify_body
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -60,4 +74,4 @@ class PostZpoolZpoolIdModifyBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -0,0 +1,356 @@
+"""
+msgspec Struct types for the API's JSON responses.
+
+Generated by scripts/generate_structs.py from spec/stage-definition.yaml; do
+not edit. Class and attribute names match the generated attrs models.
+"""
+import datetime
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class _Struct(msgspec.Struct, kw_only=True, omit_defaults=True, gc=False):
+    """Base of the response structs."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible dict with the API's field names, like the models' to_dict()."""
+        return msgspec.to_builtins(self)
+
+
+class GetHelloResponse200(_Struct):
+    message: Optional[str] = None
+
+
+class PostLoginResponse200Detail(_Struct):
+    access_token: Optional[str] = None
+    expires_in: Optional[int] = None
+    id_token: Optional[str] = None
+    refresh_token: Optional[str] = None
+
+
+class PostLoginResponse200(_Struct):
+    detail: Optional[PostLoginResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class GetBillingBalanceResponse200DetailBalance(_Struct):
+    balance_usd: Optional[float] = None
+    customer: Optional[str] = None
+    first_transaction: Optional[datetime.datetime] = None
+    last_transaction: Optional[datetime.datetime] = None
+    last_update_ts: Optional[datetime.datetime] = None
+    markup_bps: Optional[int] = None
+
+
+class GetBillingBalanceResponse200Detail(_Struct):
+    balance: Optional[GetBillingBalanceResponse200DetailBalance] = None
+
+
+class GetBillingBalanceResponse200(_Struct):
+    detail: Optional[GetBillingBalanceResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class GetBillingLedgerResponse200DetailItemsItem(_Struct):
+    amount_usd: Optional[float] = None
+    event_ts: Optional[str] = None
+    event_type: Optional[str] = None
+    markup_bps: Optional[float] = None
+    markup_usd: Optional[float] = None
+    note: Optional[str] = None
+    posted_ts: Optional[str] = None
+    size_gb: Optional[Any] = None
+    source: Optional[str] = None
+    volume_type: Optional[str] = None
+    zpool_id: Optional[str] = None
+
+
+class GetBillingLedgerResponse200Detail(_Struct):
+    items: Optional[List[GetBillingLedgerResponse200DetailItemsItem]] = None
+
+
+class GetBillingLedgerResponse200(_Struct):
+    detail: Optional[GetBillingLedgerResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class GetBillingSummaryResponse200DetailSummaryCreditsItem(_Struct):
+    amount_usd: Optional[float] = None
+    note: Optional[str] = None
+    posted_ts: Optional[str] = None
+    source: Optional[str] = None
+
+
+class GetBillingSummaryResponse200DetailSummaryPeriod(_Struct):
+    from_date: Optional[str] = None
+    to_date: Optional[str] = None
+
+
+class GetBillingSummaryResponse200DetailSummaryStorageChargesItem(_Struct):
+    daily_rate: Optional[float] = None
+    from_ts: Optional[str] = None
+    hourly_rate: Optional[float] = None
+    hours: Optional[int] = None
+    size_gb: Optional[int] = None
+    to_ts: Optional[str] = None
+    total_charges: Optional[float] = None
+    volume_type: Optional[str] = None
+    zpool_id: Optional[str] = None
+
+
+class GetBillingSummaryResponse200DetailSummaryTimeOfUseChargesItem(_Struct):
+    amount_usd: Optional[float] = None
+    note: Optional[str] = None
+    posted_ts: Optional[str] = None
+    source: Optional[str] = None
+    zpool_id: Optional[str] = None
+
+
+class GetBillingSummaryResponse200DetailSummaryTotals(_Struct):
+    credits_applied: Optional[float] = None
+    ending_balance: Optional[float] = None
+    period_net: Optional[float] = None
+    storage_charges: Optional[float] = None
+    time_of_use_charges: Optional[float] = None
+
+
+class GetBillingSummaryResponse200DetailSummary(_Struct):
+    credits_: Optional[List[GetBillingSummaryResponse200DetailSummaryCreditsItem]] = msgspec.field(default=None, name="credits")
+    period: Optional[GetBillingSummaryResponse200DetailSummaryPeriod] = None
+    storage_charges: Optional[List[GetBillingSummaryResponse200DetailSummaryStorageChargesItem]] = None
+    time_of_use_charges: Optional[List[GetBillingSummaryResponse200DetailSummaryTimeOfUseChargesItem]] = None
+    totals: Optional[GetBillingSummaryResponse200DetailSummaryTotals] = None
+
+
+class GetBillingSummaryResponse200Detail(_Struct):
+    note: Optional[str] = None
+    summary: Optional[GetBillingSummaryResponse200DetailSummary] = None
+
+
+class GetBillingSummaryResponse200(_Struct):
+    detail: Optional[GetBillingSummaryResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class PostCodesClaimResponse201DetailClaim(_Struct):
+    amount_cents: Optional[int] = None
+    code: Optional[str] = None
+    code_type: Optional[str] = None
+    joined_group: Optional[str] = None
+
+
+class PostCodesClaimResponse201Detail(_Struct):
+    balance_after_cents: Optional[int] = None
+    claim: Optional[PostCodesClaimResponse201DetailClaim] = None
+    dev_mode: Optional[bool] = None
+    pool_remaining_cents: Optional[int] = None
+
+
+class PostCodesClaimResponse201(_Struct):
+    detail: Optional[PostCodesClaimResponse201Detail] = None
+    message: Optional[str] = None
+
+
+class PostCodesClaimResponse428Detail(_Struct):
+    tos_url: Optional[str] = None
+
+
+class PostCodesClaimResponse428(_Struct):
+    detail: Optional[PostCodesClaimResponse428Detail] = None
+    message: Optional[str] = None
+
+
+class PostDodoStartResponse201Detail(_Struct):
+    payment_link: Optional[str] = None
+    purchase_id: Optional[str] = None
+
+
+class PostDodoStartResponse201(_Struct):
+    detail: Optional[PostDodoStartResponse201Detail] = None
+    message: Optional[str] = None
+
+
+class GetSshkeyResponse200DetailKeysItem(_Struct):
+    created_at: Optional[datetime.datetime] = None
+    pubkey: Optional[str] = None
+    pubkey_id: Optional[str] = None
+
+
+class GetSshkeyResponse200Detail(_Struct):
+    keys: Optional[List[GetSshkeyResponse200DetailKeysItem]] = None
+
+
+class GetSshkeyResponse200(_Struct):
+    detail: Optional[GetSshkeyResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class PostSshkeyResponse201Detail(_Struct):
+    pubkey_id: Optional[str] = None
+
+
+class PostSshkeyResponse201(_Struct):
+    detail: Optional[PostSshkeyResponse201Detail] = None
+    message: Optional[str] = None
+
+
+class PostSshkeyResponse409Detail(_Struct):
+    pubkey_id: Optional[str] = None
+
+
+class PostSshkeyResponse409(_Struct):
+    detail: Optional[PostSshkeyResponse409Detail] = None
+    message: Optional[str] = None
+
+
+class GetPatResponse200DetailItemsItem(_Struct):
+    created_at: Optional[datetime.datetime] = None
+    expiry_at: Optional[datetime.datetime] = None
+    hard_expiry_at: Optional[datetime.datetime] = None
+    key_id: Optional[str] = None
+    label: Optional[str] = None
+    last_ip: Optional[str] = None
+    last_ua: Optional[str] = None
+    last_used_at: Optional[datetime.datetime] = None
+    scopes: Optional[List[str]] = None
+    status: Optional[str] = None
+    token_ver: Optional[int] = None
+    usage_count: Optional[int] = None
+
+
+class GetPatResponse200Detail(_Struct):
+    items: Optional[List[GetPatResponse200DetailItemsItem]] = None
+
+
+class GetPatResponse200(_Struct):
+    detail: Optional[GetPatResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class PostPatResponse201Detail(_Struct):
+    key_id: Optional[str] = None
+    token: Optional[str] = None
+
+
+class PostPatResponse201(_Struct):
+    detail: Optional[PostPatResponse201Detail] = None
+    message: Optional[str] = None
+
+
+class GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem(_Struct):
+    can_modify_now: Optional[bool] = msgspec.field(default=None, name="CanModifyNow")
+    create_time: Optional[datetime.datetime] = msgspec.field(default=None, name="CreateTime")
+    mod_last_time: Optional[datetime.datetime] = msgspec.field(default=None, name="ModLastTime")
+    mod_progress: Optional[int] = msgspec.field(default=None, name="ModProgress")
+    mod_state: Optional[str] = msgspec.field(default=None, name="ModState")
+    size: Optional[int] = msgspec.field(default=None, name="Size")
+    state: Optional[str] = msgspec.field(default=None, name="State")
+    volume_type: Optional[str] = msgspec.field(default=None, name="VolumeType")
+
+
+class GetZpoolsResponse200DetailZpoolsAdditionalProperty(_Struct):
+    create_time: Optional[datetime.datetime] = msgspec.field(default=None, name="CreateTime")
+    last_scrub_time: Optional[datetime.datetime] = msgspec.field(default=None, name="LastScrubTime")
+    username: Optional[str] = msgspec.field(default=None, name="Username")
+    volume_count: Optional[int] = msgspec.field(default=None, name="VolumeCount")
+    volumes: Optional[List[GetZpoolsResponse200DetailZpoolsAdditionalPropertyVolumesItem]] = msgspec.field(default=None, name="Volumes")
+
+
+class GetZpoolsResponse200Detail(_Struct):
+    zpools: Optional[Dict[str, GetZpoolsResponse200DetailZpoolsAdditionalProperty]] = None
+
+
+class GetZpoolsResponse200(_Struct):
+    detail: Optional[GetZpoolsResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class PostZpoolResponse202Detail(_Struct):
+    job_id: Optional[str] = None
+    zpool_id: Optional[str] = None
+
+
+class PostZpoolResponse202(_Struct):
+    detail: Optional[PostZpoolResponse202Detail] = None
+    message: Optional[str] = None
+
+
+class PostZpoolZpoolIdScrubResponse202Detail(_Struct):
+    job_id: Optional[str] = None
+
+
+class PostZpoolZpoolIdScrubResponse202(_Struct):
+    detail: Optional[PostZpoolZpoolIdScrubResponse202Detail] = None
+    message: Optional[str] = None
+
+
+class GetJobsResponse200DetailJobsItem(_Struct):
+    created_at: Optional[datetime.datetime] = None
+    current_status: Optional[Dict[str, Any]] = None
+    job_id: Optional[str] = None
+    job_type: Optional[str] = None
+    operation: Optional[str] = None
+    parameters: Optional[Any] = None
+    status: Optional[str] = None
+    updated_at: Optional[datetime.datetime] = None
+    zpool_id: Optional[str] = None
+
+
+class GetJobsResponse200Detail(_Struct):
+    jobs: Optional[List[GetJobsResponse200DetailJobsItem]] = None
+
+
+class GetJobsResponse200(_Struct):
+    detail: Optional[GetJobsResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class GetJobJobIdResponse200Detail(_Struct):
+    error: Optional[str] = None
+    job: Optional[Dict[str, Any]] = None
+    job_id: Optional[str] = None
+    progress: Optional[int] = None
+    status: Optional[str] = None
+
+
+class GetJobJobIdResponse200(_Struct):
+    detail: Optional[GetJobJobIdResponse200Detail] = None
+    message: Optional[str] = None
+
+
+class GetJobJobIdHistoryResponse200DetailEventsItem(_Struct):
+    message: Optional[str] = None
+    status: Optional[str] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class GetJobJobIdHistoryResponse200Detail(_Struct):
+    events: Optional[List[GetJobJobIdHistoryResponse200DetailEventsItem]] = None
+
+
+class GetJobJobIdHistoryResponse200(_Struct):
+    detail: Optional[GetJobJobIdHistoryResponse200Detail] = None
+    message: Optional[str] = None
+
+
+# Response struct per generated endpoint module and status code
+RESPONSES = {
+    "get_billing_balance": {200: GetBillingBalanceResponse200},
+    "get_billing_ledger": {200: GetBillingLedgerResponse200},
+    "get_billing_summary": {200: GetBillingSummaryResponse200},
+    "get_hello": {200: GetHelloResponse200},
+    "get_job_job_id": {200: GetJobJobIdResponse200},
+    "get_job_job_id_history": {200: GetJobJobIdHistoryResponse200},
+    "get_jobs": {200: GetJobsResponse200},
+    "get_pat": {200: GetPatResponse200},
+    "get_sshkey": {200: GetSshkeyResponse200},
+    "get_zpools": {200: GetZpoolsResponse200},
+    "post_codes_claim": {201: PostCodesClaimResponse201, 428: PostCodesClaimResponse428},
+    "post_dodo_start": {201: PostDodoStartResponse201},
+    "post_login": {200: PostLoginResponse200},
+    "post_pat": {201: PostPatResponse201},
+    "post_sshkey": {201: PostSshkeyResponse201, 409: PostSshkeyResponse409},
+    "post_zpool": {202: PostZpoolResponse202},
+    "post_zpool_zpool_id_scrub": {202: PostZpoolZpoolIdScrubResponse202},
+}
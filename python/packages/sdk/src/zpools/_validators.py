@@ -0,0 +1,75 @@
+"""
+Request constraints for the API's endpoints.
+
+Generated by scripts/generate_validators.py from spec/stage-definition.yaml;
+do not edit. zpools.validation compiles them into checks.
+"""
+
+# Argument constraints per generated endpoint module, keyed by API name
+CONSTRAINTS = {
+    "delete_pat_key_id": {
+        "key_id": {'in': 'path', 'required': True, 'type': 'string'},
+    },
+    "delete_sshkey_pubkey_id": {
+        "pubkey_id": {'in': 'path', 'required': True, 'type': 'string'},
+    },
+    "delete_zpool_zpool_id": {
+        "zpool_id": {'in': 'path', 'required': True, 'type': 'string'},
+    },
+    "get_billing_ledger": {
+        "since": {'in': 'query', 'required': False, 'type': 'string', 'format': 'date'},
+        "until": {'in': 'query', 'required': False, 'type': 'string', 'format': 'date'},
+        "limit": {'in': 'query', 'required': False, 'type': 'integer', 'minimum': 1, 'maximum': 5000},
+    },
+    "get_billing_summary": {
+        "since": {'in': 'query', 'required': False, 'type': 'string', 'format': 'date'},
+        "until": {'in': 'query', 'required': False, 'type': 'string', 'format': 'date'},
+    },
+    "get_job_job_id": {
+        "job_id": {'in': 'path', 'required': True, 'type': 'string'},
+    },
+    "get_job_job_id_history": {
+        "job_id": {'in': 'path', 'required': True, 'type': 'string'},
+    },
+    "get_jobs": {
+        "limit": {'in': 'query', 'required': False, 'type': 'integer', 'minimum': 1, 'maximum': 1000},
+        "before": {'in': 'query', 'required': False, 'type': 'string', 'format': 'date-time'},
+        "after": {'in': 'query', 'required': False, 'type': 'string', 'format': 'date-time'},
+        "sort": {'in': 'query', 'required': False, 'type': 'string', 'enum': ['asc', 'desc']},
+    },
+    "post_codes_claim": {
+        "code": {'in': 'body', 'required': True, 'type': 'string'},
+        "tos": {'in': 'body', 'required': False, 'type': 'object', 'properties': {'accepted_at': {'type': 'string', 'format': 'date-time'}, 'url': {'type': 'string'}}},
+    },
+    "post_dodo_start": {
+        "quantity": {'in': 'body', 'required': True, 'type': 'integer', 'minimum': 1},
+    },
+    "post_login": {
+        "username": {'in': 'body', 'required': True, 'type': 'string'},
+        "password": {'in': 'body', 'required': True, 'type': 'string'},
+    },
+    "post_pat": {
+        "expiry": {'in': 'body', 'required': False, 'type': 'string', 'format': 'date'},
+        "label": {'in': 'body', 'required': True, 'type': 'string'},
+        "scopes": {'in': 'body', 'required': False, 'type': 'array', 'items': {'type': 'string'}},
+        "tenant_id": {'in': 'body', 'required': False, 'type': 'string'},
+    },
+    "post_sshkey": {
+        "pubkey": {'in': 'body', 'required': True, 'type': 'string'},
+    },
+    "post_zpool": {
+        "new_size_in_gib": {'in': 'body', 'required': True, 'type': 'integer', 'enum': [125]},
+        "volume_type": {'in': 'body', 'required': True, 'type': 'string', 'enum': ['gp3', 'sc1']},
+    },
+    "post_zpool_zpool_id_expand": {
+        "zpool_id": {'in': 'path', 'required': True, 'type': 'string'},
+        "new_size_in_gib": {'in': 'body', 'required': True, 'type': 'integer', 'minimum': 125},
+    },
+    "post_zpool_zpool_id_modify": {
+        "zpool_id": {'in': 'path', 'required': True, 'type': 'string'},
+        "volume_type": {'in': 'body', 'required': True, 'type': 'string', 'enum': ['gp3', 'sc1']},
+    },
+    "post_zpool_zpool_id_scrub": {
+        "zpool_id": {'in': 'path', 'required': True, 'type': 'string'},
+    },
+}
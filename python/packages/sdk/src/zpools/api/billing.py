@@ -1,107 +1,190 @@
 """Billing and payment operations."""
+from ..validation import validate
+
+
+def _date_param(value):
+    """Convert a YYYY-MM-DD string (or date object) to a generated SDK date parameter."""
+    from .._generated.types import UNSET
+    from datetime import datetime
+
+    if value is None:
+        return UNSET
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+
+def _ledger_kwargs(since=None, until=None, limit=None) -> dict:
+    """
+    Convert get_billing_ledger() arguments to generated SDK parameter types.
+
+    Raises:
+        ValidationError: If an argument violates the API spec
+    """
+    from .._generated.types import UNSET
+
+    validate("get_billing_ledger", since=since, until=until, limit=limit)
+
+    return {
+        "since": _date_param(since),
+        "until": _date_param(until),
+        "limit": limit if limit is not None else UNSET,
+    }
+
+
+# Location of the entries in a ledger response body
+_LEDGER_ITEMS = ("detail", "items")
+
+
+def _summary_kwargs(since=None, until=None) -> dict:
+    """
+    Convert get_billing_summary() arguments to generated SDK parameter types.
+
+    Raises:
+        ValidationError: If an argument violates the API spec
+    """
+    validate("get_billing_summary", since=since, until=until)
+    return {
+        "since": _date_param(since),
+        "until": _date_param(until),
+    }
 
 
 class BillingMixin:
     """Mixin providing billing and payment operations."""
-    
+
     def get_billing_balance(self):
         """
         Get account balance.
-        
+
         Returns:
             Response with status_code and balance details
         """
         from .._generated.api.billing import get_billing_balance
-        
-        auth_client = self._auth.get_authenticated_client()
-        return get_billing_balance.sync_detailed(client=auth_client)
-    
-    def get_billing_ledger(self, since: str = None, until: str = None, limit: int = None):
+
+        return self._cached_read(("get_billing_balance",), get_billing_balance)
+
+    def get_billing_ledger(self, since: str = None, until: str = None, limit: int = None, keep_content: bool = None):
         """
         Get billing ledger entries with optional date filters.
-        
+
         Filters by event_ts (when the event occurred).
         Results include event_ts and posted_ts (when recorded).
-        
+
         Args:
             since: Start event date in YYYY-MM-DD format (or date object)
             until: End event date in YYYY-MM-DD format (or date object)
             limit: Maximum number of entries (1-5000, default 500)
-            
+            keep_content: Keep Response.content after parsing (default: the client's keep_content)
+
         Returns:
             Response with status_code and ledger items
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
         """
         from .._generated.api.billing import get_billing_ledger
-        from .._generated.types import UNSET
-        from datetime import datetime
-        
-        auth_client = self._auth.get_authenticated_client()
-        
-        # Convert string dates to date objects
-        since_param = UNSET
-        if since is not None:
-            if isinstance(since, str):
-                since_param = datetime.strptime(since, "%Y-%m-%d").date()
-            else:
-                since_param = since
-        
-        until_param = UNSET
-        if until is not None:
-            if isinstance(until, str):
-                until_param = datetime.strptime(until, "%Y-%m-%d").date()
-            else:
-                until_param = until
-        
-        limit_param = limit if limit is not None else UNSET
-        
-        return get_billing_ledger.sync_detailed(
-            client=auth_client,
-            since=since_param,
-            until=until_param,
-            limit=limit_param
+
+        kwargs = _ledger_kwargs(since=since, until=until, limit=limit)
+        return self._coalesce(
+            ("get_billing_ledger", since, until, limit, keep_content),
+            lambda: self._request(get_billing_ledger, keep_content=keep_content, **kwargs),
         )
 
+    def iter_billing_ledger(self, since: str = None, until: str = None, limit: int = None):
+        """
+        Iterate over billing ledger entries as they are received.
+
+        Takes the same filters as get_billing_ledger(), but streams the response:
+        entries are decoded and yielded one at a time while the body is still
+        arriving, so memory stays flat for large ledgers (limit up to 5000).
+
+        Args:
+            since: Start event date in YYYY-MM-DD format (or date object)
+            until: End event date in YYYY-MM-DD format (or date object)
+            limit: Maximum number of entries (1-5000, default 500)
+
+        Yields:
+            Ledger item models (GetBillingLedgerResponse200DetailItemsItem), dicts in raw mode,
+            or the item structs in struct mode
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
+            UnexpectedStatus: If the API does not answer 200
+        """
+        from .._generated.api.billing import get_billing_ledger
+        from .._generated.models import GetBillingLedgerResponse200DetailItemsItem
+
+        kwargs = _ledger_kwargs(since=since, until=until, limit=limit)
+        return self._iter_items(get_billing_ledger, _LEDGER_ITEMS, GetBillingLedgerResponse200DetailItemsItem, **kwargs)
+
     def get_billing_summary(self, since: str = None, until: str = None):
         """
         Get aggregated billing summary grouped by zpool and rate period.
-        
+
         Groups hourly storage charges into periods, lists time-of-use charges
         (scrub jobs, egress) separately, and calculates totals.
-        
+
         Args:
             since: Start date in YYYY-MM-DD format (or date object)
             until: End date in YYYY-MM-DD format (or date object)
-            
+
         Returns:
             Response with status_code and summary details including:
             - storage_charges: Grouped storage charges by zpool/rate
             - time_of_use_charges: Scrub jobs, egress, etc.
             - credits: Applied credits
             - totals: Period totals and current balance
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
         """
         from .._generated.api.billing import get_billing_summary
-        from .._generated.types import UNSET
-        from datetime import datetime
-        
-        auth_client = self._auth.get_authenticated_client()
-        
-        # Convert string dates to date objects
-        since_param = UNSET
-        if since is not None:
-            if isinstance(since, str):
-                since_param = datetime.strptime(since, "%Y-%m-%d").date()
-            else:
-                since_param = since
-        
-        until_param = UNSET
-        if until is not None:
-            if isinstance(until, str):
-                until_param = datetime.strptime(until, "%Y-%m-%d").date()
-            else:
-                until_param = until
-        
-        return get_billing_summary.sync_detailed(
-            client=auth_client,
-            since=since_param,
-            until=until_param
+
+        kwargs = _summary_kwargs(since=since, until=until)
+        return self._coalesce(
+            ("get_billing_summary", since, until),
+            lambda: self._request(get_billing_summary, **kwargs),
+        )
+
+
+class AsyncBillingMixin:
+    """Asyncio counterpart of BillingMixin."""
+
+    async def get_billing_balance(self):
+        """Get account balance. See BillingMixin.get_billing_balance."""
+        from .._generated.api.billing import get_billing_balance
+
+        return await self._cached_read(("get_billing_balance",), get_billing_balance)
+
+    async def get_billing_ledger(self, since: str = None, until: str = None, limit: int = None, keep_content: bool = None):
+        """Get billing ledger entries. See BillingMixin.get_billing_ledger."""
+        from .._generated.api.billing import get_billing_ledger
+
+        kwargs = _ledger_kwargs(since=since, until=until, limit=limit)
+        return await self._coalesce(
+            ("get_billing_ledger", since, until, limit, keep_content),
+            lambda: self._request(get_billing_ledger, keep_content=keep_content, **kwargs),
+        )
+
+    def iter_billing_ledger(self, since: str = None, until: str = None, limit: int = None):
+        """
+        Iterate over billing ledger entries as they are received (async iterator).
+
+        See BillingMixin.iter_billing_ledger.
+        """
+        from .._generated.api.billing import get_billing_ledger
+        from .._generated.models import GetBillingLedgerResponse200DetailItemsItem
+
+        kwargs = _ledger_kwargs(since=since, until=until, limit=limit)
+        return self._iter_items(get_billing_ledger, _LEDGER_ITEMS, GetBillingLedgerResponse200DetailItemsItem, **kwargs)
+
+    async def get_billing_summary(self, since: str = None, until: str = None):
+        """Get aggregated billing summary. See BillingMixin.get_billing_summary."""
+        from .._generated.api.billing import get_billing_summary
+
+        kwargs = _summary_kwargs(since=since, until=until)
+        return await self._coalesce(
+            ("get_billing_summary", since, until),
+            lambda: self._request(get_billing_summary, **kwargs),
         )
@@ -1,84 +1,620 @@
 """Job management operations."""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from ..validation import validate
+
+# Most jobs a single list_jobs call can return
+MAX_PAGE_SIZE = 1000
+
+# fetch_jobs(): time windows are requested one tick (the finest created_at
+# resolution) wider on each side, so a job on a window edge is returned whether
+# the API's before/after are inclusive or not; windows are not split below _MIN_WINDOW
+_TICK = timedelta(microseconds=1)
+_MIN_WINDOW = timedelta(seconds=1)
+_NO_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _list_jobs_kwargs(limit=None, before=None, after=None, sort=None) -> dict:
+    """
+    Convert list_jobs() arguments to generated SDK parameter types.
+
+    Raises:
+        ValidationError: If an argument violates the API spec
+    """
+    if isinstance(sort, str):
+        sort = sort.lower()
+    validate("get_jobs", limit=limit, before=before, after=after, sort=sort)
+
+    from .._generated.models.get_jobs_sort import GetJobsSort
+    from .._generated.types import UNSET
+
+    # Convert parameters to SDK types
+    limit_param = limit if limit is not None else UNSET
+
+    before_param = UNSET
+    if before is not None:
+        if isinstance(before, str):
+            before_param = datetime.fromisoformat(before.replace('Z', '+00:00'))
+        else:
+            before_param = before
+
+    after_param = UNSET
+    if after is not None:
+        if isinstance(after, str):
+            after_param = datetime.fromisoformat(after.replace('Z', '+00:00'))
+        else:
+            after_param = after
+
+    sort_param = UNSET
+    if sort is not None:
+        sort_param = GetJobsSort(sort)
+
+    return {
+        "limit": limit_param,
+        "before": before_param,
+        "after": after_param,
+        "sort": sort_param,
+    }
+
+
+def _page_jobs(response) -> list:
+    """
+    The jobs of one list_jobs page, as domain Job objects.
+
+    Raises:
+        UnexpectedStatus: If the API did not answer 200
+    """
+    from .._generated.errors import UnexpectedStatus
+    from ..domain import jobs_from_response
+
+    if response.status_code != 200:
+        raise UnexpectedStatus(response.status_code, response.content)
+    return jobs_from_response(response)
+
+
+def _as_time(value) -> Optional[datetime]:
+    """An ISO 8601 string or datetime as an aware datetime (naive values are taken as UTC)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class _JobPages:
+    """
+    Cursor state for iter_jobs().
+
+    Each page continues from the created_at of the previous page's last job
+    (before= when sorting desc, after= when sorting asc), widened by one tick
+    so the jobs sharing that timestamp are returned again whether the API's
+    bounds are inclusive or not. Jobs the previous page already had are skipped.
+
+    A full page whose jobs all share one created_at (a burst of at least
+    page_size jobs) would be returned again from the same cursor, so it is
+    re-requested with the API's largest limit; a burst even larger than that
+    cannot be paged past and raises instead of ending the iteration early.
+    """
+
+    def __init__(self, before, after, sort, page_size: int):
+        self.page_size = page_size
+        self._cursor_param = "after" if sort == "asc" else "before"
+        # list_jobs() arguments for the next page
+        self.params = {"limit": page_size, "before": before, "after": after, "sort": sort}
+        self._previous_ids = set()
+
+    def take(self, jobs: list) -> Tuple[List, bool]:
+        """
+        Consume a page and move the cursor past it.
+
+        Returns:
+            (jobs not yielded before, whether another page should be fetched)
+
+        Raises:
+            RuntimeError: If the cursor cannot advance past a full page: it ends with a job
+                without created_at, more than MAX_PAGE_SIZE jobs share one created_at,
+                or the API returned only jobs already seen
+        """
+        fresh = [job for job in jobs if job.job_id not in self._previous_ids]
+        # A short page is the last one
+        if len(jobs) < self.params["limit"]:
+            return fresh, False
+        if not fresh:
+            raise RuntimeError(
+                f"list_jobs returned a full page of jobs already seen ({jobs[0].job_id} to "
+                f"{jobs[-1].job_id}); the {self._cursor_param}= cursor cannot advance"
+            )
+        last = _as_time(jobs[-1].created_at)
+        if last is None:
+            raise RuntimeError(f"Cannot page past job {jobs[-1].job_id}: it has no created_at")
+        page_ids = {job.job_id for job in jobs}
+        if _as_time(jobs[0].created_at) == last:
+            if self.params["limit"] >= MAX_PAGE_SIZE:
+                raise RuntimeError(
+                    f"At least {self.params['limit']} jobs share created_at {last.isoformat()}; "
+                    f"list_jobs cannot page past them (narrow the range with before/after)"
+                )
+            # The cursor stays on the burst: keep skipping what was yielded from it so far
+            self._previous_ids |= page_ids
+            self.params["limit"] = MAX_PAGE_SIZE
+        else:
+            self._previous_ids = page_ids
+            self.params["limit"] = self.page_size
+        self.params[self._cursor_param] = last + _TICK if self._cursor_param == "before" else last - _TICK
+        return fresh, True
+
+
+class _JobWindow:
+    """A time range [lo, hi) fetched by fetch_jobs(); None is the caller's outer bound."""
+
+    __slots__ = ("partition", "lo", "hi", "pages")
+
+    def __init__(self, partition: int, lo: Optional[datetime], hi: Optional[datetime], pages: Optional[_JobPages] = None):
+        self.partition = partition
+        self.lo = lo
+        self.hi = hi
+        # Set once the window is too narrow to split: it is then paged with the cursor
+        self.pages = pages
+
+
+class _JobWindows:
+    """
+    Plan and merge state for fetch_jobs().
+
+    The time range is split into one window per partition, in output order.
+    A window whose page comes back full keeps that page and splits the rest
+    of its range into about as many windows as it needs pages (at most one
+    per partition), down to _MIN_WINDOW, below which the rest is paged
+    with the before/after cursor like iter_jobs(). A partition's jobs are
+    released, sorted, once all of its windows are done; partitions cover
+    disjoint ranges, so releasing them in order gives a sorted stream.
+    A burst of equal timestamps on a window edge stops the window from
+    shrinking; it is then paged with the cursor too, which pages past the
+    burst or raises (see _JobPages), so no window is ever reported as
+    covered while jobs remain in it.
+    """
+
+    def __init__(self, before, after, sort, page_size: int):
+        self.before = before
+        self.after = after
+        self.sort = sort
+        self.descending = sort != "asc"
+        self.page_size = page_size
+        self._oldest = _as_time(after)
+        self._newest = _as_time(before)
+        self._partitions = 0
+        self._split_limit = 2
+        self._released = 0
+        self._yielded = 0
+        # Windows still being fetched and jobs found so far, per partition
+        self._pending: Dict[int, int] = {}
+        self._jobs: Dict[int, List] = {}
+        self._seen = set()
+
+    def probes(self) -> Dict[str, dict]:
+        """list_jobs() arguments for finding the oldest/newest job when after/before are not given."""
+        probes = {}
+        if self._oldest is None:
+            probes["oldest"] = {"limit": 1, "before": self.before, "after": self.after, "sort": "asc"}
+        if self._newest is None:
+            probes["newest"] = {"limit": 1, "before": self.before, "after": self.after, "sort": "desc"}
+        return probes
+
+    def plan(self, partitions: int, probed: Dict[str, List]) -> List[_JobWindow]:
+        """
+        Split the range into windows, given the jobs returned for probes().
+
+        Returns:
+            The windows to fetch (none if a probe found no jobs)
+        """
+        for name, jobs in probed.items():
+            if not jobs:
+                return []
+            setattr(self, f"_{name}", _as_time(jobs[0].created_at) or _NO_TIME)
+        span = max(self._newest - self._oldest, timedelta(0))
+        count = max(1, min(partitions, int(span / _MIN_WINDOW)))
+        edges = [None] + [self._oldest + span * i / count for i in range(1, count)] + [None]
+        ranges = list(zip(edges, edges[1:]))
+        if self.descending:
+            ranges.reverse()
+        self._partitions = count
+        self._split_limit = partitions
+        self._pending = dict.fromkeys(range(count), 1)
+        return [_JobWindow(partition, lo, hi) for partition, (lo, hi) in enumerate(ranges)]
+
+    def params(self, window: _JobWindow) -> dict:
+        """list_jobs() arguments for the window's next page."""
+        if window.pages is not None:
+            return dict(window.pages.params)
+        return {
+            "limit": self.page_size,
+            "before": self.before if window.hi is None else window.hi + _TICK,
+            "after": self.after if window.lo is None else window.lo - _TICK,
+            "sort": self.sort,
+        }
+
+    def take(self, window: _JobWindow, jobs: list) -> List[_JobWindow]:
+        """
+        Record a page fetched for a window.
+
+        Returns:
+            Windows to fetch next for the rest of its range (none when it is done)
+
+        Raises:
+            RuntimeError: If a full page ends with a job without created_at
+        """
+        if window.pages is not None:
+            jobs, more = window.pages.take(jobs)
+        else:
+            more = len(jobs) >= self.page_size
+        found = self._jobs.setdefault(window.partition, [])
+        for job in jobs:
+            created = _as_time(job.created_at)
+            if job.job_id in self._seen or created is not None and not (
+                (window.lo is None or created >= window.lo) and (window.hi is None or created < window.hi)
+            ):
+                continue
+            self._seen.add(job.job_id)
+            found.append(job)
+
+        if not more:
+            rest = []
+        elif window.pages is not None:
+            rest = [window]
+        else:
+            rest = self._split_rest(window, jobs)
+        self._pending[window.partition] += len(rest) - 1
+        return rest
+
+    def _split_rest(self, window: _JobWindow, jobs: list) -> List[_JobWindow]:
+        """Windows for the part of a window not covered by its full first page, split by its job density."""
+        last = _as_time(jobs[-1].created_at)
+        if last is None:
+            raise RuntimeError(f"Cannot page past job {jobs[-1].job_id}: it has no created_at")
+        # The rest includes the last job's timestamp: the page may end inside a group of equal timestamps
+        lo, hi = window.lo, window.hi
+        if self.descending:
+            hi = last + _TICK if hi is None else min(hi, last + _TICK)
+            stuck = hi == window.hi
+        else:
+            lo = last if lo is None else max(lo, last)
+            stuck = lo == window.lo
+        low = self._oldest if lo is None else lo
+        high = self._newest + _TICK if hi is None else hi
+        # A page ending on the window's own edge (a burst of equal timestamps) does not shrink it
+        if stuck or high - low < 2 * _MIN_WINDOW:
+            rest = _JobWindow(window.partition, lo, hi)
+            params = self.params(rest)
+            rest.pages = _JobPages(params["before"], params["after"], self.sort, self.page_size)
+            return [rest]
+        # One window per page still needed (plus a quarter, as jobs are not spread evenly),
+        # judged by the time span the full page covered
+        if self.descending:
+            covered = (self._newest + _TICK if window.hi is None else window.hi) - last
+        else:
+            covered = last - (self._oldest if window.lo is None else window.lo)
+        count = -(-(high - low) * 5 // (covered * 4)) if covered > timedelta(0) else 2
+        count = max(1, min(count, self._split_limit, (high - low) // _MIN_WINDOW))
+        edges = [lo] + [low + (high - low) * i / count for i in range(1, count)] + [hi]
+        return [_JobWindow(window.partition, start, end) for start, end in zip(edges, edges[1:])]
+
+    def completed(self) -> List:
+        """Jobs of the partitions finished since the last call, in order."""
+        jobs = []
+        while self._released < self._partitions and self._pending[self._released] == 0:
+            found = self._jobs.pop(self._released, [])
+            found.sort(key=lambda job: (_as_time(job.created_at) or _NO_TIME, job.job_id or ""), reverse=self.descending)
+            jobs.extend(found)
+            self._released += 1
+        self._yielded += len(jobs)
+        return jobs
+
+    def check_done(self) -> None:
+        """
+        Check, once no window is left to fetch, that every job found was released.
+
+        Raises:
+            RuntimeError: If a partition still has windows pending or jobs were left behind
+        """
+        pending = [partition for partition, count in self._pending.items() if count]
+        if pending or self._released < self._partitions or self._yielded != len(self._seen):
+            raise RuntimeError(
+                f"fetch_jobs did not complete: not all windows were covered (partitions pending: "
+                f"{pending or list(range(self._released, self._partitions))}; "
+                f"{self._yielded} of {len(self._seen)} jobs released)"
+            )
 
 
 class JobMixin:
     """Mixin providing job management operations."""
-    
+
     def get_job(self, job_id: str):
         """
         Get job details.
-        
+
         Args:
             job_id: The job_id to query
-            
+
         Returns:
             Response with status_code and job details
+
+        Raises:
+            ValidationError: If job_id is empty or not a string (checked before sending)
         """
         from .._generated.api.jobs import get_job_job_id
-        
-        auth_client = self._auth.get_authenticated_client()
-        return get_job_job_id.sync_detailed(client=auth_client, job_id=job_id)
-    
-    def list_jobs(self, limit=None, before=None, after=None, sort=None):
+
+        validate("get_job_job_id", job_id=job_id)
+
+        return self._coalesce(
+            ("get_job", job_id),
+            lambda: self._request(get_job_job_id, job_id=job_id),
+        )
+
+    def list_jobs(self, limit=None, before=None, after=None, sort=None, keep_content=None):
         """
         List all jobs with optional filtering and sorting.
-        
+
         Args:
             limit: Maximum number of jobs to return (1-1000, default 100)
             before: Return jobs created before this datetime (ISO 8601 or datetime object)
             after: Return jobs created after this datetime (ISO 8601 or datetime object)
             sort: Sort order ("asc" or "desc", default "desc")
-        
+            keep_content: Keep Response.content after parsing (default: the client's keep_content)
+
         Returns:
             Response with status_code and parsed list of jobs
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
         """
         from .._generated.api.jobs import get_jobs
-        from .._generated.models.get_jobs_sort import GetJobsSort
-        from .._generated.types import UNSET
-        from datetime import datetime
-        
-        auth_client = self._auth.get_authenticated_client()
-        
-        # Convert parameters to SDK types
-        limit_param = limit if limit is not None else UNSET
-        
-        before_param = UNSET
-        if before is not None:
-            if isinstance(before, str):
-                before_param = datetime.fromisoformat(before.replace('Z', '+00:00'))
-            else:
-                before_param = before
-        
-        after_param = UNSET
-        if after is not None:
-            if isinstance(after, str):
-                after_param = datetime.fromisoformat(after.replace('Z', '+00:00'))
-            else:
-                after_param = after
-        
-        sort_param = UNSET
-        if sort is not None:
-            sort_param = GetJobsSort.ASC if sort.lower() == "asc" else GetJobsSort.DESC
-        
-        return get_jobs.sync_detailed(
-            client=auth_client,
-            limit=limit_param,
-            before=before_param,
-            after=after_param,
-            sort=sort_param
+
+        return self._cached_read(
+            ("list_jobs", limit, before, after, sort),
+            get_jobs,
+            keep_content=keep_content,
+            **_list_jobs_kwargs(limit=limit, before=before, after=after, sort=sort)
         )
-    
+
+    def iter_jobs(self, before=None, after=None, sort=None, page_size: int = MAX_PAGE_SIZE, prefetch: bool = False):
+        """
+        Iterate over all jobs, paging past the per-call limit of list_jobs().
+
+        Pages are requested lazily with the before/after cursors: each page
+        starts at the created_at of the previous page's last job, and jobs
+        repeated at that boundary are skipped (by job_id). A full page of jobs
+        sharing one created_at is re-requested with limit 1000 to page past it.
+
+        Args:
+            before: Only jobs created before this datetime (ISO 8601 or datetime object)
+            after: Only jobs created after this datetime (ISO 8601 or datetime object)
+            sort: Sort order ("asc" or "desc", default "desc")
+            page_size: Jobs per request (1-1000, default 1000)
+            prefetch: Fetch the next page in a background thread while the
+                current one is being consumed
+
+        Yields:
+            Job objects (zpools.domain.Job), in the requested order
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
+            UnexpectedStatus: If the API does not answer 200 for a page
+            RuntimeError: If the cursor cannot advance, e.g. more than 1000 jobs share one created_at
+        """
+        if isinstance(sort, str):
+            sort = sort.lower()
+        _list_jobs_kwargs(limit=page_size, before=before, after=after, sort=sort)
+        return self._iter_job_pages(_JobPages(before, after, sort, page_size), prefetch)
+
+    def _iter_job_pages(self, pages: _JobPages, prefetch: bool):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch(params):
+            return _page_jobs(self.list_jobs(keep_content=False, **params))
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zpools-iter-jobs") if prefetch else None
+        try:
+            jobs = fetch(pages.params)
+            while True:
+                fresh, more = pages.take(jobs)
+                upcoming = executor.submit(fetch, dict(pages.params)) if more and executor else None
+                yield from fresh
+                if not more:
+                    return
+                jobs = upcoming.result() if upcoming is not None else fetch(pages.params)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_jobs(self, after=None, before=None, partitions: int = 4, sort=None, page_size: int = MAX_PAGE_SIZE):
+        """
+        Fetch all jobs in a time range, splitting it into windows fetched concurrently.
+
+        Unlike iter_jobs(), where each page waits for the previous one, the
+        range is split into ``partitions`` windows that are requested in
+        parallel over the client's connection pool. A window whose page hits
+        page_size keeps that page and splits the rest of its range again. When
+        after or before is not given, the oldest or newest job bounds the
+        range (one extra request each).
+
+        Args:
+            after: Only jobs created after this datetime (ISO 8601 or datetime object)
+            before: Only jobs created before this datetime (ISO 8601 or datetime object)
+            partitions: Windows to split the range into, and the most requests in flight
+            sort: Sort order ("asc" or "desc", default "desc")
+            page_size: Jobs per request (1-1000, default 1000)
+
+        Yields:
+            Job objects (zpools.domain.Job), sorted by created_at, each once. Jobs
+            are yielded a window at a time, as soon as the windows before it are done.
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
+            ValueError: If partitions is less than 1
+            UnexpectedStatus: If the API does not answer 200 for a request
+            RuntimeError: If a window cannot be paged through, e.g. more than 1000 jobs
+                share one created_at, or not every window was covered
+        """
+        if isinstance(sort, str):
+            sort = sort.lower()
+        _list_jobs_kwargs(limit=page_size, before=before, after=after, sort=sort)
+        if partitions < 1:
+            raise ValueError(f"partitions must be at least 1 (got {partitions})")
+        return self._fetch_job_windows(_JobWindows(before, after, sort, page_size), partitions)
+
+    def _fetch_job_windows(self, windows: _JobWindows, partitions: int):
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        def fetch(params):
+            return _page_jobs(self.list_jobs(keep_content=False, **params))
+
+        executor = ThreadPoolExecutor(max_workers=partitions, thread_name_prefix="zpools-fetch-jobs")
+        try:
+            probes = windows.probes()
+            probed = dict(zip(probes, executor.map(fetch, probes.values())))
+            running = {executor.submit(fetch, windows.params(window)): window for window in windows.plan(partitions, probed)}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for window in windows.take(running.pop(future), future.result()):
+                        running[executor.submit(fetch, windows.params(window))] = window
+                yield from windows.completed()
+            windows.check_done()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_job_history(self, job_id: str):
         """
         Get job history/timeline.
-        
+
         Args:
             job_id: The job_id to query
-            
+
         Returns:
             Response with status_code and job history events
+
+        Raises:
+            ValidationError: If job_id is empty or not a string (checked before sending)
         """
         from .._generated.api.jobs import get_job_job_id_history
-        
-        auth_client = self._auth.get_authenticated_client()
-        return get_job_job_id_history.sync_detailed(client=auth_client, job_id=job_id)
+
+        validate("get_job_job_id_history", job_id=job_id)
+
+        return self._coalesce(
+            ("get_job_history", job_id),
+            lambda: self._request(get_job_job_id_history, job_id=job_id),
+        )
+
+
+class AsyncJobMixin:
+    """Asyncio counterpart of JobMixin."""
+
+    async def get_job(self, job_id: str):
+        """Get job details. See JobMixin.get_job."""
+        from .._generated.api.jobs import get_job_job_id
+
+        validate("get_job_job_id", job_id=job_id)
+
+        return await self._coalesce(
+            ("get_job", job_id),
+            lambda: self._request(get_job_job_id, job_id=job_id),
+        )
+
+    async def list_jobs(self, limit=None, before=None, after=None, sort=None, keep_content=None):
+        """List jobs with optional filtering and sorting. See JobMixin.list_jobs."""
+        from .._generated.api.jobs import get_jobs
+
+        return await self._cached_read(
+            ("list_jobs", limit, before, after, sort),
+            get_jobs,
+            keep_content=keep_content,
+            **_list_jobs_kwargs(limit=limit, before=before, after=after, sort=sort)
+        )
+
+    def iter_jobs(self, before=None, after=None, sort=None, page_size: int = MAX_PAGE_SIZE, prefetch: bool = False):
+        """
+        Iterate over all jobs, paging past the per-call limit (async iterator).
+
+        See JobMixin.iter_jobs; with prefetch the next page is requested in a task.
+        """
+        if isinstance(sort, str):
+            sort = sort.lower()
+        _list_jobs_kwargs(limit=page_size, before=before, after=after, sort=sort)
+        return self._iter_job_pages(_JobPages(before, after, sort, page_size), prefetch)
+
+    async def _iter_job_pages(self, pages: _JobPages, prefetch: bool):
+        import asyncio
+
+        async def fetch(params):
+            return _page_jobs(await self.list_jobs(keep_content=False, **params))
+
+        upcoming = None
+        try:
+            jobs = await fetch(pages.params)
+            while True:
+                fresh, more = pages.take(jobs)
+                if more and prefetch:
+                    upcoming = asyncio.ensure_future(fetch(dict(pages.params)))
+                for job in fresh:
+                    yield job
+                if not more:
+                    return
+                if upcoming is not None:
+                    jobs, upcoming = await upcoming, None
+                else:
+                    jobs = await fetch(pages.params)
+        finally:
+            if upcoming is not None:
+                upcoming.cancel()
+
+    def fetch_jobs(self, after=None, before=None, partitions: int = 4, sort=None, page_size: int = MAX_PAGE_SIZE):
+        """
+        Fetch all jobs in a time range in concurrent windows (async iterator).
+
+        See JobMixin.fetch_jobs; at most ``partitions`` requests run at once.
+        """
+        if isinstance(sort, str):
+            sort = sort.lower()
+        _list_jobs_kwargs(limit=page_size, before=before, after=after, sort=sort)
+        if partitions < 1:
+            raise ValueError(f"partitions must be at least 1 (got {partitions})")
+        return self._fetch_job_windows(_JobWindows(before, after, sort, page_size), partitions)
+
+    async def _fetch_job_windows(self, windows: _JobWindows, partitions: int):
+        import asyncio
+
+        slots = asyncio.Semaphore(partitions)
+
+        async def fetch(params):
+            async with slots:
+                return _page_jobs(await self.list_jobs(keep_content=False, **params))
+
+        running = {}
+        try:
+            probes = windows.probes()
+            probed = dict(zip(probes, await asyncio.gather(*map(fetch, probes.values()))))
+            for window in windows.plan(partitions, probed):
+                running[asyncio.ensure_future(fetch(windows.params(window)))] = window
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for window in windows.take(running.pop(task), task.result()):
+                        running[asyncio.ensure_future(fetch(windows.params(window)))] = window
+                for job in windows.completed():
+                    yield job
+            windows.check_done()
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def get_job_history(self, job_id: str):
+        """Get job history/timeline. See JobMixin.get_job_history."""
+        from .._generated.api.jobs import get_job_job_id_history
+
+        validate("get_job_job_id_history", job_id=job_id)
+
+        return await self._coalesce(
+            ("get_job_history", job_id),
+            lambda: self._request(get_job_job_id_history, job_id=job_id),
+        )
@@ -1,4 +1,27 @@
 """Personal Access Token (PAT) operations."""
+from ..validation import validate
+
+
+def _pat_body(label: str, scopes: list = None, expiry: str = None, tenant_id: str = None):
+    """
+    Build the create-PAT request body.
+
+    Raises:
+        ValidationError: If an argument violates the API spec
+    """
+    from .._generated.models.post_pat_body import PostPatBody
+
+    validate("post_pat", label=label, scopes=scopes, expiry=expiry, tenant_id=tenant_id)
+
+    # Build kwargs, only including non-None values to avoid passing None to UNSET fields
+    body_kwargs = {"label": label}
+    if scopes is not None:
+        body_kwargs["scopes"] = scopes
+    if expiry is not None:
+        body_kwargs["expiry"] = expiry
+    if tenant_id is not None:
+        body_kwargs["tenant_id"] = tenant_id
+    return PostPatBody(**body_kwargs)
 
 
 class PATMixin:
@@ -16,25 +39,18 @@ class PATMixin:
             
         Returns:
             Response with status_code, detail.key_id, and detail.token
+
+        Raises:
+            ValidationError: If an argument violates the API spec (checked before sending)
         """
         from .._generated.api.personal_access_tokens import post_pat
-        from .._generated.models.post_pat_body import PostPatBody
-        
-        auth_client = self._auth.get_authenticated_client()
-        
-        # Build kwargs, only including non-None values to avoid passing None to UNSET fields
-        body_kwargs = {"label": label}
-        if scopes is not None:
-            body_kwargs["scopes"] = scopes
-        if expiry is not None:
-            body_kwargs["expiry"] = expiry
-        if tenant_id is not None:
-            body_kwargs["tenant_id"] = tenant_id
         
-        return post_pat.sync_detailed(
-            client=auth_client,
-            body=PostPatBody(**body_kwargs)
+        response = self._request(
+            post_pat,
+            body=_pat_body(label, scopes=scopes, expiry=expiry, tenant_id=tenant_id)
         )
+        self._invalidate("list_pats")
+        return response
     
     def list_pats(self):
         """
@@ -45,8 +61,7 @@ class PATMixin:
         """
         from .._generated.api.personal_access_tokens import get_pat
         
-        auth_client = self._auth.get_authenticated_client()
-        return get_pat.sync_detailed(client=auth_client)
+        return self._cached_read(("list_pats",), get_pat)
     
     def revoke_pat(self, key_id: str):
         """
@@ -60,5 +75,37 @@ class PATMixin:
         """
         from .._generated.api.personal_access_tokens import delete_pat_key_id
         
-        auth_client = self._auth.get_authenticated_client()
-        return delete_pat_key_id.sync_detailed(client=auth_client, key_id=key_id)
+        validate("delete_pat_key_id", key_id=key_id)
+        response = self._request(delete_pat_key_id, key_id=key_id)
+        self._invalidate("list_pats")
+        return response
+
+
+class AsyncPATMixin:
+    """Asyncio counterpart of PATMixin."""
+
+    async def create_pat(self, label: str, scopes: list = None, expiry: str = None, tenant_id: str = None):
+        """Create a Personal Access Token. See PATMixin.create_pat."""
+        from .._generated.api.personal_access_tokens import post_pat
+
+        response = await self._request(
+            post_pat,
+            body=_pat_body(label, scopes=scopes, expiry=expiry, tenant_id=tenant_id)
+        )
+        self._invalidate("list_pats")
+        return response
+
+    async def list_pats(self):
+        """List all Personal Access Tokens. See PATMixin.list_pats."""
+        from .._generated.api.personal_access_tokens import get_pat
+
+        return await self._cached_read(("list_pats",), get_pat)
+
+    async def revoke_pat(self, key_id: str):
+        """Revoke a Personal Access Token. See PATMixin.revoke_pat."""
+        from .._generated.api.personal_access_tokens import delete_pat_key_id
+
+        validate("delete_pat_key_id", key_id=key_id)
+        response = await self._request(delete_pat_key_id, key_id=key_id)
+        self._invalidate("list_pats")
+        return response
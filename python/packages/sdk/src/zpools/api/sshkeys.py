@@ -1,4 +1,5 @@
 """SSH key management operations."""
+from ..validation import validate
 
 
 class SSHKeyMixin:
@@ -13,8 +14,7 @@ class SSHKeyMixin:
         """
         from .._generated.api.ssh_keys import get_sshkey
         
-        auth_client = self._auth.get_authenticated_client()
-        return get_sshkey.sync_detailed(client=auth_client)
+        return self._cached_read(("list_sshkeys",), get_sshkey)
     
     def add_sshkey(self, public_key: str):
         """
@@ -29,12 +29,13 @@ class SSHKeyMixin:
         from .._generated.api.ssh_keys import post_sshkey
         from .._generated.models.post_sshkey_body import PostSshkeyBody
         
-        auth_client = self._auth.get_authenticated_client()
-        
-        return post_sshkey.sync_detailed(
-            client=auth_client,
+        validate("post_sshkey", pubkey=public_key)
+        response = self._request(
+            post_sshkey,
             body=PostSshkeyBody(pubkey=public_key)
         )
+        self._invalidate("list_sshkeys")
+        return response
     
     def delete_sshkey(self, pubkey_id: str):
         """
@@ -48,5 +49,39 @@ class SSHKeyMixin:
         """
         from .._generated.api.ssh_keys import delete_sshkey_pubkey_id
         
-        auth_client = self._auth.get_authenticated_client()
-        return delete_sshkey_pubkey_id.sync_detailed(client=auth_client, pubkey_id=pubkey_id)
+        validate("delete_sshkey_pubkey_id", pubkey_id=pubkey_id)
+        response = self._request(delete_sshkey_pubkey_id, pubkey_id=pubkey_id)
+        self._invalidate("list_sshkeys")
+        return response
+
+
+class AsyncSSHKeyMixin:
+    """Asyncio counterpart of SSHKeyMixin."""
+
+    async def list_sshkeys(self):
+        """List all SSH keys. See SSHKeyMixin.list_sshkeys."""
+        from .._generated.api.ssh_keys import get_sshkey
+
+        return await self._cached_read(("list_sshkeys",), get_sshkey)
+
+    async def add_sshkey(self, public_key: str):
+        """Add an SSH public key. See SSHKeyMixin.add_sshkey."""
+        from .._generated.api.ssh_keys import post_sshkey
+        from .._generated.models.post_sshkey_body import PostSshkeyBody
+
+        validate("post_sshkey", pubkey=public_key)
+        response = await self._request(
+            post_sshkey,
+            body=PostSshkeyBody(pubkey=public_key)
+        )
+        self._invalidate("list_sshkeys")
+        return response
+
+    async def delete_sshkey(self, pubkey_id: str):
+        """Delete an SSH key. See SSHKeyMixin.delete_sshkey."""
+        from .._generated.api.ssh_keys import delete_sshkey_pubkey_id
+
+        validate("delete_sshkey_pubkey_id", pubkey_id=pubkey_id)
+        response = await self._request(delete_sshkey_pubkey_id, pubkey_id=pubkey_id)
+        self._invalidate("list_sshkeys")
+        return response
@@ -1,4 +1,39 @@
 """ZPool management operations."""
+from ..validation import validate
+
+
+def _create_zpool_body(size_gib: int, volume_type: str):
+    """
+    Build the create-zpool request body.
+
+    Raises:
+        ValidationError: If the size or volume type is not accepted by the API
+    """
+    from .._generated.models.post_zpool_body import PostZpoolBody, PostZpoolBodyNewSizeInGib, PostZpoolBodyVolumeType
+
+    validate("post_zpool", new_size_in_gib=size_gib, volume_type=volume_type)
+
+    # Convert to enum types
+    return PostZpoolBody(
+        new_size_in_gib=PostZpoolBodyNewSizeInGib(size_gib),
+        volume_type=PostZpoolBodyVolumeType(volume_type),
+    )
+
+
+def _modify_zpool_body(zpool_id: str, target_volume_type: str):
+    """
+    Build the modify-zpool request body.
+
+    Raises:
+        ValidationError: If zpool_id is empty or the volume type is not accepted by the API
+    """
+    from .._generated.models.post_zpool_zpool_id_modify_body import PostZpoolZpoolIdModifyBody
+    from .._generated.models.post_zpool_zpool_id_modify_body_volume_type import PostZpoolZpoolIdModifyBodyVolumeType
+
+    validate("post_zpool_zpool_id_modify", zpool_id=zpool_id, volume_type=target_volume_type)
+
+    # Convert string to enum type
+    return PostZpoolZpoolIdModifyBody(volume_type=PostZpoolZpoolIdModifyBodyVolumeType(target_volume_type))
 
 
 class ZPoolMixin:
@@ -16,20 +51,15 @@ class ZPoolMixin:
             
         Returns:
             Response with status_code 202, zpool_id, and job_id
+
+        Raises:
+            ValidationError: If size_gib or volume_type is not accepted by the API (checked before sending)
         """
         from .._generated.api.zpools import post_zpool
-        from .._generated.models.post_zpool_body import PostZpoolBody, PostZpoolBodyNewSizeInGib, PostZpoolBodyVolumeType
-        
-        auth_client = self._auth.get_authenticated_client()
         
-        # Convert to enum types
-        size_enum = PostZpoolBodyNewSizeInGib(size_gib)
-        vol_type_enum = PostZpoolBodyVolumeType(volume_type)
-        
-        return post_zpool.sync_detailed(
-            client=auth_client,
-            body=PostZpoolBody(new_size_in_gib=size_enum, volume_type=vol_type_enum)
-        )
+        response = self._request(post_zpool, body=_create_zpool_body(size_gib, volume_type))
+        self._invalidate("list_zpools", "list_jobs")
+        return response
     
     def list_zpools(self):
         """
@@ -40,8 +70,7 @@ class ZPoolMixin:
         """
         from .._generated.api.zpools import get_zpools
         
-        auth_client = self._auth.get_authenticated_client()
-        return get_zpools.sync_detailed(client=auth_client)
+        return self._cached_read(("list_zpools",), get_zpools)
     
     def delete_zpool(self, zpool_id: str):
         """
@@ -55,8 +84,10 @@ class ZPoolMixin:
         """
         from .._generated.api.zpools import delete_zpool_zpool_id
         
-        auth_client = self._auth.get_authenticated_client()
-        return delete_zpool_zpool_id.sync_detailed(client=auth_client, zpool_id=zpool_id)
+        validate("delete_zpool_zpool_id", zpool_id=zpool_id)
+        response = self._request(delete_zpool_zpool_id, zpool_id=zpool_id)
+        self._invalidate("list_zpools", "list_jobs")
+        return response
     
     def scrub_zpool(self, zpool_id: str):
         """
@@ -70,8 +101,10 @@ class ZPoolMixin:
         """
         from .._generated.api.zpools import post_zpool_zpool_id_scrub
         
-        auth_client = self._auth.get_authenticated_client()
-        return post_zpool_zpool_id_scrub.sync_detailed(client=auth_client, zpool_id=zpool_id)
+        validate("post_zpool_zpool_id_scrub", zpool_id=zpool_id)
+        response = self._request(post_zpool_zpool_id_scrub, zpool_id=zpool_id)
+        self._invalidate("list_zpools", "list_jobs")
+        return response
     
     def modify_zpool(self, zpool_id: str, target_volume_type: str):
         """
@@ -86,18 +119,64 @@ class ZPoolMixin:
             
         Returns:
             Response with status_code 202 and summary of submitted modifications
+
+        Raises:
+            ValidationError: If zpool_id is empty or target_volume_type is not gp3 or sc1 (checked before sending)
         """
         from .._generated.api.zpools import post_zpool_zpool_id_modify
-        from .._generated.models.post_zpool_zpool_id_modify_body import PostZpoolZpoolIdModifyBody
-        from .._generated.models.post_zpool_zpool_id_modify_body_volume_type import PostZpoolZpoolIdModifyBodyVolumeType
-        
-        auth_client = self._auth.get_authenticated_client()
         
-        # Convert string to enum type
-        vol_type_enum = PostZpoolZpoolIdModifyBodyVolumeType(target_volume_type)
-        
-        return post_zpool_zpool_id_modify.sync_detailed(
-            client=auth_client,
+        response = self._request(
+            post_zpool_zpool_id_modify,
+            zpool_id=zpool_id,
+            body=_modify_zpool_body(zpool_id, target_volume_type)
+        )
+        self._invalidate("list_zpools", "list_jobs")
+        return response
+
+
+class AsyncZPoolMixin:
+    """Asyncio counterpart of ZPoolMixin."""
+
+    async def create_zpool(self, size_gib: int = 125, volume_type: str = "gp3"):
+        """Create a new zpool (async operation). See ZPoolMixin.create_zpool."""
+        from .._generated.api.zpools import post_zpool
+
+        response = await self._request(post_zpool, body=_create_zpool_body(size_gib, volume_type))
+        self._invalidate("list_zpools", "list_jobs")
+        return response
+
+    async def list_zpools(self):
+        """List all zpools. See ZPoolMixin.list_zpools."""
+        from .._generated.api.zpools import get_zpools
+
+        return await self._cached_read(("list_zpools",), get_zpools)
+
+    async def delete_zpool(self, zpool_id: str):
+        """Delete a zpool. See ZPoolMixin.delete_zpool."""
+        from .._generated.api.zpools import delete_zpool_zpool_id
+
+        validate("delete_zpool_zpool_id", zpool_id=zpool_id)
+        response = await self._request(delete_zpool_zpool_id, zpool_id=zpool_id)
+        self._invalidate("list_zpools", "list_jobs")
+        return response
+
+    async def scrub_zpool(self, zpool_id: str):
+        """Start scrub on a zpool. See ZPoolMixin.scrub_zpool."""
+        from .._generated.api.zpools import post_zpool_zpool_id_scrub
+
+        validate("post_zpool_zpool_id_scrub", zpool_id=zpool_id)
+        response = await self._request(post_zpool_zpool_id_scrub, zpool_id=zpool_id)
+        self._invalidate("list_zpools", "list_jobs")
+        return response
+
+    async def modify_zpool(self, zpool_id: str, target_volume_type: str):
+        """Change a zpool's EBS volume type. See ZPoolMixin.modify_zpool."""
+        from .._generated.api.zpools import post_zpool_zpool_id_modify
+
+        response = await self._request(
+            post_zpool_zpool_id_modify,
             zpool_id=zpool_id,
-            body=PostZpoolZpoolIdModifyBody(volume_type=vol_type_enum)
+            body=_modify_zpool_body(zpool_id, target_volume_type)
         )
+        self._invalidate("list_zpools", "list_jobs")
+        return response
@@ -0,0 +1,190 @@
+"""
+Asyncio API client for zpools.io.
+
+AsyncZPoolsClient mirrors ZPoolsClient's API operations as coroutines, sharing a
+single pooled httpx.AsyncClient so many zpool/job operations can be driven
+concurrently from one event loop.
+"""
+from typing import Optional
+
+from .auth import DEFAULT_TOKEN_REFRESH_SKEW, AsyncAuthManager
+from .api.pats import AsyncPATMixin
+from .api.sshkeys import AsyncSSHKeyMixin
+from .api.zpools import AsyncZPoolMixin
+from .api.jobs import AsyncJobMixin
+from .api.billing import AsyncBillingMixin
+from .cache import ResponseCache, async_cached_read
+from .coalesce import AsyncSingleFlight
+from .raw import build_response, item_builder, release_content
+from .retry import RetryPolicy, RetryStats
+from .structs import check_structs_available
+from .stream import aiter_json_array
+from .transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    check_http2_available,
+)
+
+
+class AsyncZPoolsClient(AsyncPATMixin, AsyncSSHKeyMixin, AsyncZPoolMixin, AsyncJobMixin, AsyncBillingMixin):
+    """
+    Asyncio API client for zpools.io that handles authentication (PAT/JWT).
+
+    Takes the same arguments as ZPoolsClient except the SSH options; ZFS-over-SSH
+    operations are only available on ZPoolsClient. Use as an async context manager
+    or call ``await client.close()`` to release the connection pool.
+    """
+
+    DEFAULT_API_URL = "https://api.zpools.io/v1"
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pat: Optional[str] = None,
+        token_cache_dir: Optional[str] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: Optional[float] = None,
+        token_refresh_skew: float = DEFAULT_TOKEN_REFRESH_SKEW,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        raw: bool = False,
+        keep_content: bool = True,
+        structs: bool = False,
+    ):
+        """
+        Initialize the asyncio zpools.io API client.
+
+        Args:
+            api_url: API base URL (default: https://api.zpools.io/v1)
+            username: Username for JWT authentication
+            password: Password for JWT authentication
+            pat: Personal Access Token (alternative to JWT)
+            token_cache_dir: Base directory for JWT token cache (unset = no cache; set explicitly to enable)
+            max_connections: Maximum concurrent HTTP connections in the shared pool
+            max_keepalive_connections: Maximum idle connections kept alive in the pool
+            keepalive_expiry: Seconds an idle connection is kept alive
+            timeout: HTTP request timeout in seconds (default: httpx default)
+            token_refresh_skew: Seconds before JWT expiry to fetch a new token (default: 60)
+            retry_policy: Retry policy for connection errors, 429 and 5xx responses
+                (default: None, no retries; pass RetryPolicy() to enable them)
+            http2: Multiplex concurrent requests over a single HTTP/2 connection
+                (requires the optional h2 dependency: pip install 'zpools-sdk[http2]')
+            coalesce_requests: Share one request and parsed Response between identical
+                reads (list_zpools, get_job, ...) issued concurrently (default: False). Callers
+                then receive the same mutable Response object and must not modify it
+            response_cache: Opt-in ResponseCache for list_zpools, list_sshkeys, list_pats and
+                get_billing_balance (default: no caching)
+            raw: Return responses whose parsed value is the decoded JSON (plain dicts)
+                instead of generated models; faster when only dicts are needed
+            keep_content: Keep the raw body bytes of successful responses after parsing
+                (see ZPoolsClient)
+            structs: Decode responses straight into msgspec Structs (see ZPoolsClient)
+        """
+        if raw and structs:
+            raise ValueError("raw and structs are mutually exclusive")
+        if structs:
+            check_structs_available()
+        if http2:
+            check_http2_available()
+        self.retry_stats = RetryStats()
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.response_cache = response_cache
+        self.raw = raw
+        # How response bodies are parsed: "models", "raw" or "structs"
+        self.decoder = "raw" if raw else "structs" if structs else "models"
+        self.keep_content = keep_content
+        self._auth = AsyncAuthManager(
+            api_url=api_url,
+            username=username,
+            password=password,
+            pat=pat,
+            token_cache_dir=token_cache_dir,
+            http_options={
+                "max_connections": max_connections,
+                "max_keepalive_connections": max_keepalive_connections,
+                "keepalive_expiry": keepalive_expiry,
+                "timeout": timeout,
+                "retry_policy": retry_policy,
+                "retry_stats": self.retry_stats,
+                "http2": http2,
+            },
+            token_refresh_skew=token_refresh_skew,
+        )
+
+    async def _coalesce(self, key, fn):
+        """Await an API read, sharing it with identical reads already in flight."""
+        if self._single_flight is None:
+            return await fn()
+        return await self._single_flight.do(key, fn)
+
+    async def _request(self, endpoint, keep_content=None, **params):
+        """
+        Await a generated endpoint module (e.g. get_zpools) with the endpoint's parameters.
+
+        keep_content overrides the client's keep_content for this call.
+        """
+        auth_client = await self._auth.get_authenticated_client()
+        if self.decoder == "models":
+            response = await endpoint.asyncio_detailed(client=auth_client, **params)
+        else:
+            http_response = await auth_client.get_async_httpx_client().request(**endpoint._get_kwargs(**params))
+            response = build_response(endpoint, auth_client, http_response, self.decoder)
+        if not (self.keep_content if keep_content is None else keep_content):
+            release_content(response)
+        return response
+
+    async def _iter_items(self, endpoint, path, model, **params):
+        """Stream a generated GET endpoint and yield array elements. See ZPoolsClient._iter_items."""
+        from ._generated.errors import UnexpectedStatus
+
+        build = item_builder(model, self.decoder)
+        auth_client = await self._auth.get_authenticated_client()
+        async with auth_client.get_async_httpx_client().stream(**endpoint._get_kwargs(**params)) as response:
+            if response.status_code != 200:
+                raise UnexpectedStatus(response.status_code, await response.aread())
+            async for item in aiter_json_array(response.aiter_bytes(), path):
+                yield build(item)
+
+    async def _cached_read(self, key, endpoint, keep_content=None, **params):
+        """
+        Await a generated GET endpoint through the response cache (if enabled) and coalescing.
+
+        Cached responses always keep their content (it is what the cache persists and revalidates),
+        so reads with keep_content=False (e.g. the pages of iter_jobs) bypass the cache.
+        """
+        if self.response_cache is None or keep_content is False or not self.response_cache.caches(key[0]):
+            return await self._coalesce(
+                key + (keep_content,), lambda: self._request(endpoint, keep_content=keep_content, **params)
+            )
+        auth_client = await self._auth.get_authenticated_client()
+        if self.decoder != "models":
+            key = key + (self.decoder,)
+        return await self._coalesce(
+            key, lambda: async_cached_read(self.response_cache, key, endpoint, auth_client, params, self.decoder)
+        )
+
+    def _invalidate(self, *operations):
+        """Drop cached responses made stale by a mutation."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(*operations)
+
+    async def get_authenticated_client(self):
+        """Returns the raw client with the Authorization header set (use its asyncio_* endpoints)."""
+        return await self._auth.get_authenticated_client()
+
+    async def close(self):
+        """Close the shared HTTP connection pool."""
+        await self._auth.close()
+
+    async def __aenter__(self) -> "AsyncZPoolsClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
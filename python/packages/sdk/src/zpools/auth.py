@@ -1,13 +1,74 @@
 """Authentication and token management for zpools.io API."""
+import asyncio
 import os
 import json
+import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from ._generated import Client
-from ._generated.api.authentication import post_login
-from ._generated.models.post_login_body import PostLoginBody
+import httpx
+
+from ._generated import AuthenticatedClient, Client
+from .transport import TokenAuth, build_async_http_client, build_http_client
+
+if TYPE_CHECKING:
+    from ._generated.models.post_login_body import PostLoginBody
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+# Refresh JWTs this many seconds before they expire
+DEFAULT_TOKEN_REFRESH_SKEW = 60
+
+
+def _acquire_lock(path: Path) -> Optional[int]:
+    """Open and exclusively lock path, blocking until available. Returns the fd (None if unsupported)."""
+    if fcntl is None:
+        return None
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _release_lock(fd: Optional[int]) -> None:
+    """Release a lock taken with _acquire_lock."""
+    if fd is None:
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _release_abandoned_lock(future) -> None:
+    """Done callback of a lock acquisition whose waiter was cancelled: release the lock once taken."""
+    if not future.cancelled() and future.exception() is None:
+        _release_lock(future.result())
+
+
+def _atomic_write(path: Path, data: str) -> None:
+    """Write data to path (mode 0600) via a temp file and rename, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 class AuthManager:
@@ -20,6 +81,8 @@ class AuthManager:
         password: Optional[str] = None,
         pat: Optional[str] = None,
         token_cache_dir: Optional[str] = None,
+        http_options: Optional[dict] = None,
+        token_refresh_skew: float = DEFAULT_TOKEN_REFRESH_SKEW,
     ):
         """
         Initialize authentication manager.
@@ -31,6 +94,10 @@ class AuthManager:
             pat: Personal Access Token (alternative to JWT)
             token_cache_dir: Base directory for JWT token cache. If unset or empty,
                 JWT tokens are not cached (most secure). Set explicitly to enable caching.
+            http_options: Keyword arguments for transport.build_http_client() used to
+                build the shared pooled connection (limits, keep-alive, timeout).
+            token_refresh_skew: Seconds before JWT expiry at which a new token is
+                fetched proactively.
         """
         self.api_url = api_url
         self.username = username
@@ -47,6 +114,23 @@ class AuthManager:
         
         self._raw_client = Client(base_url=self.api_url)
         self._token_file = self._get_token_file_path() if (self.username and self._token_cache_dir) else None
+
+        # JWT held in memory as one (access_token, expires_at) tuple, so threads
+        # never see a token paired with another token's expiry; the disk cache
+        # is only read on first use
+        self.token_refresh_skew = token_refresh_skew
+        self._token: Tuple[Optional[str], float] = (None, 0)
+        self._cache_loaded = False
+        # Serializes cache loading and logins between threads (one login for all of them)
+        self._refresh_lock = threading.Lock()
+        # Guards building the shared pooled connection and re-keying the AuthenticatedClient
+        self._client_lock = threading.Lock()
+
+        # Shared pooled connection; built on first authenticated call and re-keyed on token change
+        self._http_options = dict(http_options or {})
+        self._http_client: Optional[httpx.Client] = None
+        self._authenticated_client: Optional[AuthenticatedClient] = None
+        self._client_token: Optional[str] = None
     
     def set_password(self, password: str):
         """Set the password for login if not provided during init."""
@@ -64,30 +148,47 @@ class AuthManager:
         base_dir.mkdir(parents=True, exist_ok=True)
         return base_dir / f"zpool_token_{domain_clean}_{user_safe}"
     
-    def _get_cached_token(self) -> Optional[str]:
-        """Retrieve valid access token from cache if it exists and isn't expired."""
+    def _read_token_cache(self) -> Optional[Tuple[str, float]]:
+        """Read (access_token, expires_at) from the disk cache if it exists and isn't expired."""
         if self._token_file is None or not self._token_file.exists():
             return None
             
         try:
             data = json.loads(self._token_file.read_text())
             expires_at = data.get("expires_at", 0)
-            if time.time() < expires_at:
-                return data.get("access_token")
+            access_token = data.get("access_token")
+            if access_token and time.time() < expires_at:
+                return access_token, expires_at
         except Exception:
             return None
         return None
+
+    def _load_cached_token(self) -> None:
+        """Load the disk-cached token into memory (disk is only consulted once)."""
+        if self._cache_loaded:
+            return
+        self._cache_loaded = True
+        cached = self._read_token_cache()
+        if cached:
+            self._token = cached
+
+    def _memoized_token(self) -> Optional[str]:
+        """Return the in-memory token unless it is within token_refresh_skew of expiry."""
+        access_token, expires_at = self._token
+        if access_token and time.time() < expires_at - self.token_refresh_skew:
+            return access_token
+        return None
     
-    def _login(self) -> str:
-        """Perform login to get new JWT tokens."""
+    def _login_body(self) -> "PostLoginBody":
+        """Build the login request body from the configured credentials."""
+        from ._generated.models.post_login_body import PostLoginBody
+
         if not self.username or not self.password:
             raise ValueError("Username and password are required for login.")
+        return PostLoginBody(username=self.username, password=self.password)
 
-        response = post_login.sync_detailed(
-            client=self._raw_client,
-            body=PostLoginBody(username=self.username, password=self.password)
-        )
-
+    def _handle_login_response(self, response) -> str:
+        """Extract the access token from a login response and cache it."""
         if response.status_code not in (200, 201):
             raise RuntimeError(f"Login failed: {response.status_code} - {response.content}")
 
@@ -98,6 +199,7 @@ class AuthManager:
         expires_in = detail.expires_in
         
         expires_at = int(time.time()) + expires_in
+        self._token = (access_token, expires_at)
         
         # Cache tokens (only if cache is enabled)
         if self._token_file is not None:
@@ -107,34 +209,244 @@ class AuthManager:
                 "expires_at": expires_at
             }
             self._token_file.parent.mkdir(parents=True, exist_ok=True)
-            self._token_file.touch(mode=0o600)
-            self._token_file.write_text(json.dumps(token_data))
+            _atomic_write(self._token_file, json.dumps(token_data))
         
         return access_token
+
+    def _lock_token_file(self) -> Optional[int]:
+        """Take the cross-process token cache lock (blocking); None if caching is disabled."""
+        if self._token_file is None:
+            return None
+        self._token_file.parent.mkdir(parents=True, exist_ok=True)
+        return _acquire_lock(self._token_file.with_name(self._token_file.name + ".lock"))
+
+    def _refreshed_by_peer(self, stale_token: Optional[str] = None) -> Optional[str]:
+        """
+        Re-read the disk cache while holding the lock.
+
+        Another process may have logged in while we waited for the lock; if so,
+        adopt its token instead of logging in again. A cached token equal to
+        stale_token (one the server rejected) is ignored.
+        """
+        if self._token_file is None:
+            return None
+        cached = self._read_token_cache()
+        if cached and cached[0] != stale_token and time.time() < cached[1] - self.token_refresh_skew:
+            self._token = cached
+            return cached[0]
+        return None
+
+    def _login(self, stale_token: Optional[str] = None) -> str:
+        """
+        Perform login to get new JWT tokens.
+
+        With a token cache enabled, login is coordinated across processes: one
+        process logs in while the others wait on the lock and reuse its token.
+        """
+        from ._generated.api.authentication import post_login
+
+        body = self._login_body()
+        lock_fd = self._lock_token_file()
+        try:
+            token = self._refreshed_by_peer(stale_token)
+            if token:
+                return token
+            response = post_login.sync_detailed(client=self._raw_client, body=body)
+            return self._handle_login_response(response)
+        finally:
+            _release_lock(lock_fd)
     
     def get_token(self) -> str:
         """
         Get a valid authentication token.
         Priority:
         1. PAT (if configured)
-        2. Cached JWT (if valid)
+        2. In-memory JWT (loaded from the disk cache on first use) if not near expiry
         3. New JWT (via login)
+
+        Thread-safe: threads that find no valid token wait for a single login
+        and share its token.
         """
         if self.pat:
             return self.pat
-            
-        token = self._get_cached_token()
+
+        token = self._memoized_token()
         if token:
             return token
-            
-        return self._login()
+
+        with self._refresh_lock:
+            # Another thread may have loaded the cache or logged in while we waited
+            self._load_cached_token()
+            token = self._memoized_token()
+            if token:
+                return token
+            return self._login()
+
+    def can_refresh(self) -> bool:
+        """Return True if a rejected token can be replaced by logging in again (JWT with password)."""
+        return not self.pat and bool(self.username and self.password)
+
+    def _peer_refreshed_token(self, stale_token: str) -> Optional[str]:
+        """Return a valid in-memory token other than stale_token (another caller already re-authenticated)."""
+        token = self._memoized_token()
+        if token and token != stale_token:
+            return token
+        return None
+
+    def refresh_token(self, stale_token: str) -> str:
+        """
+        Replace a token the server rejected (401).
+
+        Single-flight: concurrent callers that saw the same stale token share one
+        login; callers arriving after it completed get the new token directly.
+        """
+        with self._refresh_lock:
+            token = self._peer_refreshed_token(stale_token)
+            if token:
+                return token
+            return self._login(stale_token=stale_token)
     
-    def get_authenticated_client(self):
-        """Returns an AuthenticatedClient with the Authorization header set."""
-        from ._generated import AuthenticatedClient
-        
+    def _get_http_client(self) -> httpx.Client:
+        """Return the shared pooled httpx client, building it on first use."""
+        with self._client_lock:
+            if self._http_client is None:
+                self._http_client = build_http_client(self.api_url, auth=TokenAuth(self), **self._http_options)
+            return self._http_client
+
+    def _rekey(self, token: str, http_client) -> AuthenticatedClient:
+        """Return the cached AuthenticatedClient, rebuilding it if the token changed."""
+        with self._client_lock:
+            if self._authenticated_client is None or token != self._client_token:
+                # The shared client's TokenAuth sets the Authorization header on each request
+                auth_client = AuthenticatedClient(base_url=self.api_url, token=token)
+                if isinstance(http_client, httpx.AsyncClient):
+                    auth_client.set_async_httpx_client(http_client)
+                else:
+                    auth_client.set_httpx_client(http_client)
+                self._authenticated_client = auth_client
+                self._client_token = token
+            return self._authenticated_client
+
+    def get_authenticated_client(self) -> AuthenticatedClient:
+        """
+        Returns an AuthenticatedClient with the Authorization header set.
+
+        All returned clients share one pooled httpx connection. A new wrapper is
+        only built when the token changes. Requests rejected with 401 are
+        re-authenticated transparently (see transport.TokenAuth). Safe to call
+        from several threads; the pool (httpx.Client) is thread-safe.
+        """
         token = self.get_token()
-        return AuthenticatedClient(
-            base_url=self.api_url,
-            token=token
-        )
+        return self._rekey(token, self._get_http_client())
+
+    def close(self):
+        """
+        Close pooled connections held by this manager.
+
+        Call it once no other thread is using the client.
+        """
+        with self._client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            self._authenticated_client = None
+            self._client_token = None
+        with self._refresh_lock:
+            if self._raw_client._client is not None:
+                self._raw_client.get_httpx_client().close()
+                self._raw_client = Client(base_url=self.api_url)
+
+
+class AsyncAuthManager(AuthManager):
+    """
+    Asyncio counterpart of AuthManager.
+
+    Token caching and validation are shared with AuthManager; login and API calls
+    go through a single pooled httpx.AsyncClient. Concurrent callers that find no
+    valid token wait on one login instead of each logging in.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._login_lock: Optional[asyncio.Lock] = None
+
+    async def _login(self, stale_token: Optional[str] = None) -> str:
+        """Perform login to get new JWT tokens (coordinated across processes like AuthManager._login)."""
+        from ._generated.api.authentication import post_login
+
+        body = self._login_body()
+        # Wait for the file lock in a worker thread so the event loop keeps running.
+        # Cancelling the wait cannot stop the thread, so the lock it takes is then
+        # released as soon as it has it.
+        acquiring = asyncio.get_running_loop().run_in_executor(None, self._lock_token_file)
+        try:
+            lock_fd = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(_release_abandoned_lock)
+            raise
+        try:
+            token = self._refreshed_by_peer(stale_token)
+            if token:
+                return token
+            response = await post_login.asyncio_detailed(client=self._raw_client, body=body)
+            return self._handle_login_response(response)
+        finally:
+            _release_lock(lock_fd)
+
+    async def get_token(self) -> str:
+        """
+        Get a valid authentication token (same priority as AuthManager.get_token).
+        """
+        if self.pat:
+            return self.pat
+
+        self._load_cached_token()
+        token = self._memoized_token()
+        if token:
+            return token
+
+        async with self._get_login_lock():
+            # Another task may have logged in while we waited
+            token = self._memoized_token()
+            if token:
+                return token
+            return await self._login()
+
+    def _get_login_lock(self) -> asyncio.Lock:
+        """Return the login lock, created lazily so it binds to the running event loop."""
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        return self._login_lock
+
+    async def refresh_token(self, stale_token: str) -> str:
+        """Replace a token the server rejected (401); single-flight like AuthManager.refresh_token."""
+        async with self._get_login_lock():
+            token = self._peer_refreshed_token(stale_token)
+            if token:
+                return token
+            return await self._login(stale_token=stale_token)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled httpx.AsyncClient, building it on first use."""
+        if self._http_client is None:
+            self._http_client = build_async_http_client(self.api_url, auth=TokenAuth(self), **self._http_options)
+        return self._http_client
+
+    async def get_authenticated_client(self) -> AuthenticatedClient:
+        """
+        Returns an AuthenticatedClient whose async httpx client is the shared pool.
+        """
+        token = await self.get_token()
+        return self._rekey(token, self._get_http_client())
+
+    async def close(self):
+        """Close pooled connections held by this manager."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self._authenticated_client = None
+        self._client_token = None
+        if self._raw_client._async_client is not None:
+            await self._raw_client.get_async_httpx_client().aclose()
+            self._raw_client = Client(base_url=self.api_url)
@@ -0,0 +1,356 @@
+"""Opt-in in-memory cache for zpools.io API list reads.
+
+ResponseCache keeps parsed Responses for list_zpools, list_sshkeys, list_pats
+and get_billing_balance for a per-operation TTL, evicting the least recently
+used entries beyond max_entries. Once an entry is stale it is revalidated with
+If-None-Match / If-Modified-Since when the server sent an ETag or
+Last-Modified header; a 304 keeps the cached Response without re-parsing.
+Mutations (create_zpool, add_sshkey, revoke_pat, ...) invalidate the
+operations they affect.
+
+DiskResponseCache additionally persists entries to a directory, so separate
+processes (e.g. repeated zpcli invocations) can share them. It stores
+responses even for operations its own TTL does not serve from the cache.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, Optional
+
+import httpx
+
+from .auth import _atomic_write
+from .raw import build_response
+
+DEFAULT_TTLS = {
+    "list_zpools": 30.0,
+    "list_sshkeys": 300.0,
+    "list_pats": 300.0,
+    "get_billing_balance": 60.0,
+}
+DEFAULT_MAX_ENTRIES = 256
+
+
+# Headers kept with persisted entries (content is stored decoded, so no encoding headers)
+_PERSISTED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class _Entry:
+    """
+    A cached Response with its validators.
+
+    Entries loaded from disk hold the raw httpx.Response and are parsed on first use.
+    """
+
+    __slots__ = ("response", "http_response", "expires_at", "etag", "last_modified")
+
+    def __init__(self, response, expires_at: float, headers: httpx.Headers, http_response: Optional[httpx.Response] = None):
+        self.response = response
+        self.http_response = http_response
+        self.expires_at = expires_at
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+
+    def parsed(self, endpoint, auth_client, decoder: str = "models"):
+        """The cached Response, parsing a disk-loaded entry with the generated endpoint module."""
+        # Read http_response first: another thread parsing the entry only clears it after setting
+        # response. Two threads may both parse it; either result is the same.
+        http_response = self.http_response
+        if self.response is None:
+            self.response = build_response(endpoint, auth_client, http_response, decoder)
+            self.http_response = None
+        return self.response
+
+    def source(self):
+        """The Response (or raw httpx.Response) carrying status, headers and content."""
+        http_response = self.http_response
+        response = self.response
+        return response if response is not None else http_response
+
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> dict:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of parsed API responses.
+
+    Keys are (operation, *arguments) tuples; the TTL is looked up by operation.
+
+    Attributes:
+        hits: Reads answered from a fresh entry
+        misses: Reads with no usable entry (full request and parse)
+        revalidations: Stale entries confirmed unchanged by a 304
+        evictions: Entries dropped to stay within max_entries
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize a response cache.
+
+        Args:
+            ttls: Seconds each operation's responses stay fresh, merged over
+                DEFAULT_TTLS (a TTL of 0 disables caching for that operation).
+                "list_jobs" can also be cached but has no default TTL.
+            max_entries: Maximum number of cached responses (least recently used are evicted)
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generations = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def caches(self, operation: str) -> bool:
+        """Whether responses of this operation are cached."""
+        return self.ttls.get(operation, 0) > 0
+
+    def lookup(self, key: Hashable) -> Optional[_Entry]:
+        """Return the entry for key (fresh or stale), marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._load(key)
+        if entry is not None:
+            with self._lock:
+                self._insert(key, entry)
+        return entry
+
+    def generation(self, operation: str) -> int:
+        """Invalidation counter for an operation; pass it back to store()."""
+        with self._lock:
+            return self._generations.get(operation, 0)
+
+    def hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def store(self, key: Hashable, response, generation: int) -> None:
+        """
+        Cache a successful Response.
+
+        Args:
+            key: Cache key; key[0] is the operation name
+            response: Parsed Response from the generated client
+            generation: generation(key[0]) taken before the request was sent. If the
+                operation was invalidated since, the response may be stale and is not stored.
+        """
+        operation = key[0]
+        with self._lock:
+            self.misses += 1
+            if response.status_code != 200 or self._generations.get(operation, 0) != generation:
+                return
+            entry = _Entry(response, time.monotonic() + self.ttls.get(operation, 0), response.headers)
+            self._insert(key, entry)
+        self._persist(key, entry)
+
+    def _insert(self, key: Hashable, entry: _Entry) -> None:
+        """Add an entry and evict beyond max_entries. Caller holds the lock."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def revalidated(self, key: Hashable, entry: _Entry, headers: httpx.Headers, generation: int) -> None:
+        """Extend a stale entry after the server answered 304 Not Modified."""
+        operation = key[0]
+        with self._lock:
+            self.revalidations += 1
+            if self._entries.get(key) is not entry or self._generations.get(operation, 0) != generation:
+                return
+            entry.expires_at = time.monotonic() + self.ttls.get(operation, 0)
+            entry.etag = headers.get("ETag", entry.etag)
+            entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        self._persist(key, entry)
+
+    def invalidate(self, *operations: str) -> None:
+        """Drop every cached response of the given operations."""
+        with self._lock:
+            for operation in operations:
+                self._generations[operation] = self._generations.get(operation, 0) + 1
+            for key in [key for key in self._entries if key[0] in operations]:
+                del self._entries[key]
+        self._discard(operations)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            operations = {key[0] for key in self._entries}
+        self.invalidate(*operations)
+
+    # Persistence hooks; the in-memory cache keeps nothing beyond the process
+
+    def _load(self, key: Hashable) -> Optional[_Entry]:
+        return None
+
+    def _persist(self, key: Hashable, entry: _Entry) -> None:
+        pass
+
+    def _discard(self, operations) -> None:
+        pass
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+            }
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    ResponseCache that also persists entries under a directory.
+
+    Each entry is one JSON file (mode 0600) holding the status, validators and
+    body, stored at ``<directory>/<operation>/<key hash>.json``. Freshness is
+    judged by the file's stored_at time against the TTLs of the reading
+    process, so each reader can choose its own maximum age. Every operation
+    with a TTL (DEFAULT_TTLS and the ttls given) is stored, even with a TTL of
+    0: such a reader always revalidates or fetches, but leaves the response
+    for readers with a larger maximum age. Invalidating an operation removes
+    its files for every process sharing the directory.
+
+    Cached bodies are account data: use a private directory per account and API URL.
+    """
+
+    def __init__(
+        self,
+        directory,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize a disk-backed response cache.
+
+        Args:
+            directory: Cache directory (created with mode 0700 if missing)
+            ttls: Seconds each operation's responses stay fresh, merged over DEFAULT_TTLS
+            max_entries: Maximum number of responses kept in memory
+        """
+        super().__init__(ttls=ttls, max_entries=max_entries)
+        self.directory = Path(directory).expanduser()
+
+    def caches(self, operation: str) -> bool:
+        """Whether responses of this operation are stored (fresh for this reader or not)."""
+        return operation in self.ttls
+
+    def _path(self, key: Hashable) -> Path:
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+        return self.directory / key[0] / f"{digest}.json"
+
+    def _load(self, key: Hashable) -> Optional[_Entry]:
+        ttl = self.ttls.get(key[0], 0)
+        try:
+            data = json.loads(self._path(key).read_text())
+            if data["key"] != repr(key):
+                return None
+            age = time.time() - data["stored_at"]
+            http_response = httpx.Response(
+                data["status_code"],
+                headers=data["headers"],
+                content=data["content"].encode("utf-8", "surrogateescape"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return _Entry(None, time.monotonic() + ttl - age, http_response.headers, http_response=http_response)
+
+    def _persist(self, key: Hashable, entry: _Entry) -> None:
+        source = entry.source()
+        data = {
+            "key": repr(key),
+            "stored_at": time.time(),
+            "status_code": int(source.status_code),
+            "headers": {name: source.headers[name] for name in _PERSISTED_HEADERS if name in source.headers},
+            "content": source.content.decode("utf-8", "surrogateescape"),
+        }
+        path = self._path(key)
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            _atomic_write(path, json.dumps(data))
+        except OSError:
+            pass  # An unwritable cache only costs a request next time
+
+    def _discard(self, operations) -> None:
+        for operation in operations:
+            shutil.rmtree(self.directory / operation, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Drop all cached responses, in memory and on disk."""
+        super().clear()
+        if self.directory.is_dir():
+            self._discard([entry.name for entry in os.scandir(self.directory) if entry.is_dir()])
+
+
+def _request_kwargs(endpoint, entry: Optional[_Entry], params: dict) -> dict:
+    """Request kwargs of a generated endpoint module, plus validators for a stale entry."""
+    kwargs = endpoint._get_kwargs(**params)
+    if entry is not None:
+        kwargs["headers"] = {**kwargs.get("headers", {}), **entry.validators()}
+    return kwargs
+
+
+def cached_read(cache: ResponseCache, key: Hashable, endpoint, auth_client, params: dict, decoder: str = "models"):
+    """
+    Read through the cache using a generated endpoint module (e.g. get_zpools).
+
+    Responses are built with build_response() in the client's decoder mode
+    ("models", "raw" or "structs").
+
+    Returns:
+        The cached Response when fresh or confirmed by a 304, else a freshly parsed one
+    """
+    entry = cache.lookup(key)
+    if entry is not None and entry.fresh():
+        cache.hit()
+        return entry.parsed(endpoint, auth_client, decoder)
+
+    generation = cache.generation(key[0])
+    http_response = auth_client.get_httpx_client().request(**_request_kwargs(endpoint, entry, params))
+    if entry is not None and http_response.status_code == 304:
+        cache.revalidated(key, entry, http_response.headers, generation)
+        return entry.parsed(endpoint, auth_client, decoder)
+    response = build_response(endpoint, auth_client, http_response, decoder)
+    cache.store(key, response, generation)
+    return response
+
+
+async def async_cached_read(
+    cache: ResponseCache, key: Hashable, endpoint, auth_client, params: dict, decoder: str = "models"
+):
+    """Asyncio counterpart of cached_read()."""
+    entry = cache.lookup(key)
+    if entry is not None and entry.fresh():
+        cache.hit()
+        return entry.parsed(endpoint, auth_client, decoder)
+
+    generation = cache.generation(key[0])
+    http_response = await auth_client.get_async_httpx_client().request(**_request_kwargs(endpoint, entry, params))
+    if entry is not None and http_response.status_code == 304:
+        cache.revalidated(key, entry, http_response.headers, generation)
+        return entry.parsed(endpoint, auth_client, decoder)
+    response = build_response(endpoint, auth_client, http_response, decoder)
+    cache.store(key, response, generation)
+    return response
@@ -6,13 +6,25 @@ through a mixin-based architecture.
 """
 from typing import Optional
 
-from .auth import AuthManager
+from .auth import DEFAULT_TOKEN_REFRESH_SKEW, AuthManager
 from .api.pats import PATMixin
 from .api.sshkeys import SSHKeyMixin
 from .api.zpools import ZPoolMixin
 from .api.jobs import JobMixin
 from .api.billing import BillingMixin
 from .api.zfs_operations import ZFSOperationsMixin
+from .cache import ResponseCache, cached_read
+from .coalesce import SingleFlight
+from .raw import build_response, item_builder, release_content
+from .retry import RetryPolicy, RetryStats
+from .structs import check_structs_available
+from .stream import iter_json_array
+from .transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    check_http2_available,
+)
 
 
 class ZPoolsClient(PATMixin, SSHKeyMixin, ZPoolMixin, JobMixin, BillingMixin, ZFSOperationsMixin):
@@ -21,6 +33,13 @@ class ZPoolsClient(PATMixin, SSHKeyMixin, ZPoolMixin, JobMixin, BillingMixin, ZF
     
     Configuration (RC files, env vars) should be handled by the CLI layer.
     This class only accepts explicit values.
+
+    All API calls share one pooled keep-alive HTTP connection. Call close() (or use
+    the client as a context manager) to release it.
+
+    Thread-safe: one client can be shared by many threads (e.g. a
+    ThreadPoolExecutor). They share its connection pool, and a JWT login or
+    refresh happens once for all of them. Close it after the threads are done.
     """
     
     DEFAULT_API_URL = "https://api.zpools.io/v1"
@@ -34,6 +53,18 @@ class ZPoolsClient(PATMixin, SSHKeyMixin, ZPoolMixin, JobMixin, BillingMixin, ZF
         ssh_host: Optional[str] = None,
         ssh_privkey: Optional[str] = None,
         token_cache_dir: Optional[str] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: Optional[float] = None,
+        token_refresh_skew: float = DEFAULT_TOKEN_REFRESH_SKEW,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        raw: bool = False,
+        keep_content: bool = True,
+        structs: bool = False,
     ):
         """
         Initialize the zpools.io API client.
@@ -46,18 +77,142 @@ class ZPoolsClient(PATMixin, SSHKeyMixin, ZPoolMixin, JobMixin, BillingMixin, ZF
             ssh_host: SSH hostname for ZFS operations
             ssh_privkey: Path to SSH private key file
             token_cache_dir: Base directory for JWT token cache (unset = no cache; set explicitly to enable)
+            max_connections: Maximum concurrent HTTP connections in the shared pool
+            max_keepalive_connections: Maximum idle connections kept alive in the pool
+            keepalive_expiry: Seconds an idle connection is kept alive
+            timeout: HTTP request timeout in seconds (default: httpx default)
+            token_refresh_skew: Seconds before JWT expiry to fetch a new token (default: 60)
+            retry_policy: Retry policy for connection errors, 429 and 5xx responses
+                (default: None, no retries; pass RetryPolicy() to enable them)
+            http2: Multiplex concurrent requests over a single HTTP/2 connection
+                (requires the optional h2 dependency: pip install 'zpools-sdk[http2]')
+            coalesce_requests: Share one request and parsed Response between identical
+                reads (list_zpools, get_job, ...) issued concurrently (default: False). Callers
+                then receive the same mutable Response object and must not modify it
+            response_cache: Opt-in ResponseCache for list_zpools, list_sshkeys, list_pats and
+                get_billing_balance (default: no caching)
+            raw: Return responses whose parsed value is the decoded JSON (plain dicts)
+                instead of generated models; faster when only dicts are needed
+            keep_content: Keep the raw body bytes (Response.content) of successful responses
+                after parsing; pass False to release them and hold only the parsed value
+                (list_jobs and get_billing_ledger also take a per-call keep_content)
+            structs: Decode responses straight into msgspec Structs compiled from the API spec
+                instead of generated models (requires the optional msgspec dependency:
+                pip install 'zpools-sdk[structs]'); fields not in the spec are dropped,
+                except the undocumented job fields the domain Job objects read
+
+        Raises:
+            ValueError: If both raw and structs are set
         """
+        if raw and structs:
+            raise ValueError("raw and structs are mutually exclusive")
+        if structs:
+            check_structs_available()
+        if http2:
+            check_http2_available()
+        self.retry_stats = RetryStats()
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self.response_cache = response_cache
+        self.raw = raw
+        # How response bodies are parsed: "models", "raw" or "structs"
+        self.decoder = "raw" if raw else "structs" if structs else "models"
+        self.keep_content = keep_content
         self._auth = AuthManager(
             api_url=api_url,
             username=username,
             password=password,
             pat=pat,
             token_cache_dir=token_cache_dir,
+            http_options={
+                "max_connections": max_connections,
+                "max_keepalive_connections": max_keepalive_connections,
+                "keepalive_expiry": keepalive_expiry,
+                "timeout": timeout,
+                "retry_policy": retry_policy,
+                "retry_stats": self.retry_stats,
+                "http2": http2,
+            },
+            token_refresh_skew=token_refresh_skew,
         )
         self.ssh_host = ssh_host if ssh_host is not None else "ssh.zpools.io"
         self.ssh_privkey = ssh_privkey
 
+    def _coalesce(self, key, fn):
+        """Run an API read, sharing it with identical reads already in flight."""
+        if self._single_flight is None:
+            return fn()
+        return self._single_flight.do(key, fn)
+
+    def _request(self, endpoint, keep_content=None, **params):
+        """
+        Call a generated endpoint module (e.g. get_zpools) with the endpoint's parameters.
+
+        keep_content overrides the client's keep_content for this call.
+        """
+        auth_client = self._auth.get_authenticated_client()
+        if self.decoder == "models":
+            response = endpoint.sync_detailed(client=auth_client, **params)
+        else:
+            http_response = auth_client.get_httpx_client().request(**endpoint._get_kwargs(**params))
+            response = build_response(endpoint, auth_client, http_response, self.decoder)
+        if not (self.keep_content if keep_content is None else keep_content):
+            release_content(response)
+        return response
+
+    def _iter_items(self, endpoint, path, model, **params):
+        """
+        Stream a generated GET endpoint and yield the elements of the array at path.
+
+        Elements are decoded one at a time as the body arrives and built with
+        model.from_dict (or yielded as dicts in raw mode, as the model's struct
+        in struct mode).
+
+        Raises:
+            UnexpectedStatus: If the API does not answer 200
+        """
+        from ._generated.errors import UnexpectedStatus
+
+        build = item_builder(model, self.decoder)
+        auth_client = self._auth.get_authenticated_client()
+        with auth_client.get_httpx_client().stream(**endpoint._get_kwargs(**params)) as response:
+            if response.status_code != 200:
+                raise UnexpectedStatus(response.status_code, response.read())
+            for item in iter_json_array(response.iter_bytes(), path):
+                yield build(item)
+
+    def _cached_read(self, key, endpoint, keep_content=None, **params):
+        """
+        Call a generated GET endpoint through the response cache (if enabled) and coalescing.
+
+        Cached responses always keep their content (it is what the cache persists and revalidates),
+        so reads with keep_content=False (e.g. the pages of iter_jobs) bypass the cache.
+        """
+        if self.response_cache is None or keep_content is False or not self.response_cache.caches(key[0]):
+            return self._coalesce(
+                key + (keep_content,), lambda: self._request(endpoint, keep_content=keep_content, **params)
+            )
+        auth_client = self._auth.get_authenticated_client()
+        if self.decoder != "models":
+            key = key + (self.decoder,)
+        return self._coalesce(
+            key, lambda: cached_read(self.response_cache, key, endpoint, auth_client, params, self.decoder)
+        )
+
+    def _invalidate(self, *operations):
+        """Drop cached responses made stale by a mutation."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(*operations)
+
     def get_authenticated_client(self):
         """Returns the raw client with the Authorization header set."""
         return self._auth.get_authenticated_client()
 
+    def close(self):
+        """Close the shared HTTP connection pool."""
+        self._auth.close()
+
+    def __enter__(self) -> "ZPoolsClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,116 @@
+"""Single-flight coalescing of identical in-flight API reads.
+
+When several threads (or asyncio tasks) ask for the same read at the same
+moment - e.g. volume monitors and pollers all calling list_zpools() - only the
+first caller sends the request. The others wait for it and receive the same
+parsed Response (or the same exception). Nothing is cached: once the request
+finishes, the next call goes to the API again.
+
+The shared Response is not copied, so its parsed value must be treated as
+read-only. Clients only coalesce with ``coalesce_requests=True``.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    """An in-flight call that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe request coalescing keyed by operation and arguments.
+
+    Attributes:
+        shared: Number of calls that were served by another caller's request
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn(), or wait for an identical call already in flight.
+
+        Args:
+            key: Identifies the request (e.g. ("get_job", job_id))
+            fn: Performs the request
+
+        Returns:
+            fn()'s result, shared by every caller that joined the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio request coalescing keyed by operation and arguments.
+
+    The request runs in its own task, so a caller being cancelled does not
+    cancel the request for the others waiting on it.
+
+    Attributes:
+        shared: Number of calls that were served by another caller's request
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or wait for an identical call already in flight.
+
+        Args:
+            key: Identifies the request (e.g. ("get_job", job_id))
+            fn: Coroutine function performing the request
+
+        Returns:
+            fn()'s result, shared by every caller that joined the call
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._finished(key, t))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
@@ -0,0 +1,192 @@
+"""
+Normalized views of zpools, volumes and jobs.
+
+The API is not consistent about field names: zpool and volume metadata uses
+capitalized keys (Volumes, ModState, CanModifyNow) where older responses used
+snake_case, and most job fields live outside the schema (job_type,
+current_status, parameters as a JSON-encoded string). ZPool, Volume and Job
+resolve all of that once, when built from a response, so callers read plain
+attributes instead of probing dicts on every access.
+
+Each object keeps the dict it was built from in ``data`` for callers that
+need the original payload.
+"""
+import json
+from typing import Any, Dict, List, Mapping, Optional
+
+# Volume ModState values while an EBS modification is still in progress
+MODIFYING_STATES = frozenset({"modifying", "optimizing"})
+
+
+def _pick(data: Mapping[str, Any], key: str, alt_key: str, default: Any = None) -> Any:
+    """Value of key, falling back to alt_key (the other casing), then default."""
+    if key in data:
+        return data[key]
+    return data.get(alt_key, default)
+
+
+def _as_dict(item) -> dict:
+    """Plain dict for a generated model or struct, or an already decoded (raw mode) dict."""
+    return item if isinstance(item, dict) else item.to_dict()
+
+
+def _detail(response) -> Any:
+    """The "detail" of a parsed response, in model, struct or raw mode."""
+    if isinstance(response.parsed, dict):
+        return response.parsed.get('detail') or {}
+    return response.parsed.detail
+
+
+class Volume:
+    """One EBS volume of a zpool."""
+
+    __slots__ = (
+        "volume_id", "state", "volume_type", "size", "mod_state", "mod_progress",
+        "can_modify_now", "mod_last_time", "is_modifying", "data",
+    )
+
+    def __init__(self, data: dict):
+        """
+        Args:
+            data: Volume dict as returned by the API (either key casing)
+        """
+        self.data = data
+        self.volume_id: Optional[str] = _pick(data, 'VolumeId', 'volume_id')
+        self.state: Optional[str] = _pick(data, 'State', 'state')
+        self.volume_type: Optional[str] = _pick(data, 'VolumeType', 'volume_type')
+        self.size: Optional[int] = _pick(data, 'Size', 'size')
+        # "none", "modifying", "optimizing", "completed" or "failed"
+        self.mod_state: str = _pick(data, 'ModState', 'mod_state') or 'none'
+        self.mod_progress: int = _pick(data, 'ModProgress', 'mod_progress') or 0
+        self.can_modify_now: bool = bool(_pick(data, 'CanModifyNow', 'can_modify_now', False))
+        self.mod_last_time: Optional[str] = _pick(data, 'ModLastTime', 'mod_last_time')
+        self.is_modifying: bool = self.mod_state in MODIFYING_STATES
+
+    def __repr__(self) -> str:
+        return f"Volume({self.volume_id!r}, state={self.state!r}, mod_state={self.mod_state!r})"
+
+
+class ZPool:
+    """A zpool and its volumes."""
+
+    __slots__ = (
+        "zpool_id", "username", "volume_count", "create_time", "last_scrub_time",
+        "volumes", "is_modifying", "data",
+    )
+
+    def __init__(self, zpool_id: str, data: dict):
+        """
+        Args:
+            zpool_id: Zpool ID (the key the zpool is listed under)
+            data: Zpool dict as returned by the API (either key casing)
+        """
+        self.data = data
+        self.zpool_id = zpool_id
+        self.username: Optional[str] = _pick(data, 'Username', 'username')
+        self.create_time: Optional[str] = _pick(data, 'CreateTime', 'create_time')
+        self.last_scrub_time: Optional[str] = _pick(data, 'LastScrubTime', 'last_scrub_time')
+        self.volumes: List[Volume] = [Volume(vol) for vol in _pick(data, 'Volumes', 'volumes') or ()]
+        volume_count = _pick(data, 'VolumeCount', 'volume_count')
+        self.volume_count: int = len(self.volumes) if volume_count is None else volume_count
+        # Once ModState is "completed" or "none" the modification is done,
+        # even if CanModifyNow is still False because of the cooldown
+        self.is_modifying: bool = any(vol.is_modifying for vol in self.volumes)
+
+    def __repr__(self) -> str:
+        return f"ZPool({self.zpool_id!r}, volumes={len(self.volumes)}, is_modifying={self.is_modifying})"
+
+
+class Job:
+    """A background job, from a list_jobs item or the 'job' object of get_job."""
+
+    __slots__ = (
+        "job_id", "operation", "state", "message", "zpool_id", "parameters",
+        "created_at", "updated_at", "data",
+    )
+
+    def __init__(self, data: dict):
+        """
+        Args:
+            data: Job dict as returned by the API
+        """
+        self.data = data
+        self.job_id: Optional[str] = data.get('job_id')
+        self.operation: str = data.get('operation') or data.get('job_type') or ""
+
+        # The live state is in current_status; the schema status field is a fallback
+        current_status = data.get('current_status')
+        if isinstance(current_status, dict):
+            self.state: Optional[str] = current_status.get('state')
+            self.message: str = current_status.get('message') or ""
+        else:
+            self.state = data.get('status')
+            self.message = ""
+
+        # parameters arrives as a JSON-encoded string
+        parameters = data.get('parameters') or {}
+        if isinstance(parameters, str):
+            try:
+                parameters = json.loads(parameters)
+            except ValueError:
+                parameters = {}
+        self.parameters: dict = parameters if isinstance(parameters, dict) else {}
+        self.zpool_id: Optional[str] = data.get('zpool_id') or self.parameters.get('zpool_id')
+
+        self.created_at: Optional[str] = data.get('created_at')
+        self.updated_at: Optional[str] = data.get('updated_at')
+
+    def __repr__(self) -> str:
+        return f"Job({self.job_id!r}, operation={self.operation!r}, state={self.state!r})"
+
+
+def zpools_from_response(response) -> Dict[str, ZPool]:
+    """
+    Build ZPool objects from a list_zpools response.
+
+    Returns:
+        ZPools keyed by zpool_id (empty if the request failed)
+    """
+    if response.status_code != 200 or response.parsed is None:
+        return {}
+    detail = _detail(response)
+    zpools = detail.get('zpools') if isinstance(detail, dict) else detail.zpools
+    if not zpools:
+        return {}
+    return {zpool_id: ZPool(zpool_id, _as_dict(data)) for zpool_id, data in _as_dict(zpools).items()}
+
+
+def jobs_from_response(response) -> List[Job]:
+    """
+    Build Job objects from a list_jobs response, in the order listed.
+
+    Returns:
+        Jobs (empty if the request failed)
+    """
+    if response.status_code != 200 or response.parsed is None:
+        return []
+    detail = _detail(response)
+    jobs = detail.get('jobs') if isinstance(detail, dict) else detail.jobs
+    if not jobs:
+        return []
+    return [Job(_as_dict(job)) for job in jobs]
+
+
+def job_from_response(response) -> Optional[Job]:
+    """
+    Build a Job from a get_job response.
+
+    Returns:
+        The job, or None if the request failed or the response has no 'job' object
+    """
+    if response.status_code != 200 or response.parsed is None:
+        return None
+    detail = _detail(response)
+    # The job object is not in the schema: models keep it in additional_properties,
+    # structs declare it as an undocumented field
+    if isinstance(detail, dict):
+        job_data = detail.get('job')
+    elif hasattr(detail, 'additional_properties'):
+        job_data = detail.additional_properties.get('job')
+    else:
+        job_data = getattr(detail, 'job', None)
+    return Job(job_data) if job_data else None
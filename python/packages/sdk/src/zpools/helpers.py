@@ -1,10 +1,67 @@
 """
 Helper utilities for working with zpools.io API.
 
-Includes job polling, resource waiting, and other convenience functions.
+Includes job polling, resource waiting, and other convenience functions,
+with asyncio counterparts for use with AsyncZPoolsClient.
 """
+import asyncio
 import time
-from typing import Optional, Callable
+from typing import Awaitable, Optional, Callable
+
+from .domain import ZPool, job_from_response, zpools_from_response
+
+
+def _finished_job(job_id: str, response) -> Optional[dict]:
+    """
+    Interpret a get_job response.
+    
+    Returns:
+        Job details dict if the job succeeded, None if it is still in progress
+        
+    Raises:
+        RuntimeError: If the request failed, the job failed, or the state is unknown
+    """
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Failed to get job status: {response.status_code}"
+        )
+    
+    job = job_from_response(response)
+    if job is None:
+        raise RuntimeError(f"Job {job_id} response missing 'job' field")
+    
+    if job.state == "succeeded":
+        return job.data
+    elif job.state == "failed":
+        raise RuntimeError(f"Job {job_id} failed: {job.message or 'Unknown error'}")
+    elif job.state in ("pending", "running", "queued", "in progress"):
+        return None
+    else:
+        raise RuntimeError(f"Unknown job state: {job.state}")
+
+
+def _find_zpool(zpool_id: str, response) -> ZPool:
+    """
+    Extract one zpool from a list_zpools response.
+    
+    Raises:
+        RuntimeError: If the request failed or the zpool is not listed
+    """
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Failed to list zpools: {response.status_code}"
+        )
+    
+    zpool = zpools_from_response(response).get(zpool_id)
+    if zpool is None:
+        raise RuntimeError(f"Zpool {zpool_id} not found in list")
+    return zpool
+
+
+def _listed_zpool(zpool_id: str, response) -> Optional[dict]:
+    """Return the zpool dict from a list_zpools response, or None if not (yet) listed."""
+    zpool = zpools_from_response(response).get(zpool_id)
+    return zpool.data if zpool is not None else None
 
 
 class JobPoller:
@@ -46,29 +103,11 @@ class JobPoller:
                 )
             
             response = self.client.get_job(self.job_id)
-            
-            if response.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to get job status: {response.status_code}"
-                )
-            
-            # The actual job data is in additional_properties['job']
-            job_data = response.parsed.detail.additional_properties.get('job')
-            if not job_data:
-                raise RuntimeError(f"Job {self.job_id} response missing 'job' field")
-            
-            current_status = job_data.get('current_status', {})
-            state = current_status.get('state')
-            
-            if state == "succeeded":
+            job_data = _finished_job(self.job_id, response)
+            if job_data is not None:
                 return job_data
-            elif state == "failed":
-                error_msg = current_status.get('message', 'Unknown error')
-                raise RuntimeError(f"Job {self.job_id} failed: {error_msg}")
-            elif state in ("pending", "running", "queued", "in progress"):
-                time.sleep(self.poll_interval)
-            else:
-                raise RuntimeError(f"Unknown job state: {state}")
+            
+            time.sleep(self.poll_interval)
 
 
 def wait_for_zpool_ready(
@@ -102,11 +141,9 @@ def wait_for_zpool_ready(
             )
         
         response = client.list_zpools()
-        if response.status_code == 200:
-            zpools = response.parsed.detail.zpools
-            for zpool in zpools:
-                if zpool.zpool_id == zpool_id:
-                    return zpool
+        zpool = _listed_zpool(zpool_id, response)
+        if zpool is not None:
+            return zpool
         
         time.sleep(poll_interval)
 
@@ -191,45 +228,119 @@ class ModifyPoller:
                 )
             
             response = self.client.list_zpools()
+            zpool = _find_zpool(self.zpool_id, response)
             
-            if response.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to list zpools: {response.status_code}"
-                )
+            # Call progress callback if provided
+            if on_progress:
+                on_progress(zpool.data)
             
-            # Find our zpool
-            zpools = response.parsed.detail.zpools.to_dict() if response.parsed.detail.zpools else {}
-            zpool = zpools.get(self.zpool_id)
+            # Done once no volume is modifying (no volume info is treated as final)
+            if not zpool.is_modifying:
+                return zpool.data
             
-            if not zpool:
-                raise RuntimeError(f"Zpool {self.zpool_id} not found in list")
+            time.sleep(self.poll_interval)
+
+
+class AsyncJobPoller(JobPoller):
+    """Asyncio counterpart of JobPoller for use with AsyncZPoolsClient."""
+    
+    async def wait_for_completion(self) -> dict:
+        """
+        Poll job until it reaches a terminal state (succeeded/failed).
+        
+        See JobPoller.wait_for_completion for return value and exceptions.
+        """
+        start_time = time.time()
+        
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed > self.timeout:
+                raise TimeoutError(
+                    f"Job {self.job_id} did not complete within {self.timeout}s"
+                )
             
-            # Call progress callback if provided
-            if on_progress:
-                on_progress(zpool)
+            response = await self.client.get_job(self.job_id)
+            job_data = _finished_job(self.job_id, response)
+            if job_data is not None:
+                return job_data
             
-            # Check if all volumes are done optimizing
-            # Volume metadata includes optimization state
-            # API returns capitalized keys: Volumes, ModState, CanModifyNow
-            volumes = zpool.get('Volumes', zpool.get('volumes', []))
+            await asyncio.sleep(self.poll_interval)
+
+
+async def async_wait_for_zpool_ready(
+    client,
+    zpool_id: str,
+    timeout: int = 600,
+    poll_interval: int = 5
+):
+    """
+    Asyncio counterpart of wait_for_zpool_ready for use with AsyncZPoolsClient.
+    """
+    start_time = time.time()
+    
+    while True:
+        elapsed = time.time() - start_time
+        if elapsed > timeout:
+            raise TimeoutError(
+                f"Zpool {zpool_id} did not become ready within {timeout}s"
+            )
+        
+        response = await client.list_zpools()
+        zpool = _listed_zpool(zpool_id, response)
+        if zpool is not None:
+            return zpool
+        
+        await asyncio.sleep(poll_interval)
+
+
+async def async_poll_until(
+    poll_fn: Callable[[], Awaitable],
+    condition: Callable[[any], bool],
+    timeout: int = 60,
+    poll_interval: int = 2
+) -> any:
+    """
+    Asyncio counterpart of poll_until; poll_fn is a coroutine function.
+    """
+    start_time = time.time()
+    
+    while True:
+        elapsed = time.time() - start_time
+        if elapsed > timeout:
+            raise TimeoutError(f"Condition not met within {timeout}s")
+        
+        result = await poll_fn()
+        if condition(result):
+            return result
+        
+        await asyncio.sleep(poll_interval)
+
+
+class AsyncModifyPoller(ModifyPoller):
+    """Asyncio counterpart of ModifyPoller for use with AsyncZPoolsClient."""
+    
+    async def wait_for_completion(self, on_progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Poll zpool until all volumes complete modification (optimization).
+        
+        See ModifyPoller.wait_for_completion for arguments, return value and exceptions.
+        """
+        start_time = time.time()
+        
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed > self.timeout:
+                raise TimeoutError(
+                    f"Zpool {self.zpool_id} volume modifications did not complete within {self.timeout}s"
+                )
             
-            if not volumes:
-                # No volume info means we can't monitor - just return current state
-                return zpool
+            response = await self.client.list_zpools()
+            zpool = _find_zpool(self.zpool_id, response)
             
-            all_complete = True
-            for vol in volumes:
-                # Check if volume is still being modified
-                # ModState: "none" (no mod), "modifying" (started), "optimizing" (in progress), "completed" (done), "failed"
-                # Once ModState is "completed" or "none", modification is done (even if CanModifyNow is False due to cooldown)
-                mod_state = vol.get('ModState', vol.get('mod_state'))
-                
-                # Still in progress if modifying or optimizing
-                if mod_state in ('modifying', 'optimizing'):
-                    all_complete = False
-                    break
+            if on_progress:
+                on_progress(zpool.data)
             
-            if all_complete:
-                return zpool
+            if not zpool.is_modifying:
+                return zpool.data
             
-            time.sleep(self.poll_interval)
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,91 @@
+"""Raw mode: API responses decoded straight to plain dicts.
+
+With ``ZPoolsClient(raw=True)`` every operation returns the usual Response
+(status_code, content, headers), but ``parsed`` is the decoded JSON body as
+plain dicts and lists instead of generated attrs models. This skips the
+recursive ``from_dict`` model construction for callers that only need dicts
+(pollers, monitors, ``--json`` output). orjson is used when installed
+(``pip install 'zpools-sdk[fast]'``), otherwise the standard json module.
+
+release_content() drops the body bytes of a parsed Response for clients
+created with ``keep_content=False``.
+"""
+import json
+from http import HTTPStatus
+from typing import Any, Callable
+
+import httpx
+
+from ._generated.types import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(content: bytes):
+    """Decode a JSON document with the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def raw_response(http_response: httpx.Response) -> Response:
+    """
+    Build a Response whose parsed value is the decoded JSON body.
+
+    Unlike the generated parsers this decodes every status code, so error
+    bodies are available as dicts too. parsed is None for empty or non-JSON bodies.
+    """
+    content = http_response.content
+    try:
+        parsed = loads(content) if content else None
+    except ValueError:
+        parsed = None
+    return Response(
+        status_code=HTTPStatus(http_response.status_code),
+        content=content,
+        headers=http_response.headers,
+        parsed=parsed,
+    )
+
+
+def build_response(endpoint, auth_client, http_response: httpx.Response, decoder: str = "models") -> Response:
+    """
+    Build a Response for a generated endpoint module in the client's decoder mode.
+
+    decoder is "models" (the generated parser), "raw" (raw_response()) or
+    "structs" (struct_response()).
+    """
+    if decoder == "raw":
+        return raw_response(http_response)
+    if decoder == "structs":
+        from .structs import struct_response
+
+        return struct_response(endpoint, http_response)
+    return endpoint._build_response(client=auth_client, response=http_response)
+
+
+def item_builder(model, decoder: str = "models") -> Callable[[Any], Any]:
+    """Function turning one decoded array element (a dict) into a model, a struct or itself (raw)."""
+    if decoder == "raw":
+        return lambda item: item
+    if decoder == "structs":
+        from .structs import convert, model_struct
+
+        struct_type = model_struct(model)
+        return lambda item: convert(struct_type, item)
+    return model.from_dict
+
+
+def release_content(response: Response) -> Response:
+    """
+    Drop the body bytes of a successfully parsed Response to save memory.
+
+    Only 2xx responses with a parsed value are released (content becomes b"");
+    error bodies are kept for error messages.
+    """
+    if 200 <= response.status_code < 300 and response.parsed is not None:
+        response.content = b""
+    return response
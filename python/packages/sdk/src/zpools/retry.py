@@ -0,0 +1,206 @@
+"""Retry with exponential backoff for zpools.io API requests.
+
+RetryTransport wraps the pooled httpx transport and retries connection errors,
+429 and 5xx responses with jittered exponential backoff, honouring Retry-After.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import httpx
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Raised before the request reached the server, so safe to retry for any method
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Raised after the request may have been sent (e.g. connection reset mid-response)
+_MAYBE_SENT_ERRORS = (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError, httpx.ReadTimeout)
+
+
+class RetryPolicy:
+    """Configuration for retrying failed API requests."""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        """
+        Initialize a retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            backoff_factor: Base delay in seconds; attempt n waits up to backoff_factor * 2**n
+            max_backoff: Upper bound in seconds for any single delay (including Retry-After)
+            retry_statuses: HTTP status codes that are retried
+            retry_methods: HTTP methods retried on status codes and mid-request errors
+                (default: idempotent methods only). Connection failures before the
+                request is sent are retried for every method.
+            respect_retry_after: Wait for the server's Retry-After header when present
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1.
+
+        Uses Retry-After when present (and enabled), otherwise full-jitter
+        exponential backoff.
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    def should_retry_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses and request.method in self.retry_methods
+
+    def should_retry_error(self, request: httpx.Request, exc: Exception) -> bool:
+        if isinstance(exc, _NOT_SENT_ERRORS):
+            return True
+        return isinstance(exc, _MAYBE_SENT_ERRORS) and request.method in self.retry_methods
+
+
+class RetryStats:
+    """
+    Thread-safe retry counters for a client.
+
+    Attributes:
+        requests: Requests sent through the transport
+        retries: Total retries performed
+        exhausted: Requests that still failed after max_retries
+        retries_per_request: Counter mapping retries-needed -> number of requests
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.retries_per_request = Counter()
+
+    def record(self, retries: int, exhausted: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.retries += retries
+            self.retries_per_request[retries] += 1
+            if exhausted:
+                self.exhausted += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "retries_per_request": dict(self.retries_per_request),
+            }
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    httpx transport that retries requests according to a RetryPolicy.
+
+    The number of retries each request needed is aggregated in RetryStats
+    (ZPoolsClient.retry_stats).
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy, stats: Optional[RetryStats] = None):
+        self._transport = transport
+        self.policy = policy
+        self.stats = stats if stats is not None else RetryStats()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as exc:
+                if attempt >= self.policy.max_retries or not self.policy.should_retry_error(request, exc):
+                    self.stats.record(attempt, exhausted=attempt > 0)
+                    raise
+                time.sleep(self.policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if attempt < self.policy.max_retries and self.policy.should_retry_response(request, response):
+                delay = self.policy.backoff(attempt, response)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            exhausted = self.policy.should_retry_response(request, response)
+            self.stats.record(attempt, exhausted=exhausted and attempt > 0)
+            return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of RetryTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy, stats: Optional[RetryStats] = None):
+        self._transport = transport
+        self.policy = policy
+        self.stats = stats if stats is not None else RetryStats()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as exc:
+                if attempt >= self.policy.max_retries or not self.policy.should_retry_error(request, exc):
+                    self.stats.record(attempt, exhausted=attempt > 0)
+                    raise
+                await asyncio.sleep(self.policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if attempt < self.policy.max_retries and self.policy.should_retry_response(request, response):
+                delay = self.policy.backoff(attempt, response)
+                await response.aclose()
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            exhausted = self.policy.should_retry_response(request, response)
+            self.stats.record(attempt, exhausted=exhausted and attempt > 0)
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
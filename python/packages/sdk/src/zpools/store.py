@@ -0,0 +1,793 @@
+"""Local SQLite stores of account data, synced incrementally from the API.
+
+JobIndex keeps every job of an account in a SQLite database (WAL mode, so
+several processes can read while one syncs) indexed by operation, state and
+zpool_id. A sync only asks the API for jobs from the oldest recent one that
+has not finished yet, or after the newest one known, so lookups such as "the
+latest scrub of this zpool" are answered locally instead of by paging
+list_jobs. Older unfinished jobs are refreshed one by one.
+
+LedgerStore keeps the billing ledger the same way. Posted entries never
+change, so a sync only asks for the days since the newest known entry. It
+also links consecutive hourly storage charges into rate periods as entries
+arrive, so billing summaries of any date range are computed locally.
+
+The databases hold account data: keep them in a private directory per account
+and API URL. They are caches: deleting a file only costs a full sync.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .api.jobs import _TICK, _as_time
+
+# Job states after which a job no longer changes
+TERMINAL_STATES = frozenset({"succeeded", "failed", "completed"})
+
+# JobIndex.sync(): unfinished jobs created longer than this before the newest
+# job no longer hold the incremental cursor back; they are refreshed one by one
+STALE_JOB_AGE = timedelta(days=1)
+
+# JobIndex.sync(): a stale unfinished job that get_job() could not return (e.g.
+# deleted) is asked for again only after this long
+STALE_JOB_RETRY = timedelta(hours=1)
+
+# Most entries a single get_billing_ledger call can return
+_LEDGER_PAGE_SIZE = 5000
+
+# Ledger sources billed per hour of storage (summarized as storage_charges)
+STORAGE_SOURCES = frozenset({"hourly_ebs"})
+
+_HOUR = 3600.0
+
+_JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    state TEXT,
+    zpool_id TEXT,
+    created_at TEXT,
+    created_ts REAL,
+    checked_ts REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created_ts);
+CREATE INDEX IF NOT EXISTS jobs_operation ON jobs (operation, created_ts);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, created_ts);
+CREATE INDEX IF NOT EXISTS jobs_zpool ON jobs (zpool_id, created_ts);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_LEDGER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger (
+    entry_id TEXT PRIMARY KEY,
+    event_ts TEXT,
+    event_time REAL,
+    posted_ts TEXT,
+    posted_time REAL,
+    source TEXT,
+    amount REAL NOT NULL,
+    kind TEXT NOT NULL,
+    rate_key TEXT,
+    period_start REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ledger_event ON ledger (event_time, posted_time);
+CREATE INDEX IF NOT EXISTS ledger_posted ON ledger (posted_time);
+CREATE INDEX IF NOT EXISTS ledger_kind ON ledger (kind, event_time);
+CREATE INDEX IF NOT EXISTS ledger_rate ON ledger (rate_key, event_time);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _connect(path: Path, schema: str, version: int) -> sqlite3.Connection:
+    """
+    Open (or create) a store database in WAL mode.
+
+    The directory is created with mode 0700 and the database with mode 0600.
+    A database with another schema version (PRAGMA user_version) is emptied and recreated.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    path.touch(mode=0o600, exist_ok=True)
+    # Autocommit; writes are grouped with explicit transactions
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != version:
+        conn.execute("BEGIN IMMEDIATE")
+        # Checked again under the write lock: another process may have just rebuilt it
+        if conn.execute("PRAGMA user_version").fetchone()[0] != version:
+            for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                conn.execute(f'DROP TABLE "{table}"')
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        conn.execute("COMMIT")
+    conn.executescript(schema)
+    return conn
+
+
+def _timestamp(value) -> Optional[float]:
+    """POSIX timestamp of an ISO 8601 string or datetime (naive values are UTC)."""
+    value = _as_time(value)
+    return value.timestamp() if value is not None else None
+
+
+def _job_row(job) -> tuple:
+    """The jobs table row of a domain Job."""
+    return (
+        job.job_id, job.operation, job.state, job.zpool_id, job.created_at,
+        _timestamp(job.created_at), json.dumps(job.data, default=str),
+    )
+
+
+class _Store:
+    """A SQLite store with a meta table; subclasses set _schema, _version and _table."""
+
+    _schema = ""
+    # Bumped when the store's tables change; databases with another version are rebuilt
+    _version = 1
+    _table = ""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite database file (its directory is created with mode 0700 if missing)
+        """
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path, self._schema, self._version)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        """time.time() of the last successful sync, or None if the store was never synced."""
+        with self._lock:
+            value = self._meta("synced_at")
+        return float(value) if value is not None else None
+
+    @contextmanager
+    def _sync_transaction(self):
+        """Hold the lock and a write transaction, recording the sync time if the block succeeds."""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('synced_at', ?)", (repr(time.time()),))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+
+class JobIndex(_Store):
+    """
+    Local index of an account's jobs.
+
+    Call sync() to bring it up to date, then query it with jobs() and
+    latest() without any request. Safe to share between threads.
+    """
+
+    _schema = _JOB_SCHEMA
+    _version = 2
+    _table = "jobs"
+
+    def sync(self, client, stale_after: timedelta = STALE_JOB_AGE, retry_after: timedelta = STALE_JOB_RETRY) -> int:
+        """
+        Fetch the jobs created or changed since the last sync.
+
+        The first sync fetches the whole history with fetch_jobs(). Later syncs
+        page with iter_jobs() from the created_at of the oldest job that was not
+        finished at the last sync (or of the newest job, if all were), so jobs
+        still running are refreshed along with the new ones. Unfinished jobs
+        created more than stale_after before the newest job do not hold that
+        cursor back (a job stuck in "running" would otherwise make every sync
+        page from it); they are refreshed with one get_job() call each instead.
+        A job get_job() does not return is kept as it is and not asked for
+        again until retry_after has passed.
+
+        Args:
+            client: ZPoolsClient to fetch the jobs with
+            stale_after: Age, relative to the newest job, past which an unfinished
+                job is refreshed on its own (default: one day)
+            retry_after: Time before a stale job that could not be fetched is
+                requested again (default: one hour)
+
+        Returns:
+            Number of jobs added or updated
+
+        Raises:
+            UnexpectedStatus: If the API does not answer 200 for a request
+        """
+        with self._lock:
+            cursor = self._meta("sync_cursor")
+            stale = self._unfinished(
+                before=_timestamp(cursor), checked_before=time.time() - retry_after.total_seconds()
+            ) if cursor is not None else []
+        if cursor is None:
+            jobs = client.fetch_jobs(sort="asc")
+        else:
+            # One tick earlier, so jobs sharing the cursor's timestamp are returned too
+            jobs = client.iter_jobs(after=_as_time(cursor) - _TICK, sort="asc")
+        rows = [_job_row(job) for job in jobs if job.job_id]
+        refreshed, missing = self._refresh(client, stale)
+        rows += refreshed
+
+        with self._sync_transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO jobs (job_id, operation, state, zpool_id, created_at, created_ts, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            checked_ts = time.time()
+            conn.executemany(
+                "UPDATE jobs SET checked_ts = ? WHERE job_id = ?", [(checked_ts, job_id) for job_id in missing]
+            )
+            newest = conn.execute(
+                "SELECT created_at, created_ts FROM jobs WHERE created_ts IS NOT NULL ORDER BY created_ts DESC LIMIT 1"
+            ).fetchone()
+            if newest is not None:
+                unfinished = self._unfinished(after=newest[1] - stale_after.total_seconds(), limit=1)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('sync_cursor', ?)",
+                    (unfinished[0][1] if unfinished else newest[0],),
+                )
+        return len(rows)
+
+    def _unfinished(
+        self,
+        before: Optional[float] = None,
+        after: Optional[float] = None,
+        limit: Optional[int] = None,
+        checked_before: Optional[float] = None,
+    ):
+        """
+        (job_id, created_at) of jobs not in a terminal state, oldest first, created in [after, before).
+
+        With checked_before, jobs that failed to refresh at or after that time are left out.
+        """
+        terminal = tuple(TERMINAL_STATES)
+        query = (
+            "SELECT job_id, created_at FROM jobs WHERE created_ts IS NOT NULL "
+            f"AND (state IS NULL OR state NOT IN ({', '.join('?' * len(terminal))}))"
+        )
+        params = list(terminal)
+        if before is not None:
+            query += " AND created_ts < ?"
+            params.append(before)
+        if after is not None:
+            query += " AND created_ts >= ?"
+            params.append(after)
+        if checked_before is not None:
+            query += " AND (checked_ts IS NULL OR checked_ts < ?)"
+            params.append(checked_before)
+        query += " ORDER BY created_ts"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self._conn.execute(query, params).fetchall()
+
+    @staticmethod
+    def _refresh(client, stale) -> Tuple[List[tuple], List[str]]:
+        """
+        Fetch stale unfinished jobs one by one.
+
+        Returns:
+            Rows of the fetched jobs, and the IDs of the jobs that could not be
+            fetched (they keep their row)
+        """
+        from .domain import Job, job_from_response
+
+        rows, missing = [], []
+        for job_id, created_at in stale:
+            job = job_from_response(client.get_job(job_id))
+            if job is None:
+                missing.append(job_id)
+                continue
+            if not job.created_at:
+                # get_job may omit created_at; keep the listed one so the job stays in order
+                job = Job(dict(job.data, created_at=created_at))
+            rows.append(_job_row(job))
+        return rows, missing
+
+    def jobs(
+        self,
+        operation: Optional[str] = None,
+        state: Optional[str] = None,
+        zpool_id: Optional[str] = None,
+        before=None,
+        after=None,
+        sort: str = "desc",
+        limit: Optional[int] = None,
+    ) -> List:
+        """
+        Query the indexed jobs. Makes no request: call sync() first for current results.
+
+        Args:
+            operation: Only jobs of this operation (e.g. "zpool_scrub")
+            state: Only jobs in this state (e.g. "failed")
+            zpool_id: Only jobs for this zpool
+            before: Only jobs created before this datetime (ISO 8601 or datetime object)
+            after: Only jobs created after this datetime (ISO 8601 or datetime object)
+            sort: Sort order by created_at ("asc" or "desc", default "desc")
+            limit: Maximum number of jobs to return (default: all)
+
+        Returns:
+            Job objects (zpools.domain.Job)
+
+        Raises:
+            ValueError: If sort is not "asc" or "desc"
+        """
+        from .domain import Job
+
+        if sort.lower() not in ("asc", "desc"):
+            raise ValueError(f"sort must be 'asc' or 'desc' (got {sort!r})")
+        clauses, params = [], []
+        for column, value in (("operation", operation), ("state", state), ("zpool_id", zpool_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if before is not None:
+            clauses.append("created_ts < ?")
+            params.append(_timestamp(before))
+        if after is not None:
+            clauses.append("created_ts > ?")
+            params.append(_timestamp(after))
+        order = sort.upper()
+        query = "SELECT data FROM jobs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY created_ts {order}, job_id {order}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [Job(json.loads(data)) for (data,) in rows]
+
+    def latest(self, operation: Optional[str] = None, zpool_id: Optional[str] = None):
+        """
+        The most recently created job matching the filters, from the index.
+
+        Args:
+            operation: Only jobs of this operation (e.g. "zpool_create")
+            zpool_id: Only jobs for this zpool
+
+        Returns:
+            The Job, or None if no indexed job matches
+        """
+        jobs = self.jobs(operation=operation, zpool_id=zpool_id, limit=1)
+        return jobs[0] if jobs else None
+
+    def job_ids(self, prefix: str = "", limit: Optional[int] = None) -> List[str]:
+        """
+        IDs of indexed jobs starting with prefix, newest first (e.g. for shell completion).
+
+        Args:
+            prefix: Leading characters of the job_id
+            limit: Maximum number of IDs to return (default: all)
+        """
+        # A range on the primary key rather than LIKE, which is case-insensitive and treats _ as a wildcard
+        query = "SELECT job_id FROM jobs WHERE job_id >= ? AND job_id < ? ORDER BY created_ts DESC"
+        params = [prefix, prefix + "\U0010ffff"]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+
+def _as_date(value) -> Optional[date]:
+    """A date from a YYYY-MM-DD string, date or datetime (None stays None)."""
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return _as_time(value).date()
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _day_start(day: date) -> float:
+    """POSIX timestamp of midnight UTC at the start of day."""
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+
+
+def _event_day(entry: dict) -> Optional[date]:
+    """UTC date of a ledger entry's event_ts, the date the since/until filters apply to."""
+    event = _as_time(entry.get("event_ts"))
+    return event.astimezone(timezone.utc).date() if event is not None else None
+
+
+def _fetch_ledger(client, since: Optional[date] = None, until: Optional[date] = None) -> List[dict]:
+    """
+    Every ledger entry with an event date in [since, until] (None leaves that end open), as dicts.
+
+    get_billing_ledger returns at most 5000 entries and its order is not
+    documented, so a request that comes back full is not trusted: the dates it
+    covered are fetched again in smaller ranges, and the open ends beyond them
+    separately, until every request returns less than a full page.
+
+    Raises:
+        RuntimeError: If a single day has more entries than one request can return
+        UnexpectedStatus: If the API does not answer 200 for a request
+    """
+    from .domain import _as_dict
+
+    entries = [
+        _as_dict(item) for item in client.iter_billing_ledger(since=since, until=until, limit=_LEDGER_PAGE_SIZE)
+    ]
+    days = [day for day in map(_event_day, entries) if day is not None]
+    if len(entries) < _LEDGER_PAGE_SIZE or not days:
+        return entries
+    if since is not None and since == until:
+        raise RuntimeError(f"More than {_LEDGER_PAGE_SIZE} ledger entries on {since}: the day cannot be paged")
+
+    one_day = timedelta(days=1)
+    low, high = since or min(days), until or max(days)
+    fetched = []
+    if since is None:
+        fetched += _fetch_ledger(client, None, low - one_day)
+    if until is None:
+        fetched += _fetch_ledger(client, high + one_day, None)
+    if low == high:
+        fetched += _fetch_ledger(client, low, high)
+    else:
+        middle = low + (high - low) // 2
+        fetched += _fetch_ledger(client, low, middle)
+        fetched += _fetch_ledger(client, middle + one_day, high)
+    return fetched
+
+
+def _ledger_kind(entry: dict, amount: float) -> str:
+    """Summary section of a ledger entry: "credit", "storage" or "time_of_use"."""
+    if amount > 0:
+        return "credit"
+    if entry.get("source") in STORAGE_SOURCES and entry.get("event_ts"):
+        return "storage"
+    return "time_of_use"
+
+
+def _rate_key(entry: dict, amount: float) -> str:
+    """
+    What an hourly storage charge is billed for: consecutive hours with the same key form one rate period.
+
+    Ledger entries only carry zpool_id, volume_type and size_gb when the API
+    sends them beyond the documented fields; entries without them are told
+    apart by their hourly rate alone.
+    """
+    return json.dumps([entry.get("zpool_id"), entry.get("volume_type"), entry.get("size_gb"), round(-amount, 9)])
+
+
+def _link_periods(conn: sqlite3.Connection, start: Optional[float]) -> None:
+    """
+    Set period_start of the storage charges from start on (None for all of them).
+
+    Each charge continues the rate period of the previous charge with the same
+    rate_key if that one billed the hour before (or the same hour), and starts
+    a new period otherwise. Charges before start keep their periods; the ones
+    that reach start are continued.
+    """
+    query = "SELECT entry_id, rate_key, event_time FROM ledger WHERE kind = 'storage'"
+    params = []
+    if start is not None:
+        query += " AND event_time >= ?"
+        params.append(start)
+    periods, updates = {}, []
+    for entry_id, rate_key, event_time in conn.execute(query + " ORDER BY rate_key, event_time", params).fetchall():
+        period = periods.get(rate_key)
+        if period is None and start is not None:
+            period = conn.execute(
+                "SELECT period_start, event_time FROM ledger WHERE kind = 'storage' AND rate_key = ? "
+                "AND event_time < ? ORDER BY event_time DESC LIMIT 1",
+                (rate_key, start),
+            ).fetchone()
+        if period is None or event_time - period[1] > _HOUR:
+            period = (event_time, event_time)
+        periods[rate_key] = (period[0], event_time)
+        updates.append((period[0], entry_id))
+    conn.executemany("UPDATE ledger SET period_start = ? WHERE entry_id = ?", updates)
+
+
+def _usd(value: float) -> float:
+    """An amount rounded past float noise (and without a negative zero)."""
+    return round(value, 6) + 0.0
+
+
+def _summary_rows(summary: dict, section: str, fields) -> list:
+    """Sorted, comparable rows of a summary section (timestamps as datetimes, amounts to the cent)."""
+    rows = []
+    for item in summary.get(section) or []:
+        row = []
+        for field in fields:
+            value = item.get(field)
+            if field.endswith("_ts"):
+                value = _as_time(value)
+            elif isinstance(value, float) or field in ("amount_usd", "total_charges"):
+                value = round(value or 0, 2) + 0.0
+            row.append(value)
+        rows.append(tuple(row))
+    return sorted(rows, key=repr)
+
+
+def _event_range(since, until):
+    """SQL clauses and parameters selecting entries with an event date in [since, until]."""
+    clauses, params = [], []
+    if since is not None:
+        clauses.append("event_time >= ?")
+        params.append(_day_start(_as_date(since)))
+    if until is not None:
+        clauses.append("event_time < ?")
+        params.append(_day_start(_as_date(until) + timedelta(days=1)))
+    return clauses, params
+
+
+class LedgerStore(_Store):
+    """
+    Local copy of an account's billing ledger.
+
+    Call sync() to bring it up to date, then query it with entries() without
+    any request. Safe to share between threads.
+
+    Ledger entries have no ID: an entry is identified by its content (plus a
+    counter for entries that are identical in every field), so fetching the
+    same days again replaces entries rather than duplicating them.
+    """
+
+    _schema = _LEDGER_SCHEMA
+    _version = 2
+    _table = "ledger"
+
+    def sync(self, client, full: bool = False, lookback_days: int = 2) -> int:
+        """
+        Fetch the ledger entries added since the last sync.
+
+        The first sync (or a full one) fetches the whole ledger. Later syncs ask
+        only for events since the day of the newest stored entry, less
+        lookback_days: charges can be posted a while after the hour they bill
+        (event_ts), and the API filters on event_ts. The stored entries of the
+        fetched days are replaced by the fetched ones, and only the storage rate
+        periods that reach those days are linked again.
+
+        Args:
+            client: ZPoolsClient to fetch the entries with
+            full: Fetch the whole ledger again instead of only the recent days
+            lookback_days: Days before the newest stored event to fetch again
+
+        Returns:
+            Number of entries fetched
+
+        Raises:
+            ValueError: If lookback_days is negative
+            RuntimeError: If a single day has more entries than one request can return
+            UnexpectedStatus: If the API does not answer 200 for a request
+        """
+        if lookback_days < 0:
+            raise ValueError(f"lookback_days must be at least 0 (got {lookback_days})")
+        since = None
+        if not full:
+            with self._lock:
+                newest = self._conn.execute("SELECT MAX(event_time) FROM ledger").fetchone()[0]
+            if newest is not None:
+                since = datetime.fromtimestamp(newest, timezone.utc).date() - timedelta(days=lookback_days)
+        entries = _fetch_ledger(client, since=since)
+
+        rows, copies = [], {}
+        for entry in entries:
+            data = json.dumps(entry, sort_keys=True, default=str)
+            digest = hashlib.sha256(data.encode()).hexdigest()[:32]
+            copy = copies[digest] = copies.get(digest, -1) + 1
+            amount = entry.get("amount_usd") or 0.0
+            kind = _ledger_kind(entry, amount)
+            rows.append((
+                f"{digest}-{copy}", entry.get("event_ts"), _timestamp(entry.get("event_ts")),
+                entry.get("posted_ts"), _timestamp(entry.get("posted_ts")), entry.get("source"),
+                amount, kind, _rate_key(entry, amount) if kind == "storage" else None, data,
+            ))
+
+        start = _day_start(since) if since is not None else None
+        with self._sync_transaction() as conn:
+            if start is None:
+                conn.execute("DELETE FROM ledger")
+            else:
+                conn.execute("DELETE FROM ledger WHERE event_time >= ?", (start,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO ledger "
+                "(entry_id, event_ts, event_time, posted_ts, posted_time, source, amount, kind, rate_key, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            # Only the periods of the fetched days can have changed
+            _link_periods(conn, start)
+        return len(rows)
+
+    def entries(self, since=None, until=None, limit: Optional[int] = None, sort: str = "desc") -> List[dict]:
+        """
+        Query the stored ledger entries. Makes no request: call sync() first for current results.
+
+        Takes the filters of get_billing_ledger(): since and until are event
+        dates and both are inclusive.
+
+        Args:
+            since: Start event date in YYYY-MM-DD format (or date object)
+            until: End event date in YYYY-MM-DD format (or date object)
+            limit: Maximum number of entries to return (default: all)
+            sort: Sort order by event_ts, then posted_ts ("asc" or "desc", default "desc")
+
+        Returns:
+            Entries as dicts, with the fields of the get_billing_ledger items
+
+        Raises:
+            ValueError: If a date is not YYYY-MM-DD or sort is not "asc" or "desc"
+        """
+        if sort.lower() not in ("asc", "desc"):
+            raise ValueError(f"sort must be 'asc' or 'desc' (got {sort!r})")
+        clauses, params = _event_range(since, until)
+        order = sort.upper()
+        query = "SELECT data FROM ledger"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY event_time {order}, posted_time {order}, entry_id {order}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def summary(self, since=None, until=None) -> dict:
+        """
+        Billing summary of the stored ledger, computed locally. Makes no request.
+
+        Returns the structure of get_billing_summary()'s detail.summary:
+
+        - storage_charges: hourly storage charges (sources in STORAGE_SOURCES)
+          grouped into rate periods, runs of consecutive hours billed at the
+          same rate for the same zpool, volume type and size. A period that
+          crosses since or until is cut at the range.
+        - time_of_use_charges: the other charges, one per entry
+        - credits: entries with a positive amount
+        - totals: the sums of the three (charges as positive amounts), their
+          net, and ending_balance, the sum of every stored entry
+
+        Charges are listed as positive amounts. Entries are selected by event
+        date like entries(): since and until are inclusive.
+
+        Args:
+            since: Start event date in YYYY-MM-DD format (or date object)
+            until: End event date in YYYY-MM-DD format (or date object)
+
+        Returns:
+            Summary dict (keys without a value are left out)
+
+        Raises:
+            ValueError: If a date is not YYYY-MM-DD
+        """
+        clauses, params = _event_range(since, until)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        with self._lock:
+            conn = self._conn
+            periods = conn.execute(
+                "SELECT rate_key, MIN(event_time), MAX(event_time), COUNT(*), SUM(amount) FROM ledger "
+                f"WHERE kind = 'storage'{where} GROUP BY rate_key, period_start ORDER BY MIN(event_time), rate_key",
+                params,
+            ).fetchall()
+            entries = conn.execute(
+                f"SELECT kind, amount, data FROM ledger WHERE kind != 'storage'{where} "
+                "ORDER BY event_time, posted_time, entry_id",
+                params,
+            ).fetchall()
+            balance = conn.execute("SELECT TOTAL(amount) FROM ledger").fetchone()[0]
+
+        storage_charges = []
+        for rate_key, first, last, hours, total in periods:
+            zpool_id, volume_type, size_gb, hourly_rate = json.loads(rate_key)
+            charge = {
+                "zpool_id": zpool_id,
+                "volume_type": volume_type,
+                "size_gb": size_gb,
+                "hourly_rate": _usd(hourly_rate),
+                "daily_rate": _usd(hourly_rate * 24),
+                "hours": hours,
+                "total_charges": _usd(-total),
+                "from_ts": datetime.fromtimestamp(first, timezone.utc).isoformat(),
+                # The end of the last billed hour
+                "to_ts": datetime.fromtimestamp(last + _HOUR, timezone.utc).isoformat(),
+            }
+            storage_charges.append({key: value for key, value in charge.items() if value is not None})
+
+        sections = {"time_of_use": [], "credit": []}
+        for kind, amount, data in entries:
+            entry = json.loads(data)
+            item = {key: entry[key] for key in ("note", "posted_ts", "source", "zpool_id") if entry.get(key) is not None}
+            item["amount_usd"] = _usd(abs(amount))
+            sections[kind].append(item)
+
+        storage = sum(charge["total_charges"] for charge in storage_charges)
+        time_of_use = sum(item["amount_usd"] for item in sections["time_of_use"])
+        credits = sum(item["amount_usd"] for item in sections["credit"])
+        period = {"from_date": since, "to_date": until}
+        return {
+            "period": {key: str(_as_date(value)) for key, value in period.items() if value is not None},
+            "storage_charges": storage_charges,
+            "time_of_use_charges": sections["time_of_use"],
+            "credits": sections["credit"],
+            "totals": {
+                "storage_charges": _usd(storage),
+                "time_of_use_charges": _usd(time_of_use),
+                "credits_applied": _usd(credits),
+                "period_net": _usd(credits - storage - time_of_use),
+                "ending_balance": _usd(balance),
+            },
+        }
+
+    def check_summary(self, client, since=None, until=None, tolerance: float = 0.005) -> List[str]:
+        """
+        Compare summary() with the API's get_billing_summary() for the same dates.
+
+        Sync first, so that both are computed from the same entries. Totals must
+        agree within tolerance; storage periods, time-of-use charges and credits
+        must match row for row (timestamps compared as instants, amounts to the
+        cent).
+
+        Args:
+            client: ZPoolsClient to fetch the API summary with
+            since: Start date in YYYY-MM-DD format (or date object)
+            until: End date in YYYY-MM-DD format (or date object)
+            tolerance: Largest difference in USD accepted between totals
+
+        Returns:
+            Descriptions of the differences (empty if the summaries agree)
+
+        Raises:
+            UnexpectedStatus: If the API does not answer 200
+        """
+        from ._generated.errors import UnexpectedStatus
+        from .domain import _as_dict, _detail
+
+        response = client.get_billing_summary(since=since, until=until)
+        if response.status_code != 200:
+            raise UnexpectedStatus(response.status_code, response.content)
+        remote = _as_dict(_detail(response)).get("summary") or {}
+        local = self.summary(since=since, until=until)
+
+        differences = []
+        remote_totals = remote.get("totals") or {}
+        for key, value in local["totals"].items():
+            if abs(value - (remote_totals.get(key) or 0)) > tolerance:
+                differences.append(f"totals.{key}: {value} locally, {remote_totals.get(key)} from the API")
+        sections = (
+            ("storage_charges", ("zpool_id", "volume_type", "size_gb", "from_ts", "to_ts", "hours", "total_charges")),
+            ("time_of_use_charges", ("posted_ts", "source", "zpool_id", "amount_usd")),
+            ("credits", ("posted_ts", "source", "amount_usd")),
+        )
+        for section, fields in sections:
+            local_rows, remote_rows = _summary_rows(local, section, fields), _summary_rows(remote, section, fields)
+            for row in local_rows:
+                if row in remote_rows:
+                    remote_rows.remove(row)
+                else:
+                    differences.append(f"{section}: only locally: {dict(zip(fields, row))}")
+            differences.extend(f"{section}: only from the API: {dict(zip(fields, row))}" for row in remote_rows)
+        return differences
@@ -0,0 +1,174 @@
+"""Incremental decoding of large JSON arrays from streamed API responses.
+
+JSONArrayParser is fed response chunks as they arrive and returns the
+elements of one array nested in the document (e.g. ``detail.items`` of the
+billing ledger) as soon as each element is complete. Neither the body nor
+the decoded document is held in memory: only the current partial element
+is buffered, and everything after the array is ignored.
+"""
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Sequence
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+_decoder = json.JSONDecoder()
+
+# Yielded by the parse generator when it needs more input
+_MORE = object()
+
+
+class JSONArrayParser:
+    """
+    Push parser for the elements of one array in a JSON document.
+
+    The array is found by following path through nested objects; other keys
+    on the way are decoded and skipped.
+    """
+
+    def __init__(self, path: Sequence[str]):
+        """
+        Args:
+            path: Object keys leading to the array, e.g. ("detail", "items")
+        """
+        self._path = tuple(path)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.done = False
+        self._parser = self._parse()
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add a chunk of the response body.
+
+        Returns:
+            Array elements completed by this chunk (possibly none)
+
+        Raises:
+            ValueError: If the document is not valid JSON or has no array at path
+        """
+        if self.done:
+            return []
+        self._buf = self._buf[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._resume()
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body and return any remaining elements.
+
+        Raises:
+            ValueError: If the body ended before the array did
+        """
+        if self.done:
+            return []
+        self._buf = self._buf[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        return self._resume()
+
+    def _resume(self) -> List[Any]:
+        items = []
+        for event in self._parser:
+            if event is _MORE:
+                break
+            items.append(event)
+        return items
+
+    def _parse(self):
+        for key in self._path:
+            yield from self._expect("{")
+            while True:
+                yield from self._skip_whitespace()
+                if self._buf[self._pos] == "}":
+                    raise ValueError(f"JSON object has no key {key!r}")
+                name = yield from self._value()
+                yield from self._expect(":")
+                if name == key:
+                    break
+                yield from self._value()
+                yield from self._skip_whitespace()
+                char = self._buf[self._pos]
+                self._pos += 1
+                if char == "}":
+                    raise ValueError(f"JSON object has no key {key!r}")
+                if char != ",":
+                    raise ValueError(f"Expected ',' or '}}' in JSON object, got {char!r}")
+
+        yield from self._expect("[")
+        yield from self._skip_whitespace()
+        if self._buf[self._pos] == "]":
+            self.done = True
+            return
+        while True:
+            yield (yield from self._value())
+            yield from self._skip_whitespace()
+            char = self._buf[self._pos]
+            self._pos += 1
+            if char == "]":
+                self.done = True
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+
+    def _skip_whitespace(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return
+            if self._eof:
+                raise ValueError("JSON document ended unexpectedly")
+            yield _MORE
+
+    def _expect(self, char: str):
+        yield from self._skip_whitespace()
+        if self._buf[self._pos] != char:
+            raise ValueError(f"Expected {char!r} in JSON document, got {self._buf[self._pos]!r}")
+        self._pos += 1
+
+    def _value(self):
+        """Decode one complete JSON value, waiting for more input while it is partial."""
+        while True:
+            yield from self._skip_whitespace()
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                yield _MORE
+                continue
+            # A number cut off by the chunk boundary ("4" of "4.5e3") may continue in the next chunk
+            if not self._eof and (end == len(self._buf) or self._buf[end] not in _DELIMITERS):
+                yield _MORE
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Sequence[str]) -> Iterator[Any]:
+    """
+    Yield the elements of the array at path as the chunks arrive.
+
+    Stops reading chunks once the array is complete.
+    """
+    parser = JSONArrayParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], path: Sequence[str]) -> AsyncIterator[Any]:
+    """Asyncio counterpart of iter_json_array()."""
+    parser = JSONArrayParser(path)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+    for item in parser.close():
+        yield item
@@ -0,0 +1,92 @@
+"""Struct mode: API responses decoded straight into msgspec Structs.
+
+With ``ZPoolsClient(structs=True)`` the body bytes of each response are
+decoded in one pass by a msgspec decoder compiled for the endpoint's response
+schema (``zpools._structs``, generated from the OpenAPI spec by
+``scripts/generate_structs.py``). This replaces ``json.loads`` followed by the
+generated models' per-field ``from_dict``. The Structs have the same class and
+attribute names as the generated models; date-time fields are datetimes.
+
+Only fields described in the spec are decoded: keys the spec does not list
+(models keep those in ``additional_properties``) are dropped, except the job
+fields the API returns without documenting them (``job_type``,
+``current_status`` and ``parameters`` of list_jobs items, ``job`` of get_job),
+which the generator adds. Requires the optional msgspec dependency
+(``pip install 'zpools-sdk[structs]'``).
+"""
+from http import HTTPStatus
+from typing import Any, Optional
+
+import httpx
+
+from ._generated.types import Response
+
+# Compiled msgspec decoders by struct type, created on first use
+_decoders = {}
+
+
+def check_structs_available() -> None:
+    """Raise ImportError if the optional msgspec dependency for struct mode is missing."""
+    try:
+        import msgspec  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "structs=True requires the 'msgspec' package. Install it with: pip install 'zpools-sdk[structs]'"
+        ) from None
+
+
+def response_struct(endpoint, status_code: int) -> Optional[type]:
+    """The struct type for a generated endpoint module's response with this status, if documented."""
+    from ._structs import RESPONSES
+
+    return RESPONSES.get(endpoint.__name__.rpartition(".")[2], {}).get(status_code)
+
+
+def model_struct(model: type) -> type:
+    """The struct type with the same name as a generated model class."""
+    from . import _structs
+
+    return getattr(_structs, model.__name__)
+
+
+def _decoder(struct_type: type):
+    decoder = _decoders.get(struct_type)
+    if decoder is None:
+        import msgspec
+
+        decoder = _decoders[struct_type] = msgspec.json.Decoder(struct_type)
+    return decoder
+
+
+def decode(struct_type: type, content: bytes) -> Any:
+    """
+    Decode a JSON document straight into struct_type.
+
+    Raises:
+        msgspec.ValidationError: If the document does not match the schema
+    """
+    return _decoder(struct_type).decode(content)
+
+
+def convert(struct_type: type, data: Any) -> Any:
+    """Build struct_type from already decoded JSON data (e.g. one streamed array element)."""
+    import msgspec
+
+    return msgspec.convert(data, struct_type)
+
+
+def struct_response(endpoint, http_response: httpx.Response) -> Response:
+    """
+    Build a Response whose parsed value is the endpoint's response struct.
+
+    Like the generated parsers, parsed is None for statuses without a
+    documented JSON body.
+    """
+    content = http_response.content
+    struct_type = response_struct(endpoint, http_response.status_code)
+    return Response(
+        status_code=HTTPStatus(http_response.status_code),
+        content=content,
+        headers=http_response.headers,
+        parsed=decode(struct_type, content) if struct_type is not None and content else None,
+    )
@@ -0,0 +1,236 @@
+"""Shared HTTP transport for zpools.io API calls.
+
+A single pooled ``httpx.Client`` is built per ``ZPoolsClient`` and reused by
+every API operation, so TCP/TLS connections are kept alive across calls
+instead of being re-established for each request.
+"""
+import asyncio
+import threading
+from typing import Optional
+
+import httpx
+
+from .retry import AsyncRetryTransport, RetryPolicy, RetryStats, RetryTransport
+
+DEFAULT_MAX_CONNECTIONS = 10
+# Keep every pooled connection alive: a lower idle cap makes a busy pool close
+# and reopen connections while requests are still queued for them.
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = DEFAULT_MAX_CONNECTIONS
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Methods that are safe to replay after re-authenticating
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class TokenAuth(httpx.Auth):
+    """
+    httpx auth flow that sets the bearer token on each request.
+
+    When the API answers 401, the token is refreshed through the auth manager
+    (single-flight, so concurrent requests share one login) and idempotent
+    requests are replayed once with the new token. Non-idempotent requests
+    return the 401, but later calls pick up the refreshed token.
+    """
+
+    def __init__(self, auth_manager):
+        """
+        Args:
+            auth_manager: AuthManager (for httpx.Client) or AsyncAuthManager (for httpx.AsyncClient)
+        """
+        self._auth = auth_manager
+
+    @staticmethod
+    def _set_token(request: httpx.Request, token: str) -> None:
+        request.headers["Authorization"] = f"Bearer {token}"
+
+    def sync_auth_flow(self, request: httpx.Request):
+        token = self._auth.get_token()
+        self._set_token(request, token)
+        response = yield request
+
+        if response.status_code != 401 or not self._auth.can_refresh():
+            return
+        new_token = self._auth.refresh_token(token)
+        if request.method in IDEMPOTENT_METHODS:
+            self._set_token(request, new_token)
+            yield request
+
+    async def async_auth_flow(self, request: httpx.Request):
+        token = await self._auth.get_token()
+        self._set_token(request, token)
+        response = yield request
+
+        if response.status_code != 401 or not self._auth.can_refresh():
+            return
+        new_token = await self._auth.refresh_token(token)
+        if request.method in IDEMPOTENT_METHODS:
+            self._set_token(request, new_token)
+            yield request
+
+
+class _MultiplexedHTTP2Transport(httpx.BaseTransport):
+    """
+    Sync transport that multiplexes requests from many threads over HTTP/2.
+
+    httpcore's sync HTTP/2 connection is not safe to share between threads, so
+    requests are handed to an AsyncHTTPTransport running on a private event
+    loop thread, where concurrent requests share one multiplexed connection.
+    Bodies are passed through undecoded; the calling httpx.Client decodes them.
+    """
+
+    def __init__(self, **transport_kwargs):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="zpools-http2", daemon=True)
+        self._thread.start()
+        self._transport = httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        try:
+            content = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(content),
+            extensions={
+                key: response.extensions[key]
+                for key in ("http_version", "reason_phrase")
+                if key in response.extensions
+            },
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        async_request = httpx.Request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            stream=httpx.ByteStream(request.read()),
+            extensions=request.extensions,
+        )
+        return self._run(self._send(async_request))
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self._transport.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+def _limits(
+    max_connections: Optional[int],
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: Optional[float],
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def check_http2_available() -> None:
+    """Raise ImportError if the optional h2 dependency for HTTP/2 is missing."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "http2=True requires the 'h2' package. Install it with: pip install 'zpools-sdk[http2]'"
+        ) from None
+
+
+def _protocol_kwargs(base_url: str, http2: bool) -> dict:
+    """
+    HTTP version options for the transport.
+
+    Over https, HTTP/2 is negotiated via ALPN (falling back to HTTP/1.1). Plain
+    http cannot negotiate, so HTTP/2 there means prior knowledge (h2c), which is
+    what local stand-in servers typically speak.
+    """
+    if not http2:
+        return {}
+    check_http2_available()
+    if httpx.URL(base_url).scheme == "http":
+        return {"http1": False, "http2": True}
+    return {"http2": True}
+
+
+def _client_kwargs(base_url: str, timeout: Optional[float], auth: Optional[httpx.Auth]) -> dict:
+    """Keyword arguments shared by the sync and async pooled clients."""
+    kwargs = {"base_url": base_url}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    if auth is not None:
+        kwargs["auth"] = auth
+    return kwargs
+
+
+def build_http_client(
+    base_url: str,
+    auth: Optional[httpx.Auth] = None,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    timeout: Optional[float] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    retry_stats: Optional[RetryStats] = None,
+    http2: bool = False,
+) -> httpx.Client:
+    """
+    Build a pooled keep-alive httpx client for the API.
+
+    Args:
+        base_url: API base URL
+        auth: Optional httpx auth flow applied to every request (e.g. TokenAuth)
+        max_connections: Maximum concurrent connections (None = unlimited)
+        max_keepalive_connections: Maximum idle connections kept open (None = unlimited)
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Request timeout in seconds (None = httpx default)
+        retry_policy: Retry policy for failed requests (None = no retries)
+        retry_stats: Counters updated by the retry transport
+        http2: Multiplex concurrent requests over one HTTP/2 connection (requires h2)
+
+    Returns:
+        httpx.Client with connection pooling configured
+    """
+    limits = _limits(max_connections, max_keepalive_connections, keepalive_expiry)
+    if http2:
+        transport = _MultiplexedHTTP2Transport(limits=limits, **_protocol_kwargs(base_url, http2))
+    else:
+        transport = httpx.HTTPTransport(limits=limits)
+    if retry_policy is not None and retry_policy.max_retries > 0:
+        transport = RetryTransport(transport, retry_policy, retry_stats)
+    return httpx.Client(transport=transport, **_client_kwargs(base_url, timeout, auth))
+
+
+def build_async_http_client(
+    base_url: str,
+    auth: Optional[httpx.Auth] = None,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    timeout: Optional[float] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    retry_stats: Optional[RetryStats] = None,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """
+    Build a pooled keep-alive httpx.AsyncClient for the API.
+
+    Takes the same arguments as build_http_client().
+    """
+    transport = httpx.AsyncHTTPTransport(
+        limits=_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        **_protocol_kwargs(base_url, http2),
+    )
+    if retry_policy is not None and retry_policy.max_retries > 0:
+        transport = AsyncRetryTransport(transport, retry_policy, retry_stats)
+    return httpx.AsyncClient(transport=transport, **_client_kwargs(base_url, timeout, auth))
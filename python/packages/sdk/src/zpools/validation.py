@@ -0,0 +1,206 @@
+"""Client-side request validation compiled from the OpenAPI spec.
+
+The SDK methods check their arguments against the spec's constraints
+(``zpools._validators``, generated by ``scripts/generate_validators.py``)
+before any network I/O: a ``limit`` outside 1-1000 for list_jobs, a malformed
+date or an unsupported volume type raises ValidationError at once instead of
+costing an authenticated round trip that ends in a 400.
+
+Each endpoint's constraints are compiled into check functions on first use.
+"""
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# (required, check) per argument, by endpoint module name; compiled on first use
+_checks: Dict[str, Dict[str, Tuple[bool, Callable[[Any], Optional[str]]]]] = {}
+
+
+class ValidationError(ValueError):
+    """An argument violates the API spec. Raised before the request is sent."""
+
+    def __init__(self, endpoint: str, field: str, value: Any, reason: str):
+        """
+        Args:
+            endpoint: Generated endpoint module name (e.g. "get_jobs")
+            field: Argument name as the API knows it (e.g. "limit")
+            value: The rejected value
+            reason: What is wrong with it (e.g. "must be between 1 and 1000")
+        """
+        self.endpoint = endpoint
+        self.field = field
+        self.value = value
+        self.reason = reason
+        super().__init__(f"{endpoint}: {field} {reason} (got {value!r})")
+
+
+def _is_date(value) -> bool:
+    if isinstance(value, date):
+        return True
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
+def _is_datetime(value) -> bool:
+    if isinstance(value, datetime):
+        return True
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    return True
+
+
+def _type_check(rule: dict) -> Optional[Callable[[Any], Optional[str]]]:
+    kind = rule.get("type")
+    fmt = rule.get("format")
+    if kind == "integer":
+        return lambda v: None if isinstance(v, int) and not isinstance(v, bool) else "must be an integer"
+    if kind == "number":
+        return lambda v: None if isinstance(v, (int, float)) and not isinstance(v, bool) else "must be a number"
+    if kind == "boolean":
+        return lambda v: None if isinstance(v, bool) else "must be a boolean"
+    if kind == "string" and fmt == "date":
+        return lambda v: None if isinstance(v, (str, date)) and _is_date(v) else "must be a date (YYYY-MM-DD)"
+    if kind == "string" and fmt == "date-time":
+        return lambda v: None if isinstance(v, (str, datetime)) and _is_datetime(v) else "must be an ISO 8601 date-time"
+    if kind == "string":
+        return lambda v: None if isinstance(v, str) else "must be a string"
+    if kind == "array":
+        return lambda v: None if isinstance(v, (list, tuple)) else "must be a list"
+    if kind == "object":
+        return lambda v: None if isinstance(v, dict) else "must be an object"
+    return None
+
+
+def _range_check(rule: dict) -> Optional[Callable[[Any], Optional[str]]]:
+    low, high = rule.get("minimum"), rule.get("maximum")
+    if low is not None and high is not None:
+        return lambda v: None if low <= v <= high else f"must be between {low} and {high}"
+    if low is not None:
+        return lambda v: None if v >= low else f"must be at least {low}"
+    if high is not None:
+        return lambda v: None if v <= high else f"must be at most {high}"
+    return None
+
+
+def _compile(rule: dict) -> Callable[[Any], Optional[str]]:
+    """
+    Compile one schema constraint into a check.
+
+    The check returns None when the value is valid, otherwise the reason it is not.
+    """
+    checks = []
+    type_check = _type_check(rule)
+    if type_check is not None:
+        checks.append(type_check)
+    if "enum" in rule:
+        allowed = tuple(rule["enum"])
+        checks.append(lambda v: None if v in allowed else f"must be one of {', '.join(map(str, allowed))}")
+    range_check = _range_check(rule)
+    if range_check is not None:
+        checks.append(range_check)
+    if "exclusiveMinimum" in rule:
+        bound = rule["exclusiveMinimum"]
+        checks.append(lambda v: None if v > bound else f"must be greater than {bound}")
+    if "exclusiveMaximum" in rule:
+        bound = rule["exclusiveMaximum"]
+        checks.append(lambda v: None if v < bound else f"must be less than {bound}")
+    if "minLength" in rule:
+        length = rule["minLength"]
+        message = "must not be empty" if length == 1 else f"must be at least {length} characters"
+        checks.append(lambda v: None if len(v) >= length else message)
+    if "maxLength" in rule:
+        length = rule["maxLength"]
+        checks.append(lambda v: None if len(v) <= length else f"must be at most {length} characters")
+    if "pattern" in rule:
+        pattern = re.compile(rule["pattern"])
+        checks.append(lambda v: None if pattern.search(v) else f"must match {pattern.pattern}")
+    if "minItems" in rule:
+        count = rule["minItems"]
+        checks.append(lambda v: None if len(v) >= count else f"must have at least {count} items")
+    if "maxItems" in rule:
+        count = rule["maxItems"]
+        checks.append(lambda v: None if len(v) <= count else f"must have at most {count} items")
+    if "items" in rule:
+        item_check = _compile(rule["items"])
+
+        def check_items(v):
+            for index, item in enumerate(v):
+                reason = item_check(item)
+                if reason is not None:
+                    return f"item {index} {reason}"
+            return None
+
+        checks.append(check_items)
+    if "properties" in rule:
+        properties = {key: _compile(prop) for key, prop in rule["properties"].items()}
+        required = tuple(rule.get("required", ()))
+
+        def check_properties(v):
+            for key in required:
+                if v.get(key) is None:
+                    return f"is missing {key!r}"
+            for key, prop_check in properties.items():
+                if v.get(key) is not None:
+                    reason = prop_check(v[key])
+                    if reason is not None:
+                        return f"field {key!r} {reason}"
+            return None
+
+        checks.append(check_properties)
+
+    # Later checks assume the earlier ones passed (e.g. the range check needs a number)
+    def check(value):
+        for one in checks:
+            reason = one(value)
+            if reason is not None:
+                return reason
+        return None
+
+    return check
+
+
+def _endpoint_checks(endpoint: str) -> Dict[str, Tuple[bool, Callable[[Any], Optional[str]]]]:
+    checks = _checks.get(endpoint)
+    if checks is None:
+        from ._validators import CONSTRAINTS
+
+        checks = {}
+        for name, rule in CONSTRAINTS[endpoint].items():
+            # An empty path parameter would produce a different URL (/zpool//scrub)
+            if rule["in"] == "path" and "minLength" not in rule:
+                rule = dict(rule, minLength=1)
+            checks[name] = (rule["required"], _compile(rule))
+        _checks[endpoint] = checks
+    return checks
+
+
+def validate(endpoint: str, **values) -> None:
+    """
+    Check arguments for a generated endpoint against the spec before sending the request.
+
+    None means "not given": it is accepted for optional arguments and rejected
+    for required ones. Arguments are named as in the API (e.g. new_size_in_gib).
+
+    Args:
+        endpoint: Generated endpoint module name (e.g. "get_jobs")
+        **values: Argument values by API name
+
+    Raises:
+        ValidationError: If a value violates the spec
+        KeyError: If the endpoint or an argument is not in the spec
+    """
+    checks = _endpoint_checks(endpoint)
+    for name, value in values.items():
+        required, check = checks[name]
+        if value is None:
+            if required:
+                raise ValidationError(endpoint, name, value, "is required")
+            continue
+        reason = check(value)
+        if reason is not None:
+            raise ValidationError(endpoint, name, value, reason)
@@ -0,0 +1,16 @@
+import threading
+
+import pytest
+
+from stub_api import StubAPI
+
+
+@pytest.fixture
+def api():
+    """A running StubAPI, shut down after the test."""
+    server = StubAPI()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,252 @@
+"""A local stand-in for the zpools.io API, for tests.
+
+StubAPI is a threaded HTTP server whose routes are plain functions: each is
+called with the Request and returns the JSON payload (answered with 200), a
+(status, payload) or a (status, payload, headers) tuple. A payload of None
+sends no body. TokenServer adds JWT login, and zpcli() runs the CLI against it.
+"""
+import itertools
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+class Request:
+    """A request received by StubAPI."""
+
+    def __init__(self, method: str, path: str, query: dict, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+
+class StubAPI(ThreadingHTTPServer):
+    """Threaded stand-in API on 127.0.0.1 with an ephemeral port."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Callable] = {}
+        self.requests: List[Request] = []
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+    @property
+    def url(self) -> str:
+        """API base URL, like https://api.zpools.io/v1."""
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def route(self, method: str, path: str, handler: Callable) -> None:
+        """
+        Answer method requests for path (below /v1) with handler.
+
+        A "*" path segment matches any single segment, e.g. "/job/*".
+        """
+        self.routes[(method, path)] = handler
+
+    def calls(self, path: str, method: str = "GET") -> List[Request]:
+        """Requests received for a path (below /v1), "*" segments matching as in route()."""
+        with self.lock:
+            return [request for request in self.requests if request.method == method and _matches(path, request.path)]
+
+    def find(self, method: str, path: str) -> Optional[Callable]:
+        for (route_method, pattern), handler in self.routes.items():
+            if route_method == method and _matches(pattern, path):
+                return handler
+        return None
+
+
+def _matches(pattern: str, path: str) -> bool:
+    pattern_parts, path_parts = pattern.strip("/").split("/"), path.strip("/").split("/")
+    return len(pattern_parts) == len(path_parts) and all(p in ("*", q) for p, q in zip(pattern_parts, path_parts))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        url = urlparse(self.path)
+        path = url.path[len("/v1"):] if url.path.startswith("/v1") else url.path
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        request = Request(
+            self.command,
+            path,
+            {key: values[0] for key, values in parse_qs(url.query).items()},
+            self.headers,
+            json.loads(raw) if raw else None,
+        )
+        with self.server.lock:
+            self.server.requests.append(request)
+        handler = self.server.find(self.command, path)
+        result = handler(request) if handler is not None else (404, {"message": "Not Found"})
+        if not isinstance(result, tuple):
+            result = (200, result)
+        status, payload, headers = (result + ({},))[:3]
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Logins
+
+class TokenServer:
+    """Login and get_job routes on a StubAPI; revokes every token after each rotate_every job requests."""
+
+    def __init__(self, api, expires_in: int = 3600, login_delay: float = 0.05, rotate_every: int = 0):
+        self.expires_in = expires_in
+        self.login_delay = login_delay
+        self.rotate_every = rotate_every
+        self.logins = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._tokens = set()
+        self._ids = itertools.count()
+        self._job_requests = 0
+        api.route("POST", "/login", self.login)
+        api.route("GET", "/job/*", self.get_job)
+
+    def login(self, request):
+        time.sleep(self.login_delay)
+        with self._lock:
+            self.logins += 1
+            token = f"token-{next(self._ids)}"
+            self._tokens.add(token)
+        return {"message": "ok", "detail": {"access_token": token, "id_token": token, "expires_in": self.expires_in}}
+
+    def get_job(self, request):
+        token = request.headers.get("Authorization", "").replace("Bearer ", "")
+        with self._lock:
+            if token not in self._tokens:
+                self.rejected += 1
+                return 401, {"message": "Unauthorized"}
+            self._job_requests += 1
+            # Revoke after answering, so the next requests carry a stale token
+            if self.rotate_every and self._job_requests % self.rotate_every == 0:
+                self._tokens.clear()
+        job_id = request.path.rsplit("/", 1)[-1]
+        return {"message": "ok", "detail": {"job": {"job_id": job_id, "status": "running"}}}
+
+
+# Job listings
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def make_job(index: int, created: datetime, job_type: str = "zpool_scrub", state: str = "succeeded", zpool_id: str = "zp-1") -> dict:
+    """A list_jobs item (the API reports a succeeded job's status as "completed")."""
+    return {
+        "job_id": f"job-{index:05d}",
+        "job_type": job_type,
+        "status": "completed" if state == "succeeded" else state,
+        "created_at": iso(created),
+        "current_status": {"state": state, "message": f"job {index}"},
+        "parameters": json.dumps({"zpool_id": zpool_id}),
+    }
+
+
+def serve_jobs(api: StubAPI, jobs: List[dict], inclusive: bool = True) -> None:
+    """
+    Answer GET /jobs from a list of jobs with the before/after/sort/limit filters.
+
+    Ties are ordered by job_id. With inclusive=False the before/after bounds exclude equal timestamps.
+    """
+
+    def list_jobs(request: Request):
+        query = request.query
+        selected = list(jobs)
+        if "before" in query:
+            before = parse_time(query["before"])
+            selected = [job for job in selected if parse_time(job["created_at"]) <= before] if inclusive else [
+                job for job in selected if parse_time(job["created_at"]) < before
+            ]
+        if "after" in query:
+            after = parse_time(query["after"])
+            selected = [job for job in selected if parse_time(job["created_at"]) >= after] if inclusive else [
+                job for job in selected if parse_time(job["created_at"]) > after
+            ]
+        selected.sort(key=lambda job: (parse_time(job["created_at"]), job["job_id"]), reverse=query.get("sort", "desc") == "desc")
+        return {"message": "ok", "detail": {"jobs": selected[: int(query.get("limit", 100))]}}
+
+    api.route("GET", "/jobs", list_jobs)
+
+
+def minutes(count: int) -> timedelta:
+    return timedelta(minutes=count)
+
+
+# Billing ledger
+
+LEDGER_START = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def hourly(hour, zpool_id, size_gb, rate, volume_type="gp3"):
+    event = LEDGER_START + timedelta(hours=hour)
+    return {
+        "amount_usd": -rate, "event_ts": iso(event), "posted_ts": iso(event + minutes(70)), "event_type": "debit",
+        "source": "hourly_ebs", "note": zpool_id, "zpool_id": zpool_id, "volume_type": volume_type, "size_gb": size_gb,
+    }
+
+
+def charge(day, amount, source="scrub", zpool_id="zp-a"):
+    event = LEDGER_START + timedelta(days=day)
+    return {
+        "amount_usd": amount, "event_ts": iso(event), "posted_ts": iso(event + minutes(1)),
+        "event_type": "debit" if amount < 0 else "credit", "source": source, "note": source, "zpool_id": zpool_id,
+    }
+
+
+def serve_ledger(api, ledger):
+    """Answer GET /billing/ledger with the since/until (event day) and limit filters, newest first."""
+
+    def get_ledger(request):
+        query = request.query
+        items = [
+            entry for entry in ledger
+            if query.get("since", "") <= entry["event_ts"][:10] <= query.get("until", "9999")
+        ]
+        items.sort(key=lambda entry: entry["event_ts"], reverse=True)
+        return {"message": "ok", "detail": {"items": items[: int(query.get("limit", 500))]}}
+
+    api.route("GET", "/billing/ledger", get_ledger)
+
+
+# zpcli
+
+def zpcli(api, tmp_path, *args, **settings):
+    """Run zpcli against the stub API with an rcfile of PAT auth, a cache directory and settings."""
+    from typer.testing import CliRunner
+    from zpools_cli.main import app
+
+    rcfile = tmp_path / "zpoolrc"
+    settings = {"ZPOOL_API_URL": api.url, "ZPOOLPAT": "pat-token", "ZPOOL_CACHE_DIR": tmp_path / "cache", **settings}
+    rcfile.write_text("".join(f"{key}={value}\n" for key, value in settings.items()))
+    env = {key: None for key in ("ZPOOL_API_URL", "ZPOOLPAT", "ZPOOL_USER", "ZPOOL_CACHE_DIR", "ZPOOL_CACHE_MAX_AGE")}
+    return CliRunner().invoke(app, ["--rcfile", str(rcfile), *args], env=env)
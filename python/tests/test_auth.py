@@ -0,0 +1,90 @@
+import asyncio
+import fcntl
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stub_api import TokenServer
+from zpools.auth import AsyncAuthManager, AuthManager, _release_lock
+
+
+def manager(api, **kwargs) -> AuthManager:
+    return AuthManager(api_url=api.url, username="alice", password="secret", **kwargs)
+
+
+def test_token_is_memoized_until_the_refresh_skew(api):
+    server = TokenServer(api, expires_in=3600)
+    auth = manager(api, token_refresh_skew=60)
+    assert auth.get_token() == auth.get_token()
+    assert server.logins == 1
+
+    # A token expiring within the skew is replaced before it is used
+    server.expires_in = 30
+    auth = manager(api, token_refresh_skew=60)
+    auth.get_token()
+    auth.get_token()
+    assert server.logins == 3
+
+
+def test_pat_needs_no_login(api):
+    server = TokenServer(api)
+    auth = AuthManager(api_url=api.url, pat="pat-token")
+    assert auth.get_token() == "pat-token"
+    assert not auth.can_refresh()
+    assert server.logins == 0
+
+
+def test_username_with_spaces_is_rejected(api):
+    with pytest.raises(ValueError, match="spaces"):
+        AuthManager(api_url=api.url, username="al ice", password="x")
+
+
+def test_token_cache_is_shared_between_managers(api, tmp_path):
+    server = TokenServer(api)
+    first = manager(api, token_cache_dir=str(tmp_path))
+    token = first.get_token()
+    second = manager(api, token_cache_dir=str(tmp_path))
+    assert second.get_token() == token
+    assert server.logins == 1
+    assert oct((tmp_path / f"zpool_token_127.0.0.1:{api.server_address[1]}_alice").stat().st_mode & 0o777) == "0o600"
+
+
+def test_concurrent_refreshes_of_one_stale_token_share_one_login(api):
+    server = TokenServer(api, login_delay=0.2)
+    auth = manager(api)
+    stale = auth.get_token()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        tokens = list(pool.map(lambda _: auth.refresh_token(stale), range(16)))
+    assert server.logins == 2
+    assert set(tokens) == {"token-1"}
+    # A caller arriving with the already replaced token gets the new one without logging in
+    assert auth.refresh_token(stale) == "token-1"
+    assert server.logins == 2
+
+
+def test_cancelled_async_login_releases_the_token_file_lock(api, tmp_path):
+    TokenServer(api)
+    holder = manager(api, token_cache_dir=str(tmp_path))
+    lock_path = holder._token_file.with_name(holder._token_file.name + ".lock")
+
+    async def cancel_login():
+        auth = AsyncAuthManager(api_url=api.url, username="alice", password="secret", token_cache_dir=str(tmp_path))
+        held = holder._lock_token_file()
+        task = asyncio.create_task(auth.get_token())
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The worker thread takes the lock once the holder lets go, and must give it back
+        _release_lock(held)
+        await asyncio.sleep(0.2)
+        await auth.close()
+
+    asyncio.run(cancel_login())
+    fd = os.open(lock_path, os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    finally:
+        os.close(fd)
+    assert holder.get_token() == "token-0"
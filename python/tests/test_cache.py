@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+import typer
+
+from stub_api import BASE_TIME, make_job, minutes, serve_jobs, zpcli
+from zpools import AsyncZPoolsClient, DiskResponseCache, ZPoolsClient
+from zpools_cli.utils import get_cache_max_age
+
+
+def serve_zpools(api, etag="v1"):
+    def get_zpools(request):
+        if request.headers.get("If-None-Match") == etag:
+            return 304, None, {"ETag": etag}
+        return 200, {"message": "ok", "detail": {"zpools": []}}, {"ETag": etag}
+
+    api.route("GET", "/zpools", get_zpools)
+
+
+def list_zpools(api, cache):
+    with ZPoolsClient(api_url=api.url, pat="pat-token", response_cache=cache) as client:
+        return client.list_zpools()
+
+
+def test_ttl_zero_reader_still_stores_for_later_readers(api, tmp_path):
+    serve_zpools(api)
+    writer = DiskResponseCache(tmp_path, ttls={"list_zpools": 0})
+    assert list_zpools(api, writer).status_code == 200
+    assert len(api.calls("/zpools")) == 1
+
+    # Another process with a larger max age uses the stored response
+    reader = DiskResponseCache(tmp_path, ttls={"list_zpools": 60})
+    assert list_zpools(api, reader).status_code == 200
+    assert len(api.calls("/zpools")) == 1 and reader.hits == 1
+
+
+def test_ttl_zero_reader_revalidates_the_stored_response(api, tmp_path):
+    serve_zpools(api)
+    list_zpools(api, DiskResponseCache(tmp_path, ttls={"list_zpools": 0}))
+
+    cache = DiskResponseCache(tmp_path, ttls={"list_zpools": 0})
+    assert list_zpools(api, cache).status_code == 200
+    second = api.calls("/zpools")[-1]
+    assert second.headers.get("If-None-Match") == "v1"
+    assert cache.revalidations == 1 and cache.hits == 0
+
+
+def test_job_pages_bypass_the_cache(api, tmp_path):
+    serve_jobs(api, [make_job(i, BASE_TIME + minutes(i)) for i in range(5)])
+    cache = DiskResponseCache(tmp_path, ttls={"list_jobs": 60})
+    with ZPoolsClient(api_url=api.url, pat="pat-token", response_cache=cache) as client:
+        assert len(list(client.iter_jobs(page_size=2))) == 5
+        assert not (tmp_path / "list_jobs").exists()
+        client.list_jobs()
+    assert (tmp_path / "list_jobs").is_dir()
+
+
+def serve_scrub(api):
+    api.route("POST", "/zpool/*/scrub", lambda request: (202, {"message": "ok", "detail": {"job_id": "job-scrub"}}))
+
+
+def test_zpool_changes_invalidate_the_job_list(api, tmp_path):
+    serve_jobs(api, [make_job(0, BASE_TIME)])
+    serve_scrub(api)
+    cache = DiskResponseCache(tmp_path, ttls={"list_jobs": 60})
+    with ZPoolsClient(api_url=api.url, pat="pat-token", response_cache=cache) as client:
+        client.list_jobs()
+        client.list_jobs()
+        assert len(api.calls("/jobs")) == 1
+        assert client.scrub_zpool("zp-1").status_code == 202
+        client.list_jobs()
+    assert len(api.calls("/jobs")) == 2
+
+
+def test_async_zpool_changes_invalidate_the_job_list(api, tmp_path):
+    serve_jobs(api, [make_job(0, BASE_TIME)])
+    serve_scrub(api)
+
+    async def scrub():
+        cache = DiskResponseCache(tmp_path, ttls={"list_jobs": 60})
+        async with AsyncZPoolsClient(api_url=api.url, pat="pat-token", response_cache=cache) as client:
+            await client.list_jobs()
+            await client.scrub_zpool("zp-1")
+            await client.list_jobs()
+
+    asyncio.run(scrub())
+    assert len(api.calls("/jobs")) == 2
+
+
+def test_cache_max_age_is_parsed():
+    assert get_cache_max_age({"cache_max_age": None}) == 0
+    assert get_cache_max_age({"cache_max_age": "30"}) == 30
+    assert get_cache_max_age({"cache_max_age": "30"}, 5) == 5
+    for value in ("soon", "-1", "nan"):
+        with pytest.raises(typer.Exit):
+            get_cache_max_age({"cache_max_age": value})
+    with pytest.raises(typer.Exit):
+        get_cache_max_age({}, -1)
+
+
+def test_cli_rejects_a_bad_cache_max_age(api, tmp_path):
+    serve_zpools(api)
+    result = zpcli(api, tmp_path, "zpool", "list", ZPOOL_CACHE_MAX_AGE="soon")
+    assert result.exit_code == 1
+    assert "Invalid ZPOOL_CACHE_MAX_AGE" in result.output
+    assert not api.calls("/zpools")
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zpools import AsyncZPoolsClient, ZPoolsClient
+from zpools.coalesce import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_one_call():
+    flight, calls, started = SingleFlight(), [], threading.Event()
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        first = pool.submit(flight.do, "key", slow)
+        started.wait()
+        others = [pool.submit(flight.do, "key", slow) for _ in range(7)]
+        results = [first.result()] + [future.result() for future in others]
+    assert len(calls) == 1 and flight.shared == 7
+    assert all(result is results[0] for result in results)
+
+    # Nothing is cached once the call finished
+    flight.do("key", slow)
+    assert len(calls) == 2
+
+
+def test_single_flight_keys_are_separate():
+    flight = SingleFlight()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def call(key):
+        # Both calls must be in flight at once: a shared key would deadlock the barrier
+        return flight.do(key, lambda: barrier.wait() is not None and key)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(call, ["a", "b"])) == ["a", "b"]
+    assert flight.shared == 0
+
+
+def test_single_flight_shares_errors():
+    flight, started = SingleFlight(), threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(flight.do, "key", failing)
+        started.wait()
+        others = [pool.submit(flight.do, "key", failing) for _ in range(3)]
+        for future in [first] + others:
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+
+def test_async_single_flight_survives_a_cancelled_caller():
+    async def run():
+        flight, calls = AsyncSingleFlight(), []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", slow))
+        second = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, len(calls), flight.shared
+
+    assert asyncio.run(run()) == ("done", 1, 1)
+
+
+def slow_job(api, delay=0.2):
+    def get_job(request):
+        time.sleep(delay)
+        return {"message": "ok", "detail": {"job": {"job_id": "job-1"}}}
+
+    api.route("GET", "/job/*", get_job)
+
+
+@pytest.mark.parametrize("coalesce, requests", [(False, 4), (True, 1)])
+def test_client_coalesces_only_when_asked(api, coalesce, requests):
+    slow_job(api)
+    with ZPoolsClient(api_url=api.url, pat="pat-token", coalesce_requests=coalesce) as client:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(pool.map(lambda _: client.get_job("job-1"), range(4)))
+    assert len(api.calls("/job/job-1")) == requests
+    # Without coalescing each caller owns its Response
+    assert len({id(response) for response in responses}) == (1 if coalesce else 4)
+
+
+def test_async_client_coalesces_only_when_asked(api):
+    slow_job(api)
+
+    async def run(coalesce):
+        async with AsyncZPoolsClient(api_url=api.url, pat="pat-token", coalesce_requests=coalesce) as client:
+            await asyncio.gather(*(client.get_job("job-1") for _ in range(4)))
+
+    asyncio.run(run(False))
+    assert len(api.calls("/job/job-1")) == 4
+    asyncio.run(run(True))
+    assert len(api.calls("/job/job-1")) == 5
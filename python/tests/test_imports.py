@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def loaded_modules(code: str) -> set:
+    """Modules in sys.modules after running code in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    script = code + "\nimport sys; print('\\n'.join(sys.modules))"
+    return set(subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True).stdout.split())
+
+
+def test_import_zpools_is_lazy():
+    modules = loaded_modules("import zpools")
+    assert not {"httpx", "sqlite3", "zpools.client", "zpools.async_client", "zpools.store"} & modules
+
+
+def test_names_are_imported_on_first_access():
+    modules = loaded_modules("from zpools import ZPoolsClient")
+    assert "zpools.client" in modules
+    assert not {"sqlite3", "zpools.store", "zpools.async_client"} & modules
+
+
+def test_public_names():
+    import zpools
+
+    assert zpools.JobIndex.__module__ == "zpools.store"
+    assert set(zpools.__all__) <= set(dir(zpools))
+    with pytest.raises(AttributeError):
+        zpools.NoSuchThing
+
+
+def test_cli_does_not_load_the_stores_up_front():
+    modules = loaded_modules("import zpools_cli.main")
+    assert not {"sqlite3", "zpools.store", "zpools.async_client"} & modules
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import typer
+
+from stub_api import BASE_TIME, make_job, minutes, parse_time, serve_jobs
+from zpools import AsyncZPoolsClient, ZPoolsClient
+from zpools_cli.job_helpers import RESUME_LOOKBACK, find_and_resume_job
+
+
+def history(burst: int, spread: int = 150):
+    """Jobs one minute apart, with a burst of jobs sharing one created_at in the middle."""
+    jobs = [make_job(index, BASE_TIME + minutes(index)) for index in range(spread)]
+    burst_time = BASE_TIME + minutes(spread // 2) + minutes(1) / 2
+    jobs += [make_job(spread + index, burst_time) for index in range(burst)]
+    return jobs
+
+
+def expected_order(jobs, sort):
+    return [job["job_id"] for job in sorted(jobs, key=lambda job: (job["created_at"], job["job_id"]), reverse=sort == "desc")]
+
+
+@pytest.fixture
+def client(api):
+    with ZPoolsClient(api_url=api.url, pat="pat-token") as client:
+        yield client
+
+
+@pytest.mark.parametrize("inclusive", [True, False])
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_iter_jobs_pages_through_history(api, client, sort, inclusive):
+    jobs = history(burst=40)
+    serve_jobs(api, jobs, inclusive=inclusive)
+    ids = [job.job_id for job in client.iter_jobs(sort=sort, page_size=50)]
+    assert sorted(ids) == sorted(job["job_id"] for job in jobs)
+    assert len(ids) == len(set(ids))
+    # Jobs are yielded in created_at order (ties may come in any order)
+    created = [job.created_at for job in client.iter_jobs(sort=sort, page_size=50)]
+    assert created == sorted(created, reverse=sort == "desc")
+
+
+@pytest.mark.parametrize("inclusive", [True, False])
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+@pytest.mark.parametrize("page_size", [10, 100])
+def test_iter_jobs_pages_past_a_burst_larger_than_the_page(api, client, sort, inclusive, page_size):
+    jobs = history(burst=page_size * 3 + 7)
+    serve_jobs(api, jobs, inclusive=inclusive)
+    ids = [job.job_id for job in client.iter_jobs(sort=sort, page_size=page_size)]
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(job["job_id"] for job in jobs)
+
+
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_iter_jobs_raises_on_a_burst_larger_than_the_api_limit(api, client, sort):
+    serve_jobs(api, history(burst=1200))
+    with pytest.raises(RuntimeError, match="share created_at"):
+        list(client.iter_jobs(sort=sort, page_size=100))
+
+
+def test_iter_jobs_raises_when_the_cursor_is_ignored(api, client):
+    jobs = [make_job(index, BASE_TIME + minutes(index)) for index in range(30)]
+    api.route("GET", "/jobs", lambda request: {"message": "ok", "detail": {"jobs": jobs[:10]}})
+    with pytest.raises(RuntimeError, match="cannot advance"):
+        list(client.iter_jobs(page_size=10))
+
+
+def test_iter_jobs_with_prefetch(api, client):
+    jobs = history(burst=25)
+    serve_jobs(api, jobs)
+    ids = [job.job_id for job in client.iter_jobs(sort="desc", page_size=10, prefetch=True)]
+    assert ids[:1] == expected_order(jobs, "desc")[:1]
+    assert sorted(ids) == sorted(job["job_id"] for job in jobs)
+
+
+def test_async_iter_jobs_pages_past_a_burst(api):
+    jobs = history(burst=57)
+    serve_jobs(api, jobs, inclusive=False)
+
+    async def collect():
+        async with AsyncZPoolsClient(api_url=api.url, pat="pat-token") as client:
+            return [job.job_id async for job in client.iter_jobs(sort="asc", page_size=20, prefetch=True)]
+
+    ids = asyncio.run(collect())
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(job["job_id"] for job in jobs)
+
+
+def resume_history(create_at: int, count: int = 300):
+    """Scrub jobs an hour apart back from now, with the job at index create_at a failed zpool_create."""
+    now = datetime.now(timezone.utc)
+    return [
+        make_job(index, now - timedelta(hours=index), *(("zpool_create", "failed") if index == create_at else ()))
+        for index in range(count)
+    ]
+
+
+def test_resume_without_an_index_finds_an_old_job_among_the_newest(api, client):
+    # Eight days old, but among the newest 100 jobs
+    serve_jobs(api, [make_job(0, datetime.now(timezone.utc) - timedelta(days=8), "zpool_create", "failed")])
+    job = find_and_resume_job(client, job_type="zpool_create", operation_name="ZPool creation")
+    assert job["job_id"] == "job-00000"
+    assert len(api.calls("/jobs")) == 1
+
+
+def test_resume_without_an_index_searches_older_pages_within_the_lookback(api, client):
+    serve_jobs(api, resume_history(create_at=24 * 6))
+    job = find_and_resume_job(client, job_type="zpool_create", operation_name="ZPool creation")
+    assert job["job_id"] == f"job-{24 * 6:05d}"
+
+
+def test_resume_without_an_index_stops_at_the_lookback(api, client):
+    serve_jobs(api, resume_history(create_at=24 * 8, count=24 * 30))
+    with pytest.raises(typer.Exit):
+        find_and_resume_job(client, job_type="zpool_create", operation_name="ZPool creation")
+    requests = api.calls("/jobs")
+    assert "after" not in requests[0].query
+    after = parse_time(requests[-1].query["after"])
+    assert abs(datetime.now(timezone.utc) - RESUME_LOOKBACK - after).total_seconds() < 60
+    # The newest page, then the rest of the lookback (7 days of hourly jobs)
+    assert len(requests) == 2
@@ -0,0 +1,87 @@
+import asyncio
+import random
+
+import pytest
+
+from stub_api import BASE_TIME, iso, make_job, minutes, serve_jobs
+from zpools import AsyncZPoolsClient, ZPoolsClient
+from zpools.api.jobs import _JobWindows
+
+
+def history(burst: int, spread: int = 300, burst_at: int = 150):
+    jobs = [make_job(index, BASE_TIME + minutes(index)) for index in range(spread)]
+    jobs += [make_job(spread + index, BASE_TIME + minutes(burst_at)) for index in range(burst)]
+    return jobs
+
+
+def all_ids(jobs):
+    return sorted(job["job_id"] for job in jobs)
+
+
+@pytest.fixture
+def client(api):
+    with ZPoolsClient(api_url=api.url, pat="pat-token") as client:
+        yield client
+
+
+@pytest.mark.parametrize("inclusive", [True, False])
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_fetch_jobs_returns_each_job_once_in_order(api, client, sort, inclusive):
+    rng = random.Random(7)
+    jobs = [make_job(index, BASE_TIME + minutes(rng.randrange(10_000))) for index in range(700)]
+    serve_jobs(api, jobs, inclusive=inclusive)
+    fetched = list(client.fetch_jobs(sort=sort, page_size=50, partitions=4))
+    ids = [job.job_id for job in fetched]
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == all_ids(jobs)
+    created = [job.created_at for job in fetched]
+    assert created == sorted(created, reverse=sort == "desc")
+
+
+@pytest.mark.parametrize("inclusive", [True, False])
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+@pytest.mark.parametrize("burst_at", [0, 150, 299])
+def test_fetch_jobs_returns_a_burst_larger_than_the_page(api, client, sort, inclusive, burst_at):
+    jobs = history(burst=275, burst_at=burst_at)
+    serve_jobs(api, jobs, inclusive=inclusive)
+    ids = [job.job_id for job in client.fetch_jobs(sort=sort, page_size=100, partitions=3)]
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == all_ids(jobs)
+
+
+def test_fetch_jobs_within_bounds(api, client):
+    jobs = history(burst=120)
+    serve_jobs(api, jobs)
+    after, before = BASE_TIME + minutes(100), BASE_TIME + minutes(200)
+    ids = [job.job_id for job in client.fetch_jobs(after=iso(after), before=iso(before), page_size=50)]
+    expected = [job for job in jobs if after.isoformat() <= job["created_at"].replace("Z", "+00:00") <= before.isoformat()]
+    assert sorted(ids) == all_ids(expected)
+
+
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_fetch_jobs_raises_on_a_burst_larger_than_the_api_limit(api, client, sort):
+    serve_jobs(api, history(burst=1100))
+    with pytest.raises(RuntimeError, match="share created_at"):
+        list(client.fetch_jobs(sort=sort, page_size=100))
+
+
+def test_windows_check_that_every_window_was_released():
+    windows = _JobWindows(None, None, "asc", 10)
+    windows._partitions = 2
+    windows._pending = {0: 0, 1: 1}
+    windows._jobs = {1: []}
+    with pytest.raises(RuntimeError, match="not all windows"):
+        windows.check_done()
+
+
+def test_async_fetch_jobs_returns_a_burst(api):
+    jobs = history(burst=333)
+    serve_jobs(api, jobs, inclusive=False)
+
+    async def collect():
+        async with AsyncZPoolsClient(api_url=api.url, pat="pat-token") as client:
+            return [job.job_id async for job in client.fetch_jobs(sort="desc", page_size=100, partitions=4)]
+
+    ids = asyncio.run(collect())
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == all_ids(jobs)
@@ -0,0 +1,105 @@
+import asyncio
+
+import httpx
+import pytest
+
+from zpools import RetryPolicy, RetryStats, ZPoolsClient
+from zpools.retry import AsyncRetryTransport, RetryTransport, _parse_retry_after
+
+
+class Flaky(httpx.BaseTransport):
+    """Fails the first requests with the given errors or statuses, then answers 200."""
+
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.requests = 0
+
+    def handle_request(self, request):
+        self.requests += 1
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure, headers={"Retry-After": "0"}, request=request)
+        return httpx.Response(200, json={"message": "ok"}, request=request)
+
+
+class AsyncFlaky(httpx.AsyncBaseTransport):
+    def __init__(self, *failures):
+        self._sync = Flaky(*failures)
+
+    async def handle_async_request(self, request):
+        return self._sync.handle_request(request)
+
+
+FAST = RetryPolicy(max_retries=3, backoff_factor=0)
+
+
+def send(transport, method="GET"):
+    with httpx.Client(transport=transport, base_url="http://api.test") as client:
+        return client.request(method, "/jobs")
+
+
+def test_client_does_not_retry_by_default(api):
+    api.route("GET", "/zpools", lambda request: (503, {"message": "unavailable"}))
+    with ZPoolsClient(api_url=api.url, pat="pat-token") as client:
+        assert client.list_zpools().status_code == 503
+    assert len(api.calls("/zpools")) == 1
+    assert client.retry_stats.as_dict()["requests"] == 0
+
+
+def test_client_retries_with_a_policy(api):
+    statuses = [503, 502]
+    api.route("GET", "/zpools", lambda request: (statuses.pop(0), {"message": "busy"}) if statuses else {"detail": {"zpools": {}}})
+    with ZPoolsClient(api_url=api.url, pat="pat-token", retry_policy=FAST) as client:
+        assert client.list_zpools().status_code == 200
+        assert client.retry_stats.as_dict() == {"requests": 1, "retries": 2, "exhausted": 0, "retries_per_request": {2: 1}}
+
+
+def test_retryable_statuses_only_for_idempotent_methods():
+    flaky = Flaky(503)
+    assert send(RetryTransport(flaky, FAST), "POST").status_code == 503
+    assert flaky.requests == 1
+    flaky = Flaky(503, 429)
+    assert send(RetryTransport(flaky, FAST), "DELETE").status_code == 200
+    assert flaky.requests == 3
+
+
+def test_connection_errors_before_sending_are_retried_for_any_method():
+    flaky = Flaky(httpx.ConnectError("refused"))
+    assert send(RetryTransport(flaky, FAST), "POST").status_code == 200
+    # A read error may come after the server acted on the request
+    flaky = Flaky(httpx.ReadError("reset"))
+    with pytest.raises(httpx.ReadError):
+        send(RetryTransport(flaky, FAST), "POST")
+    assert send(RetryTransport(Flaky(httpx.ReadError("reset")), FAST), "GET").status_code == 200
+
+
+def test_exhausted_retries_are_counted():
+    stats = RetryStats()
+    assert send(RetryTransport(Flaky(503, 503, 503, 503), FAST, stats)).status_code == 503
+    with pytest.raises(httpx.ConnectError):
+        send(RetryTransport(Flaky(*[httpx.ConnectError("refused")] * 4), FAST, stats))
+    assert stats.as_dict() == {"requests": 2, "retries": 6, "exhausted": 2, "retries_per_request": {3: 2}}
+
+
+def test_backoff_honours_retry_after_up_to_the_cap():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5)
+    request = httpx.Request("GET", "http://api.test/jobs")
+    assert policy.backoff(0, httpx.Response(429, headers={"Retry-After": "2"}, request=request)) == 2
+    assert policy.backoff(0, httpx.Response(429, headers={"Retry-After": "120"}, request=request)) == 5
+    assert all(0 <= policy.backoff(attempt) <= min(5, 2 ** attempt) for attempt in range(6) for _ in range(20))
+    assert not RetryPolicy(respect_retry_after=False, backoff_factor=0).backoff(0, httpx.Response(429, headers={"Retry-After": "9"}))
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_retry_after("soon") is None
+
+
+def test_async_transport_retries():
+    async def run():
+        stats = RetryStats()
+        transport = AsyncRetryTransport(AsyncFlaky(httpx.ConnectError("refused"), 500), FAST, stats)
+        async with httpx.AsyncClient(transport=transport, base_url="http://api.test") as client:
+            response = await client.get("/jobs")
+        return response.status_code, stats.as_dict()["retries"]
+
+    assert asyncio.run(run()) == (200, 2)
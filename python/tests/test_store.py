@@ -0,0 +1,207 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from stub_api import BASE_TIME, charge, hourly, iso, make_job, minutes, parse_time, serve_jobs, serve_ledger, zpcli
+from zpools import JobIndex, LedgerStore, ZPoolsClient
+
+
+@pytest.fixture
+def client(api):
+    with ZPoolsClient(api_url=api.url, pat="pat-token") as client:
+        yield client
+
+
+def serve_job_details(api, jobs):
+    by_id = {job["job_id"]: job for job in jobs}
+
+    def get_job(request):
+        job = by_id.get(request.path.rsplit("/", 1)[-1])
+        if job is None:
+            return 404, {"message": "Job not found"}
+        return {"message": "ok", "detail": {"job": job}}
+
+    api.route("GET", "/job/*", get_job)
+
+
+def set_state(job, state):
+    job["status"] = "completed" if state == "succeeded" else state
+    job["current_status"] = dict(job["current_status"], state=state)
+
+
+def list_after(api):
+    """The after= of each list_jobs request since the last call."""
+    with api.lock:
+        listed = [request for request in api.requests if request.path == "/jobs"]
+        api.requests[:] = [request for request in api.requests if request.path != "/jobs"]
+    return [parse_time(request.query["after"]) for request in listed if "after" in request.query]
+
+
+def test_job_index_sync_is_incremental(api, client, tmp_path):
+    jobs = [make_job(index, BASE_TIME + minutes(index)) for index in range(50)]
+    set_state(jobs[40], "running")
+    serve_jobs(api, jobs)
+    serve_job_details(api, jobs)
+
+    with JobIndex(tmp_path / "jobs.sqlite3") as index:
+        assert index.synced_at is None
+        assert index.sync(client) == 50
+        assert len(index) == 50 and index.synced_at is not None
+        list_after(api)
+
+        # The next sync pages from the oldest running job, picking up its new state and new jobs
+        set_state(jobs[40], "failed")
+        jobs.append(make_job(50, BASE_TIME + minutes(50), job_type="zpool_create", zpool_id="zp-2"))
+        assert index.sync(client) == 11
+        assert list_after(api) == [BASE_TIME + minutes(40) - timedelta(microseconds=1)]
+        assert index.jobs(state="failed")[0].job_id == "job-00040"
+        assert index.latest(operation="zpool_create").zpool_id == "zp-2"
+
+        # With every job finished, it only asks for jobs from the newest one
+        index.sync(client)
+        assert list_after(api) == [BASE_TIME + minutes(50) - timedelta(microseconds=1)]
+
+
+def test_job_index_stuck_job_does_not_pin_the_cursor(api, client, tmp_path):
+    jobs = [make_job(index, BASE_TIME + timedelta(hours=index)) for index in range(72)]
+    set_state(jobs[0], "running")
+    serve_jobs(api, jobs)
+    serve_job_details(api, jobs)
+
+    with JobIndex(tmp_path / "jobs.sqlite3") as index:
+        index.sync(client)
+        list_after(api)
+        index.sync(client)
+        # The cursor is the newest job, not the job stuck since the start
+        assert list_after(api) == [BASE_TIME + timedelta(hours=71) - timedelta(microseconds=1)]
+        # The stuck job is refreshed on its own, and drops out once it finishes
+        assert len(api.calls("/job/job-00000")) == 1
+        set_state(jobs[0], "failed")
+        index.sync(client)
+        assert index.jobs(state="failed")[0].job_id == "job-00000"
+        index.sync(client)
+        assert len(api.calls("/job/job-00000")) == 2
+
+
+def test_job_index_backs_off_a_stale_job_that_cannot_be_fetched(api, client, tmp_path):
+    jobs = [make_job(index, BASE_TIME + timedelta(hours=index)) for index in range(30)]
+    set_state(jobs[0], "pending")
+    serve_jobs(api, jobs)
+    serve_job_details(api, [])
+
+    with JobIndex(tmp_path / "jobs.sqlite3") as index:
+        index.sync(client)
+        index.sync(client, stale_after=timedelta(hours=2))
+        assert parse_time(index.jobs(state="pending")[0].created_at) == BASE_TIME
+        assert len(api.calls("/job/job-00000")) == 1
+
+        # Not asked for again until retry_after has passed
+        for _ in range(3):
+            index.sync(client, stale_after=timedelta(hours=2))
+        assert len(api.calls("/job/job-00000")) == 1
+        index.sync(client, stale_after=timedelta(hours=2), retry_after=timedelta(0))
+        assert len(api.calls("/job/job-00000")) == 2
+        assert index.jobs(state="pending")[0].job_id == "job-00000"
+
+
+def test_job_index_queries(api, client, tmp_path):
+    jobs = [make_job(index, BASE_TIME + minutes(index), zpool_id=f"zp-{index % 3}") for index in range(30)]
+    serve_jobs(api, jobs)
+
+    with JobIndex(tmp_path / "jobs.sqlite3") as index:
+        index.sync(client)
+        assert [job.job_id for job in index.jobs(zpool_id="zp-1", limit=2)] == ["job-00028", "job-00025"]
+        assert [job.job_id for job in index.jobs(after=iso(BASE_TIME + minutes(27)), sort="asc")] == ["job-00028", "job-00029"]
+        assert index.job_ids("job-0001", limit=3) == ["job-00019", "job-00018", "job-00017"]
+        with pytest.raises(ValueError):
+            index.jobs(sort="sideways")
+
+
+# Ledger store
+
+@pytest.fixture
+def ledger():
+    entries = [charge(0, 25.0, source="claim")]
+    entries += [hourly(hour, "zp-a", 125, 0.0125) for hour in range(0, 24 * 10)]
+    # Resized: a new rate period
+    entries += [hourly(hour, "zp-a", 250, 0.025) for hour in range(24 * 10, 24 * 15)]
+    # A gap of two days: two periods at the same rate
+    entries += [hourly(hour, "zp-b", 125, 0.004, "sc1") for hour in list(range(24, 24 * 5)) + list(range(24 * 7, 24 * 15))]
+    entries += [charge(day, -0.5) for day in (3, 12)]
+    return entries
+
+
+def test_ledger_store_sync_is_incremental(api, client, tmp_path, ledger):
+    serve_ledger(api, ledger)
+    with LedgerStore(tmp_path / "ledger.sqlite3") as store:
+        assert store.sync(client) == len(ledger)
+        assert len(store) == len(ledger)
+
+        ledger.extend(hourly(hour, "zp-a", 250, 0.025) for hour in range(24 * 15, 24 * 16))
+        api.requests.clear()
+        store.sync(client)
+        # Only the days from the newest stored event (day 14) less two days of lookback are fetched again
+        assert [request.query.get("since") for request in api.calls("/billing/ledger")] == ["2025-03-13"]
+        assert len(store) == len(ledger)
+
+        # Fetching the same days again replaces entries instead of duplicating them
+        store.sync(client, full=True)
+        assert len(store) == len(ledger)
+
+
+def test_ledger_store_summary(api, client, tmp_path, ledger):
+    serve_ledger(api, ledger)
+    with LedgerStore(tmp_path / "ledger.sqlite3") as store:
+        store.sync(client)
+        api.requests.clear()
+        summary = store.summary()
+        assert not api.requests
+        periods = [(row["zpool_id"], row["size_gb"], row["hours"]) for row in summary["storage_charges"]]
+        assert periods == [("zp-a", 125, 240), ("zp-b", 125, 96), ("zp-b", 125, 192), ("zp-a", 250, 120)]
+        assert summary["totals"]["credits_applied"] == 25.0
+        assert summary["totals"]["time_of_use_charges"] == pytest.approx(1.0)
+        expected_storage = 240 * 0.0125 + 120 * 0.025 + 288 * 0.004
+        assert summary["totals"]["storage_charges"] == pytest.approx(expected_storage)
+        assert summary["totals"]["ending_balance"] == pytest.approx(25.0 - 1.0 - expected_storage)
+
+        # A date range cuts the periods that cross it
+        cut = store.summary(since="2025-03-05", until="2025-03-11")
+        assert cut["period"] == {"from_date": "2025-03-05", "to_date": "2025-03-11"}
+        assert [row["hours"] for row in cut["storage_charges"] if row["zpool_id"] == "zp-a"] == [24 * 6, 24]
+
+
+def test_cli_syncs_the_ledger_store_once_it_is_stale(api, tmp_path, ledger):
+    serve_ledger(api, ledger)
+
+    def ledger_requests(*args, **settings):
+        before = len(api.calls("/billing/ledger"))
+        result = zpcli(api, tmp_path, "billing", "ledger", "--json", *args, **settings)
+        assert result.exit_code == 0, result.output
+        return len(api.calls("/billing/ledger")) - before
+
+    assert ledger_requests() > 0
+    # Synced less than an hour ago (the default without ZPOOL_CACHE_MAX_AGE)
+    assert ledger_requests() == 0
+    assert ledger_requests("--refresh") > 0
+    assert ledger_requests("--max-age", "0") > 0
+    assert ledger_requests(ZPOOL_CACHE_MAX_AGE="0") > 0
+    assert ledger_requests(ZPOOL_CACHE_MAX_AGE="600") == 0
+
+
+def test_stores_rebuild_only_on_their_own_schema_version(api, client, tmp_path, ledger):
+    serve_ledger(api, ledger)
+    serve_jobs(api, [make_job(index, BASE_TIME + minutes(index)) for index in range(5)])
+    with JobIndex(tmp_path / "jobs.sqlite3") as index, LedgerStore(tmp_path / "ledger.sqlite3") as store:
+        index.sync(client)
+        store.sync(client)
+
+    # Reopening keeps both
+    with JobIndex(tmp_path / "jobs.sqlite3") as index, LedgerStore(tmp_path / "ledger.sqlite3") as store:
+        assert len(index) == 5 and len(store) == len(ledger)
+
+    # A ledger schema change rebuilds the ledger only
+    with sqlite3.connect(str(tmp_path / "ledger.sqlite3")) as conn:
+        conn.execute(f"PRAGMA user_version = {LedgerStore._version - 1}")
+    with JobIndex(tmp_path / "jobs.sqlite3") as index, LedgerStore(tmp_path / "ledger.sqlite3") as store:
+        assert len(index) == 5 and len(store) == 0 and store.synced_at is None
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+from zpools.stream import JSONArrayParser, aiter_json_array, iter_json_array
+
+DOCUMENT = {
+    "message": "ok, [not] {an} array",
+    "meta": {"items": [1, 2], "nested": {"detail": "x"}},
+    "detail": {
+        "count": 4.5e3,
+        "items": [
+            {"amount_usd": -0.0125, "note": "zp-1 été \U0001f4be", "tags": ["a", "]"]},
+            {"amount_usd": 12345678901234567890, "note": "quote \" and \\ backslash"},
+            [],
+            None,
+            True,
+            -1.5e-7,
+            "text",
+        ],
+        "after": {"ignored": [1, 2, 3]},
+    },
+}
+ITEMS = DOCUMENT["detail"]["items"]
+BODY = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+
+def chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_elements_match_json_loads_at_any_chunk_size(size):
+    parser = JSONArrayParser(("detail", "items"))
+    items = []
+    for chunk in chunks(BODY, size):
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    assert items == ITEMS
+    assert parser.done
+
+
+def test_elements_are_returned_as_soon_as_complete():
+    parser = JSONArrayParser(("items",))
+    assert parser.feed(b'{"items": [{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(b": 2}, 3") == [{"b": 2}]
+    # 3 may be the start of 35
+    assert parser.feed(b"5") == []
+    assert parser.feed(b"]") == [35]
+    assert parser.done
+
+
+def test_empty_array():
+    assert list(iter_json_array([b'{"detail": {"items": []}}'], ("detail", "items"))) == []
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        (b'{"detail": {"other": []}}', "no key 'items'"),
+        (b'{"detail": {"items": {"a": 1}}}', "Expected '\\['"),
+        (b'{"detail": {"items": [1 2]}}', "Expected ',' or '\\]'"),
+        (b'["detail"]', "Expected '\\{'"),
+    ],
+)
+def test_invalid_documents_raise(body, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array([body], ("detail", "items")))
+
+
+def test_truncated_body_raises_on_close():
+    parser = JSONArrayParser(("items",))
+    assert parser.feed(b'{"items": [1, {"a": ') == [1]
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_iter_stops_reading_once_the_array_is_complete():
+    consumed = []
+
+    def body():
+        for chunk in (b'{"items": [1, 2]', b', "tail": ', b'"unread"}'):
+            consumed.append(chunk)
+            yield chunk
+        raise AssertionError("read past the array")
+
+    assert list(iter_json_array(body(), ("items",))) == [1, 2]
+    assert len(consumed) == 1
+
+
+def test_aiter_matches_iter():
+    async def body():
+        for chunk in chunks(BODY, 5):
+            yield chunk
+
+    async def collect():
+        return [item async for item in aiter_json_array(body(), ("detail", "items"))]
+
+    assert asyncio.run(collect()) == ITEMS
@@ -0,0 +1,52 @@
+import pytest
+
+from stub_api import BASE_TIME, charge, hourly, make_job, minutes, serve_jobs, serve_ledger
+from zpools import JobIndex, LedgerStore, ZPoolsClient
+from zpools.domain import job_from_response, jobs_from_response
+
+pytest.importorskip("msgspec")
+
+
+@pytest.fixture(params=["models", "raw", "structs"])
+def client(request, api):
+    with ZPoolsClient(api_url=api.url, pat="pat-token", raw=request.param == "raw", structs=request.param == "structs") as client:
+        yield client
+
+
+def test_list_jobs_keeps_undocumented_job_fields(api, client):
+    serve_jobs(api, [make_job(1, BASE_TIME, job_type="zpool_create", state="running", zpool_id="zp-9")])
+    [job] = jobs_from_response(client.list_jobs())
+    assert (job.job_id, job.operation, job.state, job.zpool_id) == ("job-00001", "zpool_create", "running", "zp-9")
+    assert job.message == "job 1"
+
+
+def test_get_job_returns_the_job_object(api, client):
+    listed = make_job(2, BASE_TIME, job_type="zpool_scrub", state="failed")
+    api.route("GET", "/job/*", lambda request: {"message": "ok", "detail": {"job": listed, "job_id": "job-00002"}})
+    job = job_from_response(client.get_job("job-00002"))
+    assert job is not None
+    assert (job.job_id, job.operation, job.state, job.zpool_id) == ("job-00002", "zpool_scrub", "failed", "zp-1")
+
+
+def test_iter_jobs_and_job_index_keep_type_and_state(api, client, tmp_path):
+    jobs = [make_job(index, BASE_TIME + minutes(index), job_type="zpool_create", state="running") for index in range(15)]
+    serve_jobs(api, jobs)
+    assert {(job.operation, job.state) for job in client.iter_jobs(page_size=10)} == {("zpool_create", "running")}
+    with JobIndex(tmp_path / "jobs.sqlite3") as index:
+        index.sync(client)
+        assert len(index.jobs(operation="zpool_create", state="running")) == 15
+
+
+def test_ledger_store_keeps_rate_periods_apart(api, client, tmp_path):
+    # Two zpools billed at the same hourly rate: only zpool_id, volume_type and size_gb tell them apart
+    ledger = [charge(0, 10.0, source="claim")]
+    ledger += [hourly(hour, "zp-a", 125, 0.0125) for hour in range(48)]
+    ledger += [hourly(hour, "zp-b", 250, 0.0125, "sc1") for hour in range(24)]
+    serve_ledger(api, ledger)
+    with LedgerStore(tmp_path / "ledger.sqlite3") as store:
+        store.sync(client)
+        periods = [
+            (row["zpool_id"], row["volume_type"], row["size_gb"], row["hours"])
+            for row in store.summary()["storage_charges"]
+        ]
+    assert sorted(periods) == [("zp-a", "gp3", 125, 48), ("zp-b", "sc1", 250, 24)]
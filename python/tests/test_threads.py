@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from stub_api import TokenServer
+from zpools import ZPoolsClient
+from zpools.auth import AuthManager
+
+
+def test_concurrent_callers_share_one_login(api):
+    server = TokenServer(api, login_delay=0.2)
+    auth = AuthManager(api_url=api.url, username="alice", password="secret")
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        tokens = list(pool.map(lambda _: auth.get_token(), range(32)))
+    assert server.logins == 1
+    assert set(tokens) == {"token-0"}
+    auth.close()
+
+
+def test_shared_client_logs_in_once(api):
+    server = TokenServer(api, login_delay=0.2)
+    with ZPoolsClient(api_url=api.url, username="alice", password="secret", max_connections=16) as client:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            statuses = list(pool.map(lambda i: client.get_job(f"job-{i}").status_code, range(64)))
+    assert statuses == [200] * 64
+    assert server.logins == 1
+
+
+def test_shared_client_reauthenticates_once_per_revocation(api):
+    server = TokenServer(api, login_delay=0.05, rotate_every=100)
+    # One connection per thread: the sync httpcore pool is not reliable when threads queue for a connection
+    with ZPoolsClient(api_url=api.url, username="alice", password="secret", max_connections=16) as client:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            statuses = list(pool.map(lambda i: client.get_job(f"job-{i}").status_code, range(400)))
+    assert statuses == [200] * 400
+    revocations = 400 // 100 - 1
+    # Requests that raced a revocation may trigger one extra login each time, never one per thread
+    assert server.logins <= 1 + 2 * revocations